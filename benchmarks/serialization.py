@@ -0,0 +1,98 @@
+"""
+Serialization cost of one 100-item todo page, before and after the fast path.
+
+Usage: python -m benchmarks.serialization [--items 100] [--rounds 2000]
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.dto import ToDoDTO
+from src.routes.responses import make_todo_page_response
+from src.schemas import SToDo, SToDoList
+
+
+def make_page(items: int) -> list[ToDoDTO]:
+    now = datetime.now(timezone.utc)
+    return [
+        ToDoDTO(
+            id=i,
+            title=f"Todo {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            created_at=now,
+            updated_at=now,
+            user_id=1,
+            tags=["work", "home"],
+        )
+        for i in range(items)
+    ]
+
+
+async def before(todos: list[ToDoDTO], response_class=JSONResponse) -> bytes:
+    # What the handlers did: dump every item, validate the page, let FastAPI
+    # validate the return value again and encode it with the response class.
+    field = create_model_field(name="Response", type_=SToDoList, mode="serialization")
+    page = SToDoList(
+        data=[SToDo.model_dump(todo) for todo in todos],
+        offset=0,
+        limit=len(todos),
+        total=len(todos),
+    )
+    content = await serialize_response(field=field, response_content=page)
+    return response_class(content).body
+
+
+async def after(todos: list[ToDoDTO]) -> bytes:
+    response = make_todo_page_response(
+        SToDoList,
+        "data",
+        todos,
+        offset=0,
+        limit=len(todos),
+        total=len(todos),
+        next_cursor=None,
+    )
+    return response.body
+
+
+async def measure(func, todos: list[ToDoDTO], rounds: int, **kwargs) -> float:
+    await func(todos, **kwargs)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await func(todos, **kwargs)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    todos = make_page(args.items)
+    assert json.loads(await before(todos)) == json.loads(await after(todos))
+    results = {
+        "before (validate + json)": await measure(before, todos, args.rounds),
+        "after (DTOs, model_dump_json)": await measure(after, todos, args.rounds),
+    }
+    try:
+        import orjson  # noqa: F401
+
+        results["before (validate + orjson)"] = await measure(
+            before, todos, args.rounds, response_class=ORJSONResponse
+        )
+    except ImportError:
+        pass
+
+    for name, microseconds in results.items():
+        print(f"{name:<28} {microseconds:>9.1f} us per {args.items}-item page")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,11 +1,44 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 
-from src.routes import router_todo, auth_router
+from src.config.base_config import get_internal_endpoints_enabled, get_token_reaper_config
+from src.routes import router_todo, auth_router, internal_router, well_known_router
+from src.routes.responses import get_default_response_class
+from src.services.auth_service import password_hasher
+from src.services.jwt_keys import get_key_set
+from src.services.token_reaper import run_token_reaper
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the signing keys once, a broken key set fails the startup
+    get_key_set()
+
+    reaper_config = get_token_reaper_config()
+    reaper = None
+    if reaper_config["enabled"]:
+        reaper = asyncio.create_task(
+            run_token_reaper(reaper_config["interval"], reaper_config["batch_size"])
+        )
+
+    yield
+
+    if reaper is not None:
+        reaper.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper
+    password_hasher.shutdown()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=get_default_response_class())
 
 app.include_router(router_todo)
 app.include_router(auth_router)
+if get_internal_endpoints_enabled():
+    app.include_router(internal_router)
+app.include_router(well_known_router)
 
 
 @app.get("/hello")
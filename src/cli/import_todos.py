@@ -0,0 +1,38 @@
+"""
+Import todos for a user from an NDJSON or CSV file.
+
+Usage: python -m src.cli.import_todos --user-id 1 --format csv todos.csv
+"""
+import argparse
+import asyncio
+
+from src.db import session_scope
+from src.services import ToDoService
+
+from src.config.logging_confing import logging  # noqa
+
+
+async def import_todos(user_id: int, path: str, format: str) -> None:
+    with open(path, encoding="utf-8", newline="") as lines:
+        async with session_scope() as session:
+            result = await ToDoService.import_todos(
+                session=session, user_id=user_id, lines=lines, format=format
+            )
+
+    for error in result.errors:
+        logging.warning("Line %s: %s", error.line, error.error)
+    logging.info("Imported %s todos, %s rows failed", result.imported, result.failed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import todos for a user")
+    parser.add_argument("path", help="NDJSON or CSV file")
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    args = parser.parse_args()
+
+    asyncio.run(import_todos(args.user_id, args.path, args.format))
+
+
+if __name__ == "__main__":
+    main()
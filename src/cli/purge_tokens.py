@@ -0,0 +1,29 @@
+"""
+Delete expired refresh tokens.
+
+Usage: python -m src.cli.purge_tokens [--batch-size 1000]
+"""
+import argparse
+import asyncio
+
+from src.config.base_config import get_token_reaper_config
+from src.services.token_reaper import purge_expired_tokens
+
+from src.config.logging_confing import logging  # noqa
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Delete expired refresh tokens")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=get_token_reaper_config()["batch_size"],
+        help="tokens deleted per transaction",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(purge_expired_tokens(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
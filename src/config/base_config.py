@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import SecretStr, ConfigDict, Field
 from pydantic_settings import BaseSettings
@@ -16,6 +16,59 @@ class Settings(BaseSettings):
     AUTH_METHOD: Literal["header", "cookie"]
     MAX_ACTIVE_SESSIONS: int = Field(ge=1)
 
+    # Connection pool
+    DB_POOL_SIZE: int = Field(5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(10, ge=0)
+    DB_POOL_TIMEOUT: float = Field(30.0, gt=0)
+    DB_POOL_RECYCLE: int = Field(1800, ge=-1)  # seconds, -1 disables recycling
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT: int = Field(0, ge=0)  # milliseconds, 0 disables
+    DB_PGBOUNCER_MODE: bool = False  # NullPool + no prepared statement cache
+
+    # SQL query logging
+    DB_QUERY_LOG_ENABLED: bool = False
+    DB_QUERY_LOG_SAMPLE_RATE: float = Field(1.0, ge=0, le=1)
+    DB_SLOW_QUERY_MS: float = Field(0, ge=0)  # 0 disables the slow query log
+
+    # How list endpoints compute "total"
+    TODOS_TOTAL_STRATEGY: Literal["exact", "counter", "estimate"] = "exact"
+
+    # Maximum number of items in one /todos/batch request
+    TODOS_MAX_BATCH_SIZE: int = Field(1000, ge=1)
+
+    # In-process cache of authenticated users
+    USER_CACHE_SIZE: int = Field(10000, ge=0)  # 0 disables the cache
+    USER_CACHE_TTL: float = Field(60.0, ge=0)  # seconds
+
+    # Verified access tokens, each entry expires together with its token
+    TOKEN_CACHE_SIZE: int = Field(10000, ge=0)  # 0 disables the cache
+
+    # Threads running bcrypt hashing/verification off the event loop
+    PASSWORD_HASH_WORKERS: int = Field(2, ge=1)
+
+    # "opaque" issues random refresh tokens whose expiry lives only in the database
+    REFRESH_TOKEN_FORMAT: Literal["jwt", "opaque"] = "jwt"
+
+    # Background deletion of expired refresh tokens
+    TOKEN_REAPER_ENABLED: bool = True
+    TOKEN_REAPER_INTERVAL: float = Field(3600.0, gt=0)  # seconds between runs
+    TOKEN_REAPER_BATCH_SIZE: int = Field(1000, ge=1)  # rows deleted per transaction
+
+    # /internal/* diagnostics; they are not authenticated, expose them on private networks only
+    INTERNAL_ENDPOINTS_ENABLED: bool = False
+
+    # Response class of endpoints without a hand-serialized fast path
+    JSON_RESPONSE_CLASS: Literal["json", "orjson"] = "json"
+
+    # Cache of serialized /todos/my pages
+    RESPONSE_CACHE_BACKEND: Literal["memory"] = "memory"
+    RESPONSE_CACHE_SIZE: int = Field(1000, ge=0)  # 0 disables the cache
+    RESPONSE_CACHE_TTL: float = Field(300.0, ge=0)  # seconds
+
+    # Asymmetric ALGORITHM keys: <kid>.pem files, the active one signs, all verify
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_ACTIVE_KID: Optional[str] = None  # default: the only private key
+
 
 settings = Settings()
 
@@ -25,11 +78,70 @@ def get_db_url() -> str:
         f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
     )
 
+def get_db_pool_config() -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "statement_timeout": settings.DB_STATEMENT_TIMEOUT,
+        "pgbouncer_mode": settings.DB_PGBOUNCER_MODE,
+    }
+
+def get_query_log_config() -> dict:
+    return {
+        "enabled": settings.DB_QUERY_LOG_ENABLED,
+        "sample_rate": settings.DB_QUERY_LOG_SAMPLE_RATE,
+        "slow_query_ms": settings.DB_SLOW_QUERY_MS,
+    }
+
 def get_auth_data() -> dict[Literal["secret_key", "algorithm"], str]:
     return {"secret_key": settings.SECRET_KEY.get_secret_value(), "algorithm": settings.ALGORITHM}
 
+def get_jwt_keys_config() -> dict:
+    return {"keys_dir": settings.JWT_KEYS_DIR, "active_kid": settings.JWT_ACTIVE_KID}
+
 def get_auth_method() -> Literal["header", "cookie"]:
     return settings.AUTH_METHOD
 
+def get_todos_total_strategy() -> Literal["exact", "counter", "estimate"]:
+    return settings.TODOS_TOTAL_STRATEGY
+
+def get_todos_max_batch_size() -> int:
+    return settings.TODOS_MAX_BATCH_SIZE
+
+def get_user_cache_config() -> dict:
+    return {"maxsize": settings.USER_CACHE_SIZE, "ttl": settings.USER_CACHE_TTL}
+
+def get_token_cache_size() -> int:
+    return settings.TOKEN_CACHE_SIZE
+
+def get_password_hash_workers() -> int:
+    return settings.PASSWORD_HASH_WORKERS
+
+def get_refresh_token_format() -> Literal["jwt", "opaque"]:
+    return settings.REFRESH_TOKEN_FORMAT
+
+def get_token_reaper_config() -> dict:
+    return {
+        "enabled": settings.TOKEN_REAPER_ENABLED,
+        "interval": settings.TOKEN_REAPER_INTERVAL,
+        "batch_size": settings.TOKEN_REAPER_BATCH_SIZE,
+    }
+
+def get_internal_endpoints_enabled() -> bool:
+    return settings.INTERNAL_ENDPOINTS_ENABLED
+
+def get_json_response_class() -> Literal["json", "orjson"]:
+    return settings.JSON_RESPONSE_CLASS
+
+def get_response_cache_config() -> dict:
+    return {
+        "backend": settings.RESPONSE_CACHE_BACKEND,
+        "maxsize": settings.RESPONSE_CACHE_SIZE,
+        "ttl": settings.RESPONSE_CACHE_TTL,
+    }
+
 def get_max_active_sessions() -> int:
     return settings.MAX_ACTIVE_SESSIONS
\ No newline at end of file
@@ -1,3 +1,4 @@
-from src.db.database import get_db_session
+from src.db.database import get_db_session, session_scope
+from src.db.pool import get_pool_stats
 
-__all__ = ["get_db_session"]
+__all__ = ["get_db_session", "session_scope", "get_pool_stats"]
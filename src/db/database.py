@@ -1,17 +1,27 @@
 from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
-from src.config.base_config import get_db_url
+from src.config.base_config import get_db_url, get_db_pool_config, get_query_log_config
+from src.db.pool import get_engine_options
+from src.db.query_logging import install_query_logging
 
 DATABASE_URL = get_db_url()
-engine = create_async_engine(DATABASE_URL, echo=True)
+engine = create_async_engine(DATABASE_URL, **get_engine_options(get_db_pool_config()))
+install_query_logging(engine.sync_engine, get_query_log_config())
 Session = async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
 @asynccontextmanager
-async def get_db_session():
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Unit of work: one session (and one pooled connection) committed once at the end.
+
+    Repositories and services only flush, so everything done inside the scope
+    is either committed together or rolled back together.
+    """
     session = Session()
     try:
         yield session
@@ -23,5 +33,16 @@ async def get_db_session():
         await session.close()
 
 
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency providing the request-scoped unit of work.
+
+    FastAPI caches dependencies per request, so every handler, auth dependency,
+    service and repository in one request share the same session.
+    """
+    async with session_scope() as session:
+        yield session
+
+
 class ModelBase(DeclarativeBase):
     pass
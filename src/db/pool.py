@@ -0,0 +1,100 @@
+import time
+from typing import Any, Optional
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from src.dto import PoolStatsDTO
+
+
+class PoolWaitStats:
+    """Accumulates how long callers waited to get a connection from the pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+
+class _WaitTimingMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.wait_stats.record(time.perf_counter() - start)
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(_WaitTimingMixin, NullPool):
+    pass
+
+
+def get_engine_options(pool_config: dict) -> dict[str, Any]:
+    """
+    Build create_async_engine keyword arguments from the pool settings.
+
+    :param pool_config: dict - result of src.config.base_config.get_db_pool_config
+    :return: dict - keyword arguments for create_async_engine
+    """
+    connect_args: dict[str, Any] = {}
+    if pool_config["statement_timeout"]:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(pool_config["statement_timeout"])
+        }
+
+    if pool_config["pgbouncer_mode"]:
+        # PgBouncer in transaction mode owns pooling and breaks prepared statements
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        return {"poolclass": InstrumentedNullPool, "connect_args": connect_args}
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": pool_config["pool_size"],
+        "max_overflow": pool_config["max_overflow"],
+        "pool_timeout": pool_config["pool_timeout"],
+        "pool_recycle": pool_config["pool_recycle"],
+        "pool_pre_ping": pool_config["pool_pre_ping"],
+        "connect_args": connect_args,
+    }
+
+
+def get_pool_stats(pool: Pool, max_overflow: Optional[int] = None) -> PoolStatsDTO:
+    """
+    Collect current usage numbers of a connection pool.
+
+    :param pool: Pool - SQLAlchemy connection pool (engine.pool)
+    :param max_overflow: Optional[int] - configured max_overflow of the pool
+    :return: PoolStatsDTO - pool usage and checkout wait statistics
+    """
+    wait_stats = getattr(pool, "wait_stats", None) or PoolWaitStats()
+    is_queue_pool = isinstance(pool, AsyncAdaptedQueuePool)
+
+    return PoolStatsDTO(
+        pool_class=type(pool).__name__,
+        size=pool.size() if is_queue_pool else None,
+        checked_in=pool.checkedin() if is_queue_pool else 0,
+        checked_out=pool.checkedout() if is_queue_pool else 0,
+        overflow=max(pool.overflow(), 0) if is_queue_pool else 0,
+        max_overflow=max_overflow if is_queue_pool else None,
+        checkouts=wait_stats.checkouts,
+        avg_wait_ms=(
+            wait_stats.total_wait / wait_stats.checkouts * 1000
+            if wait_stats.checkouts
+            else 0.0
+        ),
+        max_wait_ms=wait_stats.max_wait * 1000,
+    )
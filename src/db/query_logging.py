@@ -0,0 +1,98 @@
+import json
+import hashlib
+import logging
+import random
+import re
+import time
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger("src.db.queries")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint_statement(statement: str) -> str:
+    """
+    Return a short stable fingerprint of an SQL statement.
+
+    Literals and bind placeholders are replaced with "?" and IN lists are
+    collapsed, so the same query with different values has the same fingerprint.
+
+    :param statement: str - SQL statement text
+    :return: str - 16 hex chars fingerprint
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip().lower()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+class QueryLogger:
+    """
+    Engine event listener emitting one JSON record per sampled or slow query.
+
+    Raw SQL text and parameters are never logged, only the statement fingerprint.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, slow_query_ms: float = 0):
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+
+    def install(self, sync_engine: Engine) -> None:
+        event.listen(sync_engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self.after_cursor_execute)
+
+    def before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        # Kept on the execution context, so a failed statement leaves nothing behind
+        context._query_start_time = time.perf_counter()
+
+    def after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        duration_ms = (time.perf_counter() - context._query_start_time) * 1000
+
+        slow = bool(self.slow_query_ms) and duration_ms >= self.slow_query_ms
+        if not slow and random.random() >= self.sample_rate:
+            return None
+
+        rowcount = getattr(cursor, "rowcount", -1)
+        record = {
+            "event": "sql_query",
+            "operation": statement.lstrip().split(" ", 1)[0].upper(),
+            "fingerprint": fingerprint_statement(statement),
+            "duration_ms": round(duration_ms, 3),
+            "rows": rowcount if rowcount is not None and rowcount >= 0 else None,
+            "executemany": executemany,
+            "slow": slow,
+        }
+        logger.log(logging.WARNING if slow else logging.INFO, json.dumps(record))
+        return None
+
+
+def install_query_logging(sync_engine: Engine, query_log_config: dict) -> None:
+    """
+    Attach the query logger to an engine if query logging is enabled.
+
+    :param sync_engine: Engine - sync engine (AsyncEngine.sync_engine)
+    :param query_log_config: dict - result of src.config.base_config.get_query_log_config
+    :return: None
+    """
+    if not query_log_config["enabled"]:
+        return None
+    QueryLogger(
+        sample_rate=query_log_config["sample_rate"],
+        slow_query_ms=query_log_config["slow_query_ms"],
+    ).install(sync_engine)
@@ -1,5 +1,18 @@
-from src.dto.tododto import ToDoDTO, ToDoUpdateDTO
+from src.dto.tododto import (
+    ToDoDTO,
+    ToDoUpdateDTO,
+    ToDoPageDTO,
+    ToDoSearchPageDTO,
+    ToDoBatchUpdateDTO,
+    ToDoBatchResultDTO,
+    ToDoImportErrorDTO,
+    ToDoImportResultDTO,
+    ToDoChangesDTO,
+)
 from src.dto.userdto import UserResponseDTO, UserCreateDTO, UserLoginDTO
 from src.dto.tokendto import TokenDTO, RefreshTokenDTO, CreateRefreshTokenDTO
+from src.dto.pooldto import PoolStatsDTO, WorkerPoolStatsDTO
+from src.dto.cachedto import CacheStatsDTO
+from src.dto.tagdto import TagDTO
 
-__all__ = ["ToDoDTO", "ToDoUpdateDTO", "UserResponseDTO", "UserCreateDTO", "UserLoginDTO", "TokenDTO", "RefreshTokenDTO", "CreateRefreshTokenDTO"]
+__all__ = ["ToDoDTO", "ToDoUpdateDTO", "ToDoPageDTO", "ToDoSearchPageDTO", "ToDoBatchUpdateDTO", "ToDoBatchResultDTO", "ToDoImportErrorDTO", "ToDoImportResultDTO", "ToDoChangesDTO", "UserResponseDTO", "UserCreateDTO", "UserLoginDTO", "TokenDTO", "RefreshTokenDTO", "CreateRefreshTokenDTO", "PoolStatsDTO", "WorkerPoolStatsDTO", "CacheStatsDTO", "TagDTO"]
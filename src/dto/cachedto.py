@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class CacheStatsDTO(BaseModel):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    hit_ratio: float
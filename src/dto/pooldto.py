@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PoolStatsDTO(BaseModel):
+    pool_class: str
+    size: Optional[int]
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: Optional[int]
+    checkouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class WorkerPoolStatsDTO(BaseModel):
+    max_workers: int
+    running: int
+    waiting: int
+    max_waiting: int
+    completed: int
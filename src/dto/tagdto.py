@@ -0,0 +1,9 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class TagDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    name: str
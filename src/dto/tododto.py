@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional, Literal
 
 from pydantic import BaseModel, ConfigDict
 
@@ -12,8 +13,53 @@ class ToDoDTO(BaseModel):
     created_at: datetime
     updated_at: datetime
     user_id: int
+    sync_version: int = 0
+    tags: list[str] = []
 
 
 class ToDoUpdateDTO(BaseModel):
     title: str
     description: str
+
+
+class ToDoPageDTO(BaseModel):
+    data: list[ToDoDTO]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class ToDoSearchPageDTO(BaseModel):
+    data: list[ToDoDTO]
+    next_cursor: Optional[str] = None
+
+
+class ToDoBatchUpdateDTO(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ToDoBatchResultDTO(BaseModel):
+    id: int
+    status: Literal[
+        "created", "updated", "unchanged", "deleted", "not_found", "forbidden"
+    ]
+    todo: Optional[ToDoDTO] = None
+
+
+class ToDoImportErrorDTO(BaseModel):
+    line: int
+    error: str
+
+
+class ToDoImportResultDTO(BaseModel):
+    imported: int
+    failed: int
+    errors: list[ToDoImportErrorDTO]
+
+
+class ToDoChangesDTO(BaseModel):
+    changed: list[ToDoDTO]
+    deleted: list[int]
+    next_token: str
+    has_more: bool
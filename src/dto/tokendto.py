@@ -10,8 +10,10 @@ class TokenDTO(BaseModel):
 
 class RefreshTokenDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
-    
-    token: str
+
+    token_hash: bytes
+    user_id: int
+    expires_at: datetime
 
 
 class CreateRefreshTokenDTO(BaseModel):
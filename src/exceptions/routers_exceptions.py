@@ -51,3 +51,27 @@ class NotFoundToDo(BaseAPIException):
 class ForbiddenError(BaseAPIException):
     status_code = status.HTTP_403_FORBIDDEN
     detail = "Forbidden"
+
+
+class InvalidCursor(BaseAPIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Invalid pagination cursor"
+
+
+class InvalidSyncToken(InvalidCursor):
+    detail = "Invalid sync token"
+
+
+class BatchTooLarge(BaseAPIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    detail = "Too many items in batch"
+
+
+class InvalidImportFile(BaseAPIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Import file must be UTF-8 encoded NDJSON or CSV"
+
+
+class PreconditionFailed(BaseAPIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    detail = "Todo was changed since it was fetched"
@@ -11,3 +11,23 @@ class ExpiredSignatureTokenError(JWTError):
 
 class NotFoundTokenError(JWTError):
     pass
+
+
+class NotValidCursorError(ValueError):
+    pass
+
+
+class NotFoundToDoError(LookupError):
+    pass
+
+
+class ForbiddenToDoError(PermissionError):
+    pass
+
+
+class BatchTooLargeError(ValueError):
+    pass
+
+
+class PreconditionFailedError(ValueError):
+    pass
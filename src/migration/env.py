@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 from src.db.database import ModelBase, DATABASE_URL
-from src.models import UserModel, ToDoModel, RefreshTokenModel # noqa
+from src.models import UserModel, ToDoModel, RefreshTokenModel, TagModel, ToDoTagModel, ToDoTombstoneModel # noqa
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -26,6 +26,19 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = ModelBase.metadata
 
+# Schema objects created by hand in migrations and not described by the models
+# (full-text search on todos), autogenerate must not drop them
+UNMANAGED_OBJECTS = {
+    "search_vector",
+    "ix_todos_search_vector",
+    "ix_todos_title_trgm",
+    "ix_todos_description_trgm",
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and name in UNMANAGED_OBJECTS)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -48,6 +61,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -57,7 +71,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,26 @@
+"""Add users.todos_version
+
+Revision ID: 3c7d2a91f4b8
+Revises: e9d8f5e0fa29
+Create Date: 2026-10-17 15:02:44.208913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7d2a91f4b8'
+down_revision: Union[str, None] = 'e9d8f5e0fa29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('todos_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'todos_version')
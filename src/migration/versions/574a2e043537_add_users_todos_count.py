@@ -0,0 +1,31 @@
+"""Add users.todos_count
+
+Revision ID: 574a2e043537
+Revises: 177056db3360
+Create Date: 2026-10-17 10:03:27.561840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '574a2e043537'
+down_revision: Union[str, None] = '177056db3360'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('todos_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill the counter for existing users
+    op.execute(
+        "UPDATE users SET todos_count = "
+        "(SELECT count(*) FROM todos WHERE todos.user_id = users.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'todos_count')
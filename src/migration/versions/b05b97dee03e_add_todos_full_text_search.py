@@ -0,0 +1,40 @@
+"""Add todos full-text search
+
+Revision ID: b05b97dee03e
+Revises: 891fcbb132eb
+Create Date: 2026-10-17 11:24:52.608113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b05b97dee03e'
+down_revision: Union[str, None] = '891fcbb132eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match SEARCH_CONFIG in src/repositories/todo_repo.py
+    op.execute(
+        "ALTER TABLE todos ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', "
+        "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"
+    )
+    op.create_index('ix_todos_search_vector', 'todos', ['search_vector'], unique=False, postgresql_using='gin')
+
+    # Trigram indexes serve substring (ILIKE '%...%') matches and similarity()
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_todos_title_trgm', 'todos', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_todos_description_trgm', 'todos', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_todos_description_trgm', table_name='todos')
+    op.drop_index('ix_todos_title_trgm', table_name='todos')
+    op.drop_index('ix_todos_search_vector', table_name='todos')
+    op.drop_column('todos', 'search_vector')
@@ -0,0 +1,39 @@
+"""Store refresh tokens as SHA-256 digests
+
+Revision ID: d81b6c3f05e9
+Revises: c4f81d2e7a60
+Create Date: 2026-10-17 18:02:47.219538
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81b6c3f05e9'
+down_revision: Union[str, None] = 'c4f81d2e7a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+    # Rehash existing rows, so issued refresh tokens stay valid
+    op.execute(
+        "UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))"
+    )
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False)
+    # Dropping the column drops its unique constraint as well
+    op.drop_column('refresh_tokens', 'token')
+    op.create_unique_constraint('refresh_tokens_token_hash_key', 'refresh_tokens', ['token_hash'])
+
+
+def downgrade() -> None:
+    # Digests cannot be turned back into tokens: every session has to log in again
+    op.execute("DELETE FROM refresh_tokens")
+    op.drop_constraint('refresh_tokens_token_hash_key', 'refresh_tokens', type_='unique')
+    op.drop_column('refresh_tokens', 'token_hash')
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(), nullable=False))
+    op.create_unique_constraint('refresh_tokens_token_key', 'refresh_tokens', ['token'])
@@ -1,5 +1,14 @@
 from src.models.todo_model import ToDoModel
 from src.models.user_model import UserModel
 from src.models.refresh_token_model import RefreshTokenModel
+from src.models.tag_model import TagModel, ToDoTagModel
+from src.models.todo_tombstone_model import ToDoTombstoneModel
 
-__all__ = ["UserModel", "ToDoModel", "RefreshTokenModel"]
+__all__ = [
+    "UserModel",
+    "ToDoModel",
+    "RefreshTokenModel",
+    "TagModel",
+    "ToDoTagModel",
+    "ToDoTombstoneModel",
+]
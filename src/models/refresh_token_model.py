@@ -1,12 +1,23 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Integer, LargeBinary, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.database import ModelBase
 
 class RefreshTokenModel(ModelBase):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Serves the active sessions count and oldest session lookups on login
+        Index(
+            "ix_refresh_tokens_user_id_expires_at_created_at",
+            "user_id",
+            "expires_at",
+            "created_at",
+        ),
+        # Serves the expired token reaper
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -15,7 +26,8 @@ class RefreshTokenModel(ModelBase):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
-    token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    # SHA-256 digest of the token, see TokenRepo.hash_token
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     user = relationship("UserModel", back_populates="refresh_tokens")
@@ -0,0 +1,32 @@
+from sqlalchemy import Integer, String, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.database import ModelBase
+
+
+class TagModel(ModelBase):
+    __tablename__ = "tags"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_tags_user_id_name"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+
+
+class ToDoTagModel(ModelBase):
+    __tablename__ = "todo_tags"
+    __table_args__ = (
+        # Serves "todos with tag X" lookups, the primary key serves "tags of todo X"
+        Index("ix_todo_tags_tag_id_todo_id", "tag_id", "todo_id"),
+    )
+
+    todo_id: Mapped[int] = mapped_column(
+        ForeignKey("todos.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    )
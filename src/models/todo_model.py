@@ -1,12 +1,50 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, func
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, DDL, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.database import ModelBase
 
+# Full-text search. Postgres gets a generated tsvector column with a GIN index
+# and trigram indexes from the migration; SQLite (tests) gets an FTS5 index
+# kept in sync by triggers.
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE todos_fts USING fts5("
+    "title, description, content='todos', content_rowid='id')",
+    "CREATE TRIGGER todos_fts_ai AFTER INSERT ON todos BEGIN "
+    "INSERT INTO todos_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER todos_fts_ad AFTER DELETE ON todos BEGIN "
+    "INSERT INTO todos_fts(todos_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER todos_fts_au AFTER UPDATE OF title, description ON todos BEGIN "
+    "INSERT INTO todos_fts(todos_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO todos_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+]
+
+SQLITE_FTS_LISTENERS = [
+    ("after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in SQLITE_FTS_DDL
+] + [
+    ("before_drop", DDL("DROP TABLE IF EXISTS todos_fts").execute_if(dialect="sqlite")),
+]
+
+
 class ToDoModel(ModelBase):
     __tablename__ = "todos"
+    __table_args__ = (
+        # Serve ORDER BY <column>, id (and keyset pagination) for /todos/my and /todos
+        Index("ix_todos_user_id_id", "user_id", "id"),
+        Index("ix_todos_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_todos_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index("ix_todos_created_at_id", "created_at", "id"),
+        Index("ix_todos_updated_at_id", "updated_at", "id"),
+        # Serves /todos/my/changes
+        Index("ix_todos_user_id_sync_version_id", "user_id", "sync_version", "id"),
+        {"listeners": SQLITE_FTS_LISTENERS},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -17,5 +55,9 @@ class ToDoModel(ModelBase):
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
+    # Owner's users.todos_version at the last change of the todo
+    sync_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
     user = relationship("UserModel", back_populates="todos")
\ No newline at end of file
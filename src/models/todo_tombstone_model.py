@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, DateTime, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.database import ModelBase
+
+
+class ToDoTombstoneModel(ModelBase):
+    """Marker of a deleted todo, lets /todos/my/changes report deletions."""
+
+    __tablename__ = "todo_tombstones"
+
+    # The primary key also serves "deletions of user X since version N"
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    sync_version: Mapped[int] = mapped_column(Integer, primary_key=True)
+    todo_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -19,5 +19,13 @@ class UserModel(ModelBase):
     name: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     password: Mapped[str] = mapped_column(String, nullable=False)
+    # Maintained by TodoRepo on create/delete, gives O(1) totals for /todos/my
+    todos_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Bumped by TodoRepo on every change to the user's todos, versions /todos/my ETags
+    todos_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     todos = relationship("ToDoModel", back_populates="user", cascade="all, delete-orphan",)
     refresh_tokens = relationship("RefreshTokenModel", back_populates="user", cascade="all, delete-orphan")
@@ -2,5 +2,6 @@ from src.repositories.todo_repo import TodoRepo
 from src.repositories.user_repo import UserRepo
 from src.repositories.base_repo import BaseRepo, DTOType, ModelType
 from src.repositories.token_repo import TokenRepo
+from src.repositories.tag_repo import TagRepo
 
-__all__ = ["BaseRepo", "DTOType", "ModelType", "TodoRepo", "UserRepo", "TokenRepo"]
+__all__ = ["BaseRepo", "DTOType", "ModelType", "TodoRepo", "UserRepo", "TokenRepo", "TagRepo"]
@@ -1,6 +1,6 @@
-from typing import TypeVar, Type, Optional, List
+from typing import TypeVar, Type, Optional, List, Any, Tuple, Literal
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.logging_confing import logging  # noqa
@@ -12,6 +12,8 @@ DTOType = TypeVar("DTOType")
 
 
 class BaseRepo:
+    # NOTE Repositories only flush. The unit of work that owns the session
+    # (see src.db.database.session_scope) commits once at the end.
     model = None
     dto = None
 
@@ -28,9 +30,8 @@ class BaseRepo:
         :param id: int - record ID
         :return: Optional[DTOType] - DTO object or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(id=id)
-            instance = await s.execute(query)
+        query = select(cls.model).filter_by(id=id)
+        instance = await session.execute(query)
         result = cls._convert_to_dto(instance.scalar_one_or_none(), cls.dto)
         return result
 
@@ -47,9 +48,8 @@ class BaseRepo:
         :param filter_params: dict - filter parameters
         :return: Optional[DTOType] - DTO object or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(**filter_params)
-            instance = await s.execute(query)
+        query = select(cls.model).filter_by(**filter_params)
+        instance = await session.execute(query)
         result = cls._convert_to_dto(instance.scalar_one_or_none(), cls.dto)
         return result
 
@@ -59,18 +59,25 @@ class BaseRepo:
         session: AsyncSession,
         offset: int = 0,
         limit: int = 10,
+        order_by: Optional[str] = None,
+        direction: Literal["asc", "desc"] = "asc",
+        after: Optional[Tuple[Any, int]] = None,
     ) -> List[DTOType]:
         """
         Find all records with pagination and return them as a list of DTOs.
 
         :param session: AsyncSession - SQLAlchemy async session
-        :param offset: int - pagination offset
+        :param offset: int - pagination offset (ignored when after is given)
         :param limit: int - pagination limit
+        :param order_by: Optional[str] - column to order by (id is the tie-breaker)
+        :param direction: str - asc or desc (default: asc)
+        :param after: Optional[Tuple[Any, int]] - keyset: (order_by value, id) of the last seen record
         :return: List[DTOType] - list of DTO objects
         """
-        async with session as s:
-            query = select(cls.model).offset(offset).limit(limit)
-            instance = await s.execute(query)
+        query = cls._paginate(
+            select(cls.model), offset, limit, order_by, direction, after
+        )
+        instance = await session.execute(query)
         result = cls._convert_to_dto_list(instance.scalars().all(), cls.dto)
         return result
 
@@ -83,10 +90,9 @@ class BaseRepo:
         :param id: int - record ID
         :return: None
         """
-        async with session as s:
-            record = await cls._find_by_id(session=s, id=id)
-            await s.delete(record)
-            await s.commit()
+        record = await cls._find_by_id(session=session, id=id)
+        await session.delete(record)
+        await session.flush()
         return None
 
     @classmethod
@@ -98,11 +104,51 @@ class BaseRepo:
         :param id: int - record ID
         :return: ModelType - SQLAlchemy model or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(id=id)
-            instance = await s.execute(query)
+        query = select(cls.model).filter_by(id=id)
+        instance = await session.execute(query)
         return instance.scalars().one_or_none()
 
+    @classmethod
+    def _paginate(
+        cls,
+        query: Select,
+        offset: int,
+        limit: int,
+        order_by: Optional[str] = None,
+        direction: Literal["asc", "desc"] = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+    ) -> Select:
+        """
+        Helper method to apply ordering and offset or keyset pagination to a query.
+
+        Keyset pagination filters on (order_by, id) > after (< for desc) instead
+        of skipping rows, so every page costs the same no matter how deep it is.
+
+        :param query: Select - query to paginate
+        :param offset: int - pagination offset (ignored when after is given)
+        :param limit: int - pagination limit
+        :param order_by: Optional[str] - column to order by (id is the tie-breaker)
+        :param direction: str - asc or desc (default: asc)
+        :param after: Optional[Tuple[Any, int]] - (order_by value, id) of the last seen record
+        :return: Select - paginated query
+        """
+        if order_by is None:
+            return query.offset(offset).limit(limit)
+
+        column = getattr(cls.model, order_by)
+        key = tuple_(column, cls.model.id)
+        if direction == "desc":
+            query = query.order_by(column.desc(), cls.model.id.desc())
+        else:
+            query = query.order_by(column.asc(), cls.model.id.asc())
+
+        if after is None:
+            return query.offset(offset).limit(limit)
+
+        if direction == "desc":
+            return query.where(key < tuple_(*after)).limit(limit)
+        return query.where(key > tuple_(*after)).limit(limit)
+
     @staticmethod
     def _convert_to_dto(
         instance: ModelType, dto_class: Type[DTOType]
@@ -0,0 +1,128 @@
+from typing import List
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.base_repo import BaseRepo
+from src.models.tag_model import TagModel, ToDoTagModel
+from src.dto import TagDTO
+
+from src.config.logging_confing import logging  # noqa
+
+
+class TagRepo(BaseRepo):
+    model = TagModel
+    dto = TagDTO
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(model=TagModel, dto=TagDTO)
+
+    @classmethod
+    async def set_todo_tags(
+        cls, session: AsyncSession, todo_id: int, user_id: int, names: List[str]
+    ) -> List[str]:
+        """
+        Replace the tags of a todo, creating the user's missing tags.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - todo ID
+        :param user_id: int - ID of the todo owner (tags are per user)
+        :param names: List[str] - unique, normalized tag names
+        :return: List[str] - tag names of the todo
+        """
+        await session.execute(
+            delete(ToDoTagModel).where(ToDoTagModel.todo_id == todo_id)
+        )
+        if not names:
+            return []
+
+        tag_ids = await cls._get_or_create_tag_ids(session, user_id, names)
+        await session.execute(
+            insert(ToDoTagModel),
+            [{"todo_id": todo_id, "tag_id": tag_id} for tag_id in tag_ids.values()],
+        )
+        return sorted(names)
+
+    @classmethod
+    async def add_todos_tags(
+        cls, session: AsyncSession, user_id: int, tags: dict[int, List[str]]
+    ) -> None:
+        """
+        Tag many new todos of a user at once, creating the user's missing tags.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the todos owner (tags are per user)
+        :param tags: dict[int, List[str]] - unique, normalized tag names by todo ID
+        :return: None
+        """
+        names = list(
+            dict.fromkeys(name for todo_tags in tags.values() for name in todo_tags)
+        )
+        if not names:
+            return None
+
+        tag_ids = await cls._get_or_create_tag_ids(session, user_id, names)
+        await session.execute(
+            insert(ToDoTagModel),
+            [
+                {"todo_id": todo_id, "tag_id": tag_ids[name]}
+                for todo_id, todo_tags in tags.items()
+                for name in todo_tags
+            ],
+        )
+        return None
+
+    @classmethod
+    async def find_tags_by_todo_ids(
+        cls, session: AsyncSession, todo_ids: List[int]
+    ) -> dict[int, List[str]]:
+        """
+        Find the tag names of many todos in one query.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_ids: List[int] - todo IDs
+        :return: dict[int, List[str]] - sorted tag names by todo ID (todos without tags are left out)
+        """
+        if not todo_ids:
+            return {}
+        query = (
+            select(ToDoTagModel.todo_id, cls.model.name)
+            .join(cls.model, cls.model.id == ToDoTagModel.tag_id)
+            .where(ToDoTagModel.todo_id.in_(todo_ids))
+            .order_by(ToDoTagModel.todo_id, cls.model.name)
+        )
+        instance = await session.execute(query)
+        result = {}
+        for todo_id, name in instance.all():
+            result.setdefault(todo_id, []).append(name)
+        return result
+
+    @classmethod
+    async def _get_or_create_tag_ids(
+        cls, session: AsyncSession, user_id: int, names: List[str]
+    ) -> dict[str, int]:
+        """
+        Helper method to insert missing tags (ignoring concurrent duplicates)
+        and return the IDs of all of them.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param names: List[str] - unique tag names
+        :return: dict[str, int] - tag IDs by name
+        """
+        dialect_insert = (
+            postgresql.insert
+            if session.bind.dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        await session.execute(
+            dialect_insert(cls.model)
+            .values([{"user_id": user_id, "name": name} for name in names])
+            .on_conflict_do_nothing(index_elements=["user_id", "name"])
+        )
+        query = select(cls.model.name, cls.model.id).where(
+            cls.model.user_id == user_id, cls.model.name.in_(names)
+        )
+        instance = await session.execute(query)
+        return dict(instance.tuples().all())
@@ -1,15 +1,54 @@
-from typing import List, Optional
+import re
+from datetime import datetime
+from typing import (
+    List,
+    Optional,
+    Any,
+    Tuple,
+    Literal,
+    AsyncIterator,
+    Callable,
+    Sequence,
+)
 
-from sqlalchemy import select
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    delete,
+    case,
+    func,
+    text,
+    literal_column,
+    table,
+    column,
+    or_,
+    tuple_,
+    exists,
+    literal,
+    ColumnElement,
+    Select,
+    Row,
+    UpdateBase,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.base_repo import BaseRepo
 from src.models.todo_model import ToDoModel
-from src.dto import ToDoDTO, ToDoUpdateDTO
+from src.models.user_model import UserModel
+from src.models.tag_model import TagModel, ToDoTagModel
+from src.models.todo_tombstone_model import ToDoTombstoneModel
+from src.dto import ToDoDTO, ToDoUpdateDTO, ToDoBatchUpdateDTO
 
 from src.config.logging_confing import logging  # noqa
 
 
+# Text search configuration of the todos.search_vector generated column
+SEARCH_CONFIG = "simple"
+# SQLite FTS5 index of todos (see src.models.todo_model)
+todos_fts = table("todos_fts", column("rowid"))
+
+
 class TodoRepo(BaseRepo):
     model = ToDoModel
     dto = ToDoDTO
@@ -24,24 +63,290 @@ class TodoRepo(BaseRepo):
         user_id: int,
         offset: int = 0,
         limit: int = 10,
+        order_by: Optional[str] = None,
+        direction: Literal["asc", "desc"] = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
     ) -> List[ToDoDTO]:
         """
         Find all todos for a specific user with pagination.
 
         :param session: AsyncSession - SQLAlchemy async session
         :param user_id: int - user ID
-        :param offset: int - pagination offset
+        :param offset: int - pagination offset (ignored when after is given)
         :param limit: int - pagination limit
+        :param order_by: Optional[str] - column to order by (id is the tie-breaker)
+        :param direction: str - asc or desc (default: asc)
+        :param after: Optional[Tuple[Any, int]] - keyset: (order_by value, id) of the last seen todo
+        :param tags: Optional[List[str]] - only todos with these tags
+        :param tags_match: str - any or all of the tags (default: any)
         :return: List[ToDoDTO] - list of ToDoDTO objects
         """
-        async with session as s:
-            query = (
-                select(cls.model).filter_by(user_id=user_id).offset(offset).limit(limit)
-            )
-            instance = await s.execute(query)
+        query = cls._todos_by_user_id_query(
+            user_id, offset, limit, order_by, direction, after, tags, tags_match
+        )
+        instance = await session.execute(query)
         result = cls._convert_to_dto_list(instance.scalars().all(), cls.dto)
         return result
 
+    @classmethod
+    def _todos_by_user_id_query(
+        cls,
+        user_id: int,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: Optional[str] = None,
+        direction: Literal["asc", "desc"] = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
+    ) -> Select:
+        """
+        Helper method to build the query of a user's todos page.
+
+        :param user_id: int - user ID
+        :param offset: int - pagination offset (ignored when after is given)
+        :param limit: int - pagination limit
+        :param order_by: Optional[str] - column to order by (id is the tie-breaker)
+        :param direction: str - asc or desc (default: asc)
+        :param after: Optional[Tuple[Any, int]] - keyset: (order_by value, id) of the last seen todo
+        :param tags: Optional[List[str]] - only todos with these tags
+        :param tags_match: str - any or all of the tags (default: any)
+        :return: Select - todos query
+        """
+        query = select(cls.model).filter_by(user_id=user_id)
+        if tags:
+            query = query.where(cls._tags_filter(tags, tags_match, user_id))
+        return cls._paginate(
+            query,
+            offset,
+            limit,
+            order_by,
+            direction,
+            after,
+        )
+
+    @classmethod
+    async def find_all(
+        cls,
+        session: AsyncSession,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: Optional[str] = None,
+        direction: Literal["asc", "desc"] = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
+    ) -> List[ToDoDTO]:
+        """
+        Find all todos with pagination, optionally filtered by tags.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param offset: int - pagination offset (ignored when after is given)
+        :param limit: int - pagination limit
+        :param order_by: Optional[str] - column to order by (id is the tie-breaker)
+        :param direction: str - asc or desc (default: asc)
+        :param after: Optional[Tuple[Any, int]] - keyset: (order_by value, id) of the last seen todo
+        :param tags: Optional[List[str]] - only todos with these tags
+        :param tags_match: str - any or all of the tags (default: any)
+        :return: List[ToDoDTO] - list of ToDoDTO objects
+        """
+        query = select(cls.model)
+        if tags:
+            query = query.where(cls._tags_filter(tags, tags_match))
+        query = cls._paginate(query, offset, limit, order_by, direction, after)
+        instance = await session.execute(query)
+        return cls._convert_to_dto_list(instance.scalars().all(), cls.dto)
+
+    @classmethod
+    def _tags_filter(
+        cls,
+        tags: List[str],
+        tags_match: Literal["any", "all"] = "any",
+        user_id: Optional[int] = None,
+    ) -> ColumnElement:
+        """
+        Helper method to build the condition "todo has any/all of the tags".
+
+        :param tags: List[str] - unique tag names
+        :param tags_match: str - any or all of the tags (default: any)
+        :param user_id: Optional[int] - owner of the tags, None for every user's tags
+        :return: ColumnElement - WHERE condition on todos.id
+        """
+        todo_ids = (
+            select(ToDoTagModel.todo_id)
+            .join(TagModel, TagModel.id == ToDoTagModel.tag_id)
+            .where(TagModel.name.in_(tags))
+        )
+        if user_id is not None:
+            # Only the user's tags (uq_tags_user_id_name), not every user's tag of that name
+            todo_ids = todo_ids.where(TagModel.user_id == user_id)
+        if tags_match == "all":
+            todo_ids = todo_ids.group_by(ToDoTagModel.todo_id).having(
+                func.count() == len(tags)
+            )
+        return cls.model.id.in_(todo_ids)
+
+    @classmethod
+    async def stream_todos_by_user_id(
+        cls, session: AsyncSession, user_id: int, batch_size: int = 500
+    ) -> AsyncIterator[List[ToDoDTO]]:
+        """
+        Stream all todos of a user in batches through a server-side cursor.
+
+        Plain rows are selected instead of ORM objects so nothing piles up in
+        the session identity map: memory stays at one batch however many
+        todos the user has.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param batch_size: int - number of rows fetched per round-trip
+        :return: AsyncIterator[List[ToDoDTO]] - batches of ToDoDTO objects ordered by id
+        """
+        query = (
+            select(*cls.model.__table__.columns)
+            .where(cls.model.user_id == user_id)
+            .order_by(cls.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await session.stream(query)
+        async for rows in result.partitions():
+            yield cls._convert_to_dto_list(rows, cls.dto)
+
+    @classmethod
+    async def find_changes(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        after: Tuple[int, int] = (0, 0),
+        limit: int = 100,
+    ) -> Tuple[List[ToDoDTO], List[Tuple[int, int]]]:
+        """
+        Find a user's todos changed and deleted after a sync position.
+
+        Both lists are ordered by (sync_version, id) and limited separately,
+        the caller merges them.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param after: Tuple[int, int] - keyset: (sync_version, todo ID) of the last seen change
+        :param limit: int - maximum number of changed and of deleted todos
+        :return: Tuple[List[ToDoDTO], List[Tuple[int, int]]] - changed todos and
+            (sync_version, todo ID) of deleted todos
+        """
+        changed_query = (
+            select(cls.model)
+            .where(
+                cls.model.user_id == user_id,
+                tuple_(cls.model.sync_version, cls.model.id) > tuple_(*after),
+            )
+            .order_by(cls.model.sync_version, cls.model.id)
+            .limit(limit)
+        )
+        changed = await session.execute(changed_query)
+
+        deleted_query = (
+            select(ToDoTombstoneModel.sync_version, ToDoTombstoneModel.todo_id)
+            .where(
+                ToDoTombstoneModel.user_id == user_id,
+                tuple_(ToDoTombstoneModel.sync_version, ToDoTombstoneModel.todo_id)
+                > tuple_(*after),
+            )
+            .order_by(ToDoTombstoneModel.sync_version, ToDoTombstoneModel.todo_id)
+            .limit(limit)
+        )
+        deleted = await session.execute(deleted_query)
+        return (
+            cls._convert_to_dto_list(changed.scalars().all(), cls.dto),
+            [tuple(row) for row in deleted.all()],
+        )
+
+    @classmethod
+    async def search_todos(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        query: str,
+        limit: int = 10,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> List[Tuple[ToDoDTO, float]]:
+        """
+        Full-text search in the titles and descriptions of a user's todos,
+        best matches first.
+
+        Postgres matches the search_vector column (websearch syntax) or, for
+        substrings, the trigram-indexed title/description. SQLite matches
+        the todos_fts FTS5 index by word prefixes.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param query: str - search text
+        :param limit: int - pagination limit
+        :param after: Optional[Tuple[float, int]] - keyset: (rank, id) of the last seen todo
+        :return: List[Tuple[ToDoDTO, float]] - todos with their rank (higher is better)
+        """
+        if session.bind.dialect.name == "postgresql":
+            statement, rank = cls._search_query_postgresql(query)
+        else:
+            fts_query = " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+            if not fts_query:
+                return []
+            statement, rank = cls._search_query_sqlite(fts_query)
+
+        statement = (
+            statement.where(cls.model.user_id == user_id)
+            .order_by(rank.desc(), cls.model.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            statement = statement.where(tuple_(rank, cls.model.id) < tuple_(*after))
+
+        instance = await session.execute(statement)
+        return [
+            (cls._convert_to_dto(todo, cls.dto), rank_value)
+            for todo, rank_value in instance.all()
+        ]
+
+    @classmethod
+    def _search_query_postgresql(cls, query: str) -> Tuple[Select, ColumnElement]:
+        """
+        Helper method to build the Postgres search query and its rank expression.
+
+        :param query: str - search text
+        :return: Tuple[Select, ColumnElement] - query and rank expression
+        """
+        search_vector = literal_column(f"{cls.model.__tablename__}.search_vector")
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(search_vector, ts_query) + func.similarity(
+            cls.model.title, query
+        )
+        statement = select(cls.model, rank.label("rank")).where(
+            or_(
+                search_vector.op("@@")(ts_query),
+                cls.model.title.icontains(query, autoescape=True),
+                cls.model.description.icontains(query, autoescape=True),
+            )
+        )
+        return statement, rank
+
+    @classmethod
+    def _search_query_sqlite(cls, fts_query: str) -> Tuple[Select, ColumnElement]:
+        """
+        Helper method to build the SQLite FTS5 search query and its rank expression.
+
+        :param fts_query: str - FTS5 MATCH expression
+        :return: Tuple[Select, ColumnElement] - query and rank expression
+        """
+        fts = literal_column("todos_fts")
+        rank = -func.bm25(fts)
+        statement = (
+            select(cls.model, rank.label("rank"))
+            .join(todos_fts, todos_fts.c.rowid == cls.model.id)
+            .where(fts.op("MATCH")(fts_query))
+        )
+        return statement, rank
+
     @classmethod
     async def create_todo(
         cls,
@@ -59,11 +364,16 @@ class TodoRepo(BaseRepo):
         :param description: str - description of the todo
         :return: ToDoDTO - created ToDoDTO object
         """
-        todo = ToDoModel(title=title, description=description, user_id=user_id)
-        async with session as s:
-            s.add(todo)
-            await s.commit()
-            await s.refresh(todo)
+        sync_version = await cls._touch_user_todos(session, user_id, 1)
+        todo = ToDoModel(
+            title=title,
+            description=description,
+            user_id=user_id,
+            sync_version=sync_version,
+        )
+        session.add(todo)
+        await session.flush()
+        await session.refresh(todo)
         return cls._convert_to_dto(todo, cls.dto)
 
     @classmethod
@@ -78,17 +388,514 @@ class TodoRepo(BaseRepo):
         :param new_todo_data: ToDoUpdateDTO - new data for the todo
         :return: Optional[ToDoDTO] - updated ToDoDTO object or None if not found
         """
-        async with session as s:
-            todo = await cls._find_by_id(session=s, id=todo_id)
-            if not todo:
-                return None
-            for key, value in new_todo_data.model_dump(exclude_unset=True).items():
-                setattr(todo, key, value)
-            s.add(todo)
-            await s.commit()
-            await s.refresh(todo)
+        todo = await cls._find_by_id(session=session, id=todo_id)
+        if not todo:
+            return None
+        todo.sync_version = await cls._touch_user_todos(session, todo.user_id)
+        for key, value in new_todo_data.model_dump(exclude_unset=True).items():
+            setattr(todo, key, value)
+        session.add(todo)
+        await session.flush()
+        await session.refresh(todo)
         return cls._convert_to_dto(todo, cls.dto)
 
+    @classmethod
+    async def delete_by_id(cls, session: AsyncSession, id: int) -> None:
+        """
+        Delete a todo by ID, leave a tombstone for sync and keep the owner's
+        todos counter in sync.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param id: int - todo ID
+        :return: None
+        """
+        todo = await cls._find_by_id(session=session, id=id)
+        if todo is None:
+            return None
+        sync_version = await cls._touch_user_todos(session, todo.user_id, -1)
+        await session.delete(todo)
+        await session.flush()
+        await cls._add_tombstones(session, todo.user_id, sync_version, [id])
+        return None
+
+    @classmethod
+    async def update_user_todo(
+        cls,
+        session: AsyncSession,
+        todo_id: int,
+        user_id: int,
+        new_todo_data: ToDoUpdateDTO,
+    ) -> Optional[ToDoDTO]:
+        """
+        Update a todo owned by the user with a single UPDATE ... RETURNING.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - todo ID
+        :param user_id: int - ID of the user who must own the todo
+        :param new_todo_data: ToDoUpdateDTO - new data for the todo
+        :return: Optional[ToDoDTO] - updated ToDoDTO object or None if the todo
+            does not exist or belongs to another user
+        """
+        rows = await cls._write_user_todos(
+            session,
+            user_id,
+            lambda sync_version: (
+                update(cls.model)
+                .where(cls.model.id == todo_id, cls.model.user_id == user_id)
+                .values(
+                    **new_todo_data.model_dump(exclude_unset=True),
+                    sync_version=sync_version,
+                )
+                .returning(*cls.model.__table__.columns)
+            ),
+        )
+        return cls._convert_to_dto(rows[0] if rows else None, cls.dto)
+
+    @classmethod
+    async def delete_user_todo(
+        cls, session: AsyncSession, todo_id: int, user_id: int
+    ) -> bool:
+        """
+        Delete a todo owned by the user with a single DELETE ... RETURNING,
+        leave a tombstone for sync and keep the user's todos counter in sync.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - todo ID
+        :param user_id: int - ID of the user who must own the todo
+        :return: bool - True if deleted, False if the todo does not exist or
+            belongs to another user
+        """
+        deleted_ids = await cls.delete_user_todos(session, user_id, [todo_id])
+        return bool(deleted_ids)
+
+    @classmethod
+    async def create_todos(
+        cls, session: AsyncSession, user_id: int, todos: List[ToDoUpdateDTO]
+    ) -> List[ToDoDTO]:
+        """
+        Create many todos for a user with multi-row INSERT ... RETURNING.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param todos: List[ToDoUpdateDTO] - title and description of each todo
+        :return: List[ToDoDTO] - created todos in the order of todos
+        """
+        if not todos:
+            return []
+        sync_version = await cls._touch_user_todos(session, user_id, len(todos))
+        query = insert(cls.model).returning(cls.model, sort_by_parameter_order=True)
+        instance = await session.execute(
+            query,
+            [
+                {**todo.model_dump(), "user_id": user_id, "sync_version": sync_version}
+                for todo in todos
+            ],
+        )
+        return cls._convert_to_dto_list(instance.scalars().all(), cls.dto)
+
+    @classmethod
+    async def copy_todos(
+        cls, session: AsyncSession, user_id: int, todos: List[ToDoUpdateDTO]
+    ) -> int:
+        """
+        Load many todos for a user as fast as the database allows.
+
+        On Postgres the rows go through COPY (asyncpg copy_records_to_table)
+        on the session's connection, inside the session's transaction, so they
+        commit or roll back with the unit of work. Other databases get a
+        multi-row INSERT.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param todos: List[ToDoUpdateDTO] - title and description of each todo
+        :return: int - number of inserted todos
+        """
+        if not todos:
+            return 0
+        # Must run before the COPY: the asyncpg adapter only sends BEGIN with the
+        # first statement executed through SQLAlchemy, so this UPDATE opens the
+        # transaction that the raw COPY then joins instead of autocommitting
+        sync_version = await cls._touch_user_todos(session, user_id, len(todos))
+        if session.bind.dialect.name == "postgresql":
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                cls.model.__tablename__,
+                records=[
+                    (todo.title, todo.description, user_id, sync_version)
+                    for todo in todos
+                ],
+                columns=["title", "description", "user_id", "sync_version"],
+            )
+        else:
+            await session.execute(
+                insert(cls.model),
+                [
+                    {**todo.model_dump(), "user_id": user_id, "sync_version": sync_version}
+                    for todo in todos
+                ],
+            )
+        return len(todos)
+
+    @classmethod
+    async def update_user_todos(
+        cls, session: AsyncSession, user_id: int, todos: List[ToDoBatchUpdateDTO]
+    ) -> List[ToDoDTO]:
+        """
+        Update many todos owned by the user with a single UPDATE ... RETURNING.
+
+        New values are picked per row with CASE id WHEN ... expressions, which
+        works the same on every supported database. Fields left as None keep
+        their current value.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user who must own the todos
+        :param todos: List[ToDoBatchUpdateDTO] - todo IDs with their new data
+        :return: List[ToDoDTO] - updated todos (in no particular order); todos
+            that do not exist or belong to another user are skipped
+        """
+        if not todos:
+            return []
+        values = {"updated_at": func.now()}
+        for field in ("title", "description"):
+            column = getattr(cls.model, field)
+            whens = {
+                todo.id: getattr(todo, field)
+                for todo in todos
+                if getattr(todo, field) is not None
+            }
+            if whens:
+                values[field] = case(whens, value=cls.model.id, else_=column)
+
+        updated = await cls._write_user_todos(
+            session,
+            user_id,
+            lambda sync_version: (
+                update(cls.model)
+                .where(
+                    cls.model.user_id == user_id,
+                    cls.model.id.in_([todo.id for todo in todos]),
+                )
+                .values(**values, sync_version=sync_version)
+                .returning(*cls.model.__table__.columns)
+            ),
+        )
+        return cls._convert_to_dto_list(updated, cls.dto)
+
+    @classmethod
+    async def delete_user_todos(
+        cls, session: AsyncSession, user_id: int, todo_ids: List[int]
+    ) -> List[int]:
+        """
+        Delete many todos owned by the user with a single DELETE ... RETURNING,
+        leave tombstones for sync and keep the user's todos counter in sync.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user who must own the todos
+        :param todo_ids: List[int] - todo IDs
+        :return: List[int] - IDs of the deleted todos
+        """
+        if not todo_ids:
+            return []
+        deleted = await cls._write_user_todos(
+            session,
+            user_id,
+            lambda sync_version: (
+                delete(cls.model)
+                .where(cls.model.user_id == user_id, cls.model.id.in_(todo_ids))
+                .returning(cls.model.id)
+            ),
+            deleted=True,
+        )
+        return [row.id for row in deleted]
+
+    @classmethod
+    async def find_existing_ids(
+        cls, session: AsyncSession, todo_ids: List[int], user_id: Optional[int] = None
+    ) -> List[int]:
+        """
+        Find which of the given todo IDs exist.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_ids: List[int] - todo IDs
+        :param user_id: Optional[int] - only look at the todos of this user
+        :return: List[int] - IDs that exist
+        """
+        if not todo_ids:
+            return []
+        query = select(cls.model.id).where(cls.model.id.in_(todo_ids))
+        if user_id is not None:
+            query = query.where(cls.model.user_id == user_id)
+        instance = await session.execute(query)
+        return list(instance.scalars().all())
+
+    @classmethod
+    async def count_todos(
+        cls,
+        session: AsyncSession,
+        user_id: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
+    ) -> int:
+        """
+        Count todos with COUNT(*), for all users or for one user.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: Optional[int] - user ID or None to count all todos
+        :param tags: Optional[List[str]] - only count todos with these tags
+        :param tags_match: str - any or all of the tags (default: any)
+        :return: int - number of todos
+        """
+        query = select(func.count(cls.model.id))
+        if user_id is not None:
+            query = query.where(cls.model.user_id == user_id)
+        if tags:
+            query = query.where(cls._tags_filter(tags, tags_match, user_id))
+        instance = await session.execute(query)
+        return instance.scalar()
+
+    @classmethod
+    async def get_todos_counter(cls, session: AsyncSession, user_id: int) -> int:
+        """
+        Read the per-user todos counter maintained on create/delete.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :return: int - number of todos of the user (0 if the user is not found)
+        """
+        query = select(UserModel.todos_count).where(UserModel.id == user_id)
+        instance = await session.execute(query)
+        return instance.scalar() or 0
+
+    @classmethod
+    async def estimate_todos_count(cls, session: AsyncSession) -> int:
+        """
+        Estimate the number of all todos from the Postgres planner statistics.
+
+        Falls back to an exact count on other databases or when the table
+        has never been analyzed.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :return: int - estimated number of todos
+        """
+        if session.bind.dialect.name == "postgresql":
+            query = text(
+                "SELECT reltuples::bigint FROM pg_class "
+                f"WHERE oid = '{cls.model.__tablename__}'::regclass"
+            )
+            instance = await session.execute(query)
+            estimate = instance.scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+        return await cls.count_todos(session)
+
+    @classmethod
+    async def get_todos_version(cls, session: AsyncSession, user_id: int) -> int:
+        """
+        Read the per-user todos version bumped on every change to the user's todos.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :return: int - version of the user's todos (0 if the user is not found)
+        """
+        query = select(UserModel.todos_version).where(UserModel.id == user_id)
+        instance = await session.execute(query)
+        return instance.scalar() or 0
+
+    @classmethod
+    async def get_todo_owner_and_updated_at(
+        cls, session: AsyncSession, todo_id: int, for_update: bool = False
+    ) -> Optional[Tuple[int, datetime]]:
+        """
+        Get the owner ID and last update time of a todo without loading it.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - todo ID
+        :param for_update: bool - lock the row until the end of the transaction
+        :return: Optional[Tuple[int, datetime]] - (user ID, updated_at) or None if not found
+        """
+        query = select(cls.model.user_id, cls.model.updated_at).filter_by(id=todo_id)
+        if for_update:
+            query = query.with_for_update()
+        instance = await session.execute(query)
+        row = instance.one_or_none()
+        return tuple(row) if row is not None else None
+
+    @classmethod
+    async def touch_todo(cls, session: AsyncSession, todo_id: int, user_id: int) -> None:
+        """
+        Mark a todo owned by the user as changed (e.g. its tags were replaced).
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - todo ID
+        :param user_id: int - ID of the user who owns the todo
+        :return: None
+        """
+        await cls._write_user_todos(
+            session,
+            user_id,
+            lambda sync_version: (
+                update(cls.model)
+                .where(cls.model.id == todo_id, cls.model.user_id == user_id)
+                .values(updated_at=func.now(), sync_version=sync_version)
+                .returning(cls.model.id)
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        return None
+
+    @classmethod
+    async def lock_user_todos(cls, session: AsyncSession, user_id: int) -> int:
+        """
+        Lock the user row and return the version the next write to the
+        user's todos will get.
+
+        Services call it before locking a todo row themselves, to take the
+        locks in the same order as every write. Like _touch_user_todos, it
+        keeps the user row locked until commit.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :return: int - version of the user's todos after the next bump
+        """
+        query = (
+            select(UserModel.todos_version)
+            .where(UserModel.id == user_id)
+            .with_for_update(key_share=True)
+        )
+        instance = await session.execute(query)
+        return (instance.scalar_one_or_none() or 0) + 1
+
+    @classmethod
+    async def _write_user_todos(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        make_query: Callable[[Any], UpdateBase],
+        deleted: bool = False,
+    ) -> Sequence[Row]:
+        """
+        Helper method to run a write to the user's todos that may match no
+        row, bumping the user's todos version only if it changed something,
+        so a no-op does not invalidate the user's ETags and cached pages.
+
+        On PostgreSQL it is a single statement: a CTE locks the user row
+        before any todo row, the write runs next and the user row is bumped
+        (and tombstones are added) only if the write returned rows. Other
+        databases (SQLite in tests) run the same steps one by one.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param make_query: Callable[[Any], UpdateBase] - builds the UPDATE or
+            DELETE ... RETURNING of the user's todos from the version of the
+            write (an SQL expression or an int)
+        :param deleted: bool - the write deletes todos and returns their IDs:
+            subtract them from the counter and leave tombstones
+        :return: Sequence[Row] - rows returned by the write
+        """
+        if session.bind.dialect.name != "postgresql":
+            sync_version = await cls.lock_user_todos(session, user_id)
+            instance = await session.execute(make_query(sync_version))
+            rows = instance.all()
+            if rows and deleted:
+                await cls._touch_user_todos(session, user_id, -len(rows))
+                await cls._add_tombstones(
+                    session, user_id, sync_version, [row.id for row in rows]
+                )
+            elif rows:
+                await cls._touch_user_todos(session, user_id)
+            return rows
+
+        next_version = (
+            select((UserModel.todos_version + 1).label("version"))
+            .where(UserModel.id == user_id)
+            .with_for_update(key_share=True)
+            .cte("next_version")
+        )
+        sync_version = select(next_version.c.version).scalar_subquery()
+        written = (
+            make_query(sync_version)
+            .where(exists(next_version.select()))
+            .cte("written")
+        )
+        values = {"todos_version": sync_version}
+        if deleted:
+            values["todos_count"] = (
+                UserModel.todos_count
+                - select(func.count()).select_from(written).scalar_subquery()
+            )
+        ctes = [
+            update(UserModel)
+            .where(UserModel.id == user_id, exists(written.select()))
+            .values(**values)
+            .cte("touched")
+        ]
+        if deleted:
+            ctes.append(
+                insert(ToDoTombstoneModel)
+                .from_select(
+                    ["user_id", "sync_version", "todo_id"],
+                    select(literal(user_id), sync_version, written.c.id),
+                )
+                .cte("tombstones")
+            )
+        instance = await session.execute(select(written).add_cte(*ctes))
+        return instance.all()
+
+    @classmethod
+    async def _touch_user_todos(
+        cls, session: AsyncSession, user_id: int, count_delta: int = 0
+    ) -> int:
+        """
+        Helper method to atomically bump the user's todos version and add
+        count_delta to the user's todos counter.
+
+        Every write to a user's todos locks the user row first, with this
+        method, lock_user_todos or _write_user_todos: the row stays locked
+        until commit, so the
+        user's writes get increasing versions and commit in that order, which
+        is what makes sync tokens safe.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - user ID
+        :param count_delta: int - value to add to the counter (negative to subtract)
+        :return: int - new version of the user's todos
+        """
+        query = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                todos_count=UserModel.todos_count + count_delta,
+                todos_version=UserModel.todos_version + 1,
+            )
+            .returning(UserModel.todos_version)
+            .execution_options(synchronize_session=False)
+        )
+        instance = await session.execute(query)
+        return instance.scalar_one_or_none() or 0
+
+    @classmethod
+    async def _add_tombstones(
+        cls, session: AsyncSession, user_id: int, sync_version: int, todo_ids: List[int]
+    ) -> None:
+        """
+        Helper method to record deleted todos for /todos/my/changes.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user who owned the todos
+        :param sync_version: int - version of the user's todos of the delete
+        :param todo_ids: List[int] - IDs of the deleted todos
+        :return: None
+        """
+        await session.execute(
+            insert(ToDoTombstoneModel),
+            [
+                {"user_id": user_id, "sync_version": sync_version, "todo_id": todo_id}
+                for todo_id in todo_ids
+            ],
+        )
+        return None
+
     @classmethod
     async def get_todo_owner_id(
         cls, session: AsyncSession, todo_id: int
@@ -100,8 +907,6 @@ class TodoRepo(BaseRepo):
         :param todo_id: int - todo ID
         :return: Optional[int] - user ID or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(id=todo_id)
-            instance = await s.execute(query)
-        todo = cls._convert_to_dto(instance.scalars().one_or_none(), cls.dto)
-        return todo.user_id
+        query = select(cls.model.user_id).filter_by(id=todo_id)
+        instance = await session.execute(query)
+        return instance.scalar_one_or_none()
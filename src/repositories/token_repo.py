@@ -1,16 +1,28 @@
+import hashlib
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, update, delete, func, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.base_repo import BaseRepo
 from src.models.refresh_token_model import RefreshTokenModel
+from src.models.user_model import UserModel
 from src.dto import RefreshTokenDTO, CreateRefreshTokenDTO
 
 from src.config.logging_confing import logging  # noqa
 
 
+def hash_token(token: str) -> bytes:
+    """
+    Digest under which a refresh token is stored and looked up.
+
+    :param token: str - refresh token
+    :return: bytes - 32-byte SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
 class TokenRepo(BaseRepo):
     model = RefreshTokenModel
     dto = RefreshTokenDTO
@@ -30,15 +42,66 @@ class TokenRepo(BaseRepo):
         :return: None
         """
         token_instance = RefreshTokenModel(
-            token=token.token,
+            token_hash=hash_token(token.token),
             user_id=token.user_id,
             expires_at=token.expires_at,
         )
-        async with session as s:
-            s.add(token_instance)
-            await s.commit()
+        session.add(token_instance)
+        await session.flush()
         return None
 
+    @classmethod
+    async def add_token_with_limit(
+        cls, session: AsyncSession, token: CreateRefreshTokenDTO, max_active: int
+    ) -> int:
+        """
+        Add a refresh token, evicting the user's oldest active tokens so that
+        at most max_active stay active.
+
+        On Postgres the user row is locked first, so concurrent logins of the
+        user take turns, then the eviction and the insert run as one
+        statement (DELETE in a CTE + INSERT). Other databases run a DELETE
+        and an INSERT; SQLite serializes writers on its own.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param token: CreateRefreshTokenDTO - Refresh token DTO
+        :param max_active: int - maximum number of active tokens of the user
+        :return: int - number of evicted tokens
+        """
+        values = {
+            "token_hash": hash_token(token.token),
+            "user_id": token.user_id,
+            "expires_at": token.expires_at,
+        }
+        evicted_ids = cls.model.id.in_(
+            cls._active_tokens_query(token.user_id).offset(max_active - 1)
+        )
+
+        if session.bind.dialect.name != "postgresql":
+            instance = await session.execute(
+                delete(cls.model).where(evicted_ids).returning(cls.model.id)
+            )
+            evicted = len(instance.all())
+            await session.execute(insert(cls.model).values(**values))
+            return evicted
+
+        await session.execute(
+            select(UserModel.id)
+            .where(UserModel.id == token.user_id)
+            .with_for_update(key_share=True)
+        )
+        evicted_cte = (
+            delete(cls.model).where(evicted_ids).returning(cls.model.id).cte("evicted")
+        )
+        query = (
+            insert(cls.model)
+            .values(**values)
+            .add_cte(evicted_cte)
+            .returning(select(func.count()).select_from(evicted_cte).scalar_subquery())
+        )
+        instance = await session.execute(query)
+        return instance.scalar_one()
+
     @classmethod
     async def check_token_exist(
         cls, session: AsyncSession, token: str
@@ -50,10 +113,9 @@ class TokenRepo(BaseRepo):
         :param token: str - refresh token
         :return: Optional[RefreshTokenDTO] - Refresh token DTO or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(token=token)
-            instance = await s.execute(query)
-            instance = instance.scalars().first()
+        query = select(cls.model).filter_by(token_hash=hash_token(token))
+        instance = await session.execute(query)
+        instance = instance.scalars().first()
         if instance is None:
             return None
         return cls._convert_to_dto(instance, cls.dto)
@@ -65,24 +127,29 @@ class TokenRepo(BaseRepo):
         """
         Update an existing refres htoken to a new token.
 
+        Expired tokens are not rotated, whether or not the reaper deleted them yet.
+
         :param session: AsyncSession - SQLAlchemy async session
         :param old_token: str - Refresh token
         :param new_token: CreateRefreshTokenDTO - New refresh token
-        :return: Optional[RefreshTokenDTO] - New refresh token or None if old token not found
+        :return: Optional[RefreshTokenDTO] - New refresh token or None if old token not found or expired
         """
-        async with session as s:
-            query = select(cls.model).filter_by(
-                token=old_token, user_id=new_token.user_id
+        query = (
+            update(cls.model)
+            .where(
+                cls.model.token_hash == hash_token(old_token),
+                cls.model.user_id == new_token.user_id,
+                cls.model.expires_at > datetime.now(timezone.utc),
+            )
+            .values(
+                token_hash=hash_token(new_token.token),
+                expires_at=new_token.expires_at,
             )
-            instance = await s.execute(query)
-            instance = instance.scalars().first()
-            if instance is None:
-                return None
-            instance.token = new_token.token
-            instance.expires_at = new_token.expires_at
-            await s.commit()
-            await s.refresh(instance=instance)
-        return cls._convert_to_dto(instance=instance, dto_class=cls.dto)
+            .returning(cls.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        instance = await session.execute(query)
+        return cls._convert_to_dto(instance.scalar_one_or_none(), cls.dto)
 
     @classmethod
     async def count_tokens_for_user(cls, session: AsyncSession, user_id: int) -> int:
@@ -93,13 +160,9 @@ class TokenRepo(BaseRepo):
         :param: user_id int - user ID
         :return: int - The number of tokens by the user
         """
-        async with session as s:
-            query = select(func.count(cls.model.id)).where(
-                cls.model.user_id == user_id,
-                cls.model.expires_at > datetime.now(timezone.utc),
-            )
-            instance = await s.execute(query)
-            active_tokens = instance.scalar()
+        query = cls._count_active_tokens_query(user_id)
+        instance = await session.execute(query)
+        active_tokens = instance.scalar()
 
         return active_tokens
 
@@ -112,12 +175,11 @@ class TokenRepo(BaseRepo):
         :param user_id: int - User ID
         :return: None
         """
-        async with session as s:
-            oldest_token = await cls._get_oldest_token(session, user_id)
-            if oldest_token is None:
-                return None
-            await s.delete(oldest_token)
-            await s.commit()
+        oldest_token = await cls._get_oldest_token(session, user_id)
+        if oldest_token is None:
+            return None
+        await session.delete(oldest_token)
+        await session.flush()
         return None
 
     @classmethod
@@ -132,14 +194,10 @@ class TokenRepo(BaseRepo):
         :param user_id: int - user ID
         :return: None
         """
-        async with session as s:
-            query = select(cls.model).filter_by(token=token, user_id=user_id)
-            instance = await s.execute(query)
-            instance = instance.scalars().first()
-            if instance is None:
-                return None
-            await s.delete(instance)
-            await s.commit()
+        query = delete(cls.model).where(
+            cls.model.token_hash == hash_token(token), cls.model.user_id == user_id
+        )
+        await session.execute(query)
         return None
 
     @classmethod
@@ -153,17 +211,83 @@ class TokenRepo(BaseRepo):
         :param user_id: int - User ID
         :return: Optional[RefreshTokenModel] - RefreshTokenModel or None if not found
         """
-        async with session as s:
-            query = (
-                select(cls.model)
-                .filter(
-                    cls.model.user_id == user_id,
-                    cls.model.expires_at > datetime.now(timezone.utc),
-                )
-                .order_by(cls.model.created_at.asc())
-            )
-            instance = await s.execute(query)
-            oldest_token = instance.scalars().first()
+        query = cls._oldest_token_query(user_id)
+        instance = await session.execute(query)
+        oldest_token = instance.scalars().first()
         if oldest_token is None:
             return None
         return oldest_token
+
+    @classmethod
+    async def delete_expired_tokens(cls, session: AsyncSession, batch_size: int) -> int:
+        """
+        Delete up to batch_size expired refresh tokens of any user.
+
+        On Postgres rows locked by a concurrent run are skipped, so reapers of
+        several processes do not wait for each other.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param batch_size: int - maximum number of tokens to delete
+        :return: int - number of deleted tokens
+        """
+        expired_ids = (
+            select(cls.model.id)
+            .where(cls.model.expires_at <= datetime.now(timezone.utc))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            delete(cls.model)
+            .where(cls.model.id.in_(expired_ids))
+            .returning(cls.model.id)
+        )
+        instance = await session.execute(query)
+        return len(instance.all())
+
+    @classmethod
+    def _count_active_tokens_query(cls, user_id: int) -> Select:
+        """
+        Helper method to build the query counting the user's active tokens.
+
+        :param user_id: int - User ID
+        :return: Select - count query
+        """
+        return select(func.count(cls.model.id)).where(
+            cls.model.user_id == user_id,
+            cls.model.expires_at > datetime.now(timezone.utc),
+        )
+
+    @classmethod
+    def _active_tokens_query(cls, user_id: int) -> Select:
+        """
+        Helper method to build the query of the user's active token IDs, newest first.
+
+        :param user_id: int - User ID
+        :return: Select - token IDs query
+        """
+        return (
+            select(cls.model.id)
+            .where(
+                cls.model.user_id == user_id,
+                cls.model.expires_at > datetime.now(timezone.utc),
+            )
+            .order_by(cls.model.created_at.desc(), cls.model.id.desc())
+        )
+
+    @classmethod
+    def _oldest_token_query(cls, user_id: int) -> Select:
+        """
+        Helper method to build the query of the user's oldest active token.
+
+        :param user_id: int - User ID
+        :return: Select - oldest token query
+        """
+        return (
+            select(cls.model)
+            .filter(
+                cls.model.user_id == user_id,
+                cls.model.expires_at > datetime.now(timezone.utc),
+            )
+            .order_by(cls.model.created_at.asc())
+            .limit(1)
+        )
@@ -24,9 +24,8 @@ class UserRepo(BaseRepo):
         :param email: str - user email
         :return: Optional[UserResponseDTO] - UserResponseDTO object or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(email=email)
-            instance = await s.execute(query)
+        query = select(cls.model).filter_by(email=email)
+        instance = await session.execute(query)
         result = cls._convert_to_dto(instance.scalar_one_or_none(), cls.dto)
         return result
 
@@ -42,10 +41,9 @@ class UserRepo(BaseRepo):
         :return: UserResponseDTO - created UserResponseDTO object
         """
         user_data = UserModel(**user.model_dump())
-        async with session as s:
-            s.add(user_data)
-            await s.commit()
-            await s.refresh(user_data)
+        session.add(user_data)
+        await session.flush()
+        await session.refresh(user_data)
         return cls._convert_to_dto(user_data, cls.dto)
 
     @classmethod
@@ -57,9 +55,8 @@ class UserRepo(BaseRepo):
         :param email: str - user email
         :return: Optional[str] - password hash or None if not found
         """
-        async with session as s:
-            query = select(cls.model).filter_by(email=email)
-            instance = await s.execute(query)
+        query = select(cls.model).filter_by(email=email)
+        instance = await session.execute(query)
         result = instance.scalar_one_or_none()
         if result is None:
             return None
@@ -1,4 +1,6 @@
 from src.routes.todos_router import router as router_todo
 from src.routes.auth_router import router as auth_router
+from src.routes.internal_router import router as internal_router
+from src.routes.well_known_router import router as well_known_router
 
-__all__ = ["router_todo", "auth_router"]
\ No newline at end of file
+__all__ = ["router_todo", "auth_router", "internal_router", "well_known_router"]
@@ -1,6 +1,7 @@
 from typing import Optional, Annotated, Literal
 
 from fastapi import APIRouter, Response, Depends, Body
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import get_db_session
 from src.config.base_config import get_auth_method
@@ -22,27 +23,34 @@ auth_method: Literal["cookie", "header"] = get_auth_method()
 
 
 @router.post("/register")
-async def register_user(user_data: Annotated[SUserRegister, Body()]) -> SUser:
+async def register_user(
+    user_data: Annotated[SUserRegister, Body()],
+    session: AsyncSession = Depends(get_db_session),
+) -> SUser:
     user = await UserService.get_user_by_email(
-        session=get_db_session(), email=user_data.email
+        session=session, email=user_data.email
     )
     if user:
         raise routers_exceptions.UserAlreadyExistError
 
     user_data = SUserRegister.model_dump(user_data)
     user = await AuthService.create_user(
-        session=get_db_session(), user=UserCreateDTO(**user_data)
+        session=session, user=UserCreateDTO(**user_data)
     )
 
     return SUser.model_dump(user)
 
 
 @router.post("/login")
-async def login_user(response: Response, user_data: SUserLogin) -> Optional[SJWTToken]:
+async def login_user(
+    response: Response,
+    user_data: SUserLogin,
+    session: AsyncSession = Depends(get_db_session),
+) -> Optional[SJWTToken]:
     user_data = SUserLogin.model_dump(user_data)
 
     token = await AuthService.login_user(
-        session=get_db_session(), user=UserLoginDTO(**user_data)
+        session=session, user=UserLoginDTO(**user_data)
     )
 
     if token is None:
@@ -76,10 +84,11 @@ async def refresh_token(
     response: Response,
     refresh_token: str = Depends(get_refresh_token),
     user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
 ) -> SJWTToken:
     try:
         new_tokens = await AuthService.refresh_token(
-            session=get_db_session(), refresh_token=refresh_token, user_id=user.id
+            session=session, refresh_token=refresh_token, user_id=user.id
         )
     except services_exceptions.NotFoundTokenError:
         raise routers_exceptions.NotValidRefreshToken
@@ -109,9 +118,10 @@ async def logout(
     response: Response,
     user: SUser = Depends(get_current_user),
     refresh_token: str = Depends(get_refresh_token),
+    session: AsyncSession = Depends(get_db_session),
 ) -> dict:
     await AuthService.logout_user(
-        session=get_db_session(), user_id=user.id, refresh_token=refresh_token
+        session=session, user_id=user.id, refresh_token=refresh_token
     )
     if auth_method == "cookie":
         response.delete_cookie(key="users_access_token", httponly=True)
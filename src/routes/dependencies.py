@@ -1,5 +1,6 @@
 from fastapi import Request, Depends, Security
 from fastapi.security.api_key import APIKeyHeader
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.base_config import get_auth_method
 from src.db import get_db_session
@@ -51,9 +52,12 @@ async def get_refresh_token(request: Request) -> str:
     return token
 
 
-async def get_current_user(token: str = Depends(get_access_token)) -> SUser:
+async def get_current_user(
+    token: str = Depends(get_access_token),
+    session: AsyncSession = Depends(get_db_session),
+) -> SUser:
     try:
-        user = await AuthService.get_current_user(session=get_db_session(), token=token)
+        user = await AuthService.get_current_user(session=session, token=token)
 
     except services_exceptions.NotValidTokenError:
         raise routers_exceptions.InvalidToken
@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+
+from src.config.base_config import get_db_pool_config
+from src.db import get_pool_stats
+from src.db.database import engine
+from src.schemas import SPoolStats, SCacheStats, SWorkerPoolStats
+from src.services.auth_service import password_hasher
+from src.services.jwt_service import token_cache
+from src.services.user_cache import user_cache
+from src.services.response_cache import get_response_cache_stats
+
+from src.config.logging_confing import logging  # noqa
+
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@router.get("/pool")
+async def get_pool() -> SPoolStats:
+    stats = get_pool_stats(engine.pool, get_db_pool_config()["max_overflow"])
+    return SPoolStats.model_dump(stats)
+
+
+@router.get("/caches")
+async def get_caches() -> dict[str, SCacheStats]:
+    return {
+        "users": SCacheStats.model_dump(user_cache.stats()),
+        "tokens": SCacheStats.model_dump(token_cache.stats()),
+        "responses": SCacheStats.model_dump(get_response_cache_stats()),
+    }
+
+
+@router.get("/password-hasher")
+async def get_password_hasher() -> SWorkerPoolStats:
+    return SWorkerPoolStats.model_dump(password_hasher.stats())
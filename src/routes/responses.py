@@ -0,0 +1,60 @@
+from typing import Any, Optional, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+
+from src.config.base_config import get_json_response_class
+from src.dto import ToDoDTO
+from src.schemas import SToDo
+
+
+JSON_MEDIA_TYPE = "application/json"
+RESPONSE_CLASSES = {"json": JSONResponse, "orjson": ORJSONResponse}
+TODO_FIELDS = set(SToDo.model_fields)
+
+
+def get_default_response_class() -> Type[JSONResponse]:
+    """
+    Response class of handlers that return plain data, see JSON_RESPONSE_CLASS.
+
+    :return: Type[JSONResponse] - JSONResponse or ORJSONResponse
+    :raises RuntimeError: If orjson is configured but not installed
+    """
+    name = get_json_response_class()
+    if name == "orjson":
+        try:
+            import orjson  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("JSON_RESPONSE_CLASS=orjson requires orjson") from e
+    return RESPONSE_CLASSES[name]
+
+
+def make_todo_page_response(
+    schema: Type[BaseModel],
+    todos_field: str,
+    todos: list[ToDoDTO],
+    headers: Optional[dict[str, str]] = None,
+    **fields: Any,
+) -> Response:
+    """
+    Serialize a page of todo DTOs without copying them into SToDo schemas.
+
+    ToDoDTO has every SToDo field, so the already validated DTOs are dumped
+    in place of SToDo items, keeping only the SToDo fields.
+
+    :param schema: Type[BaseModel] - page schema (e.g. SToDoList)
+    :param todos_field: str - field of the schema holding the list of SToDo
+    :param todos: list[ToDoDTO] - todo DTOs
+    :param headers: Optional[dict[str, str]] - extra headers
+    :param fields: Any - the other fields of the schema
+    :return: Response - JSON response
+    """
+    page = schema.model_construct(**{todos_field: todos}, **fields)
+    include = {name: True for name in schema.model_fields}
+    include[todos_field] = {"__all__": TODO_FIELDS}
+    return Response(
+        page.model_dump_json(include=include),
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
@@ -1,11 +1,36 @@
-from typing import Optional, Annotated
+import csv
+import io
+from typing import Optional, Annotated, Literal
 
-from fastapi import APIRouter, status, Query, Depends
+from fastapi import APIRouter, status, Query, Depends, UploadFile, Header, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db import get_db_session
+from src.db import get_db_session, session_scope
 from src.services import ToDoService
-from src.exceptions import routers_exceptions
-from src.schemas import SToDoList, SCreateToDo, SToDo, FilterParams, SUser
+from src.services.common_func import etag_matches
+from src.services.response_cache import get_cached_todos_page, cache_todos_page
+from src.routes.responses import JSON_MEDIA_TYPE, make_todo_page_response
+from src.exceptions import routers_exceptions, services_exceptions
+from src.dto import ToDoUpdateDTO, ToDoBatchUpdateDTO, ToDoBatchResultDTO
+from src.schemas import (
+    SToDoList,
+    SToDoSearchResult,
+    SearchParams,
+    SyncParams,
+    SToDoChanges,
+    SCreateToDo,
+    STags,
+    SToDo,
+    FilterParams,
+    SUser,
+    SCreateToDoBatch,
+    SUpdateToDoBatch,
+    SDeleteToDoBatch,
+    SToDoBatchItem,
+    SToDoBatchResult,
+    SToDoImportResult,
+)
 from src.routes.dependencies import get_current_user
 
 from src.config.logging_confing import logging  # noqa
@@ -18,16 +43,31 @@ router = APIRouter(prefix="/todos", tags=["To-do list"])
 async def get_todos(
     filter_query: Annotated[FilterParams, Query()],
     user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
 ) -> SToDoList:
-    todos = await ToDoService.get_all_todos(
-        session=get_db_session(),
+    try:
+        page = await ToDoService.get_all_todos(
+            session=session,
+            offset=filter_query.offset,
+            limit=filter_query.limit,
+            order_by=filter_query.order_by,
+            direction=filter_query.order_direction,
+            pagination=filter_query.pagination,
+            cursor=filter_query.cursor,
+            tags=filter_query.tags,
+            tags_match=filter_query.tags_match,
+        )
+    except services_exceptions.NotValidCursorError:
+        raise routers_exceptions.InvalidCursor
+
+    return make_todo_page_response(
+        SToDoList,
+        "data",
+        page.data,
         offset=filter_query.offset,
         limit=filter_query.limit,
-        order_by=filter_query.order_by,
-    )
-    data = [SToDo.model_dump(todo) for todo in todos]
-    return SToDoList(
-        data=data, offset=filter_query.offset, limit=filter_query.limit, total=len(data)
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -35,12 +75,14 @@ async def get_todos(
 async def create_todo(
     todo: SCreateToDo,
     user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
 ) -> SToDo:
     new_todo = await ToDoService.create_todo(
-        session=get_db_session(),
+        session=session,
         user_id=user.id,
         title=todo.title,
         description=todo.description,
+        tags=todo.tags,
     )
     return SToDo.model_dump(new_todo)
 
@@ -48,63 +90,304 @@ async def create_todo(
 @router.get("/my")
 async def get_my_todos(
     filter_query: Annotated[FilterParams, Query()],
+    if_none_match: Optional[str] = Header(None),
     user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
 ) -> SToDoList:
-    todos = await ToDoService.get_all_todos_by_user_id(
-        session=get_db_session(),
-        user_id=user.id,
+    # Read before the page, so a concurrent change can only make the ETag
+    # older than the data (an extra refetch), never newer.
+    etag = await ToDoService.find_user_todos_etag(
+        session=session, user_id=user.id, params=filter_query.model_dump_json()
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    body = await get_cached_todos_page(etag)
+    if body is not None:
+        return Response(body, media_type=JSON_MEDIA_TYPE, headers={"ETag": etag})
+
+    try:
+        page = await ToDoService.get_all_todos_by_user_id(
+            session=session,
+            user_id=user.id,
+            offset=filter_query.offset,
+            limit=filter_query.limit,
+            order_by=filter_query.order_by,
+            direction=filter_query.order_direction,
+            pagination=filter_query.pagination,
+            cursor=filter_query.cursor,
+            tags=filter_query.tags,
+            tags_match=filter_query.tags_match,
+        )
+    except services_exceptions.NotValidCursorError:
+        raise routers_exceptions.InvalidCursor
+
+    response = make_todo_page_response(
+        SToDoList,
+        "data",
+        page.data,
+        headers={"ETag": etag},
         offset=filter_query.offset,
         limit=filter_query.limit,
-        order_by=filter_query.order_by,
+        total=page.total,
+        next_cursor=page.next_cursor,
+    )
+    await cache_todos_page(etag, response.body)
+    return response
+
+
+@router.get("/search")
+async def search_todos(
+    search_query: Annotated[SearchParams, Query()],
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> SToDoSearchResult:
+    try:
+        page = await ToDoService.search_todos(
+            session=session,
+            user_id=user.id,
+            query=search_query.q,
+            limit=search_query.limit,
+            cursor=search_query.cursor,
+        )
+    except services_exceptions.NotValidCursorError:
+        raise routers_exceptions.InvalidCursor
+
+    return make_todo_page_response(
+        SToDoSearchResult,
+        "data",
+        page.data,
+        limit=search_query.limit,
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get("/my/changes")
+async def get_my_todo_changes(
+    sync_query: Annotated[SyncParams, Query()],
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> SToDoChanges:
+    try:
+        changes = await ToDoService.get_todo_changes(
+            session=session,
+            user_id=user.id,
+            since=sync_query.since,
+            limit=sync_query.limit,
+        )
+    except services_exceptions.NotValidCursorError:
+        raise routers_exceptions.InvalidSyncToken
+
+    return make_todo_page_response(
+        SToDoChanges,
+        "changed",
+        changes.changed,
+        deleted=changes.deleted,
+        next_token=changes.next_token,
+        has_more=changes.has_more,
     )
-    data = [SToDo.model_dump(todo) for todo in todos]
-    return SToDoList(
-        data=data, offset=filter_query.offset, limit=filter_query.limit, total=len(data)
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@router.get("/my/export")
+async def export_my_todos(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    user: SUser = Depends(get_current_user),
+) -> StreamingResponse:
+    async def export():
+        # The request session is closed before the body is sent,
+        # so the stream runs in its own unit of work.
+        async with session_scope() as session:
+            async for chunk in ToDoService.export_todos(
+                session=session, user_id=user.id, format=format
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        export(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="todos.{format}"'},
+    )
+
+
+@router.post("/my/import")
+async def import_my_todos(
+    file: UploadFile,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> SToDoImportResult:
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        result = await ToDoService.import_todos(
+            session=session, user_id=user.id, lines=lines, format=format
+        )
+    except (UnicodeDecodeError, csv.Error):
+        raise routers_exceptions.InvalidImportFile
+
+    return SToDoImportResult.model_dump(result)
+
+
+@router.post("/batch", status_code=status.HTTP_201_CREATED)
+async def create_todos_batch(
+    batch: SCreateToDoBatch,
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> SToDoBatchResult:
+    try:
+        results = await ToDoService.create_todos(
+            session=session,
+            user_id=user.id,
+            todos=[
+                ToDoUpdateDTO.model_validate(item.model_dump(exclude={"tags"}))
+                for item in batch.items
+            ],
+            tags=[item.tags for item in batch.items],
+        )
+    except services_exceptions.BatchTooLargeError:
+        raise routers_exceptions.BatchTooLarge
+
+    return _make_batch_result(results)
+
+
+@router.patch("/batch")
+async def update_todos_batch(
+    batch: SUpdateToDoBatch,
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> SToDoBatchResult:
+    try:
+        results = await ToDoService.update_todos(
+            session=session,
+            user_id=user.id,
+            todos=[
+                ToDoBatchUpdateDTO.model_validate(item.model_dump())
+                for item in batch.items
+            ],
+        )
+    except services_exceptions.BatchTooLargeError:
+        raise routers_exceptions.BatchTooLarge
+
+    return _make_batch_result(results)
+
+
+@router.delete("/batch")
+async def delete_todos_batch(
+    batch: SDeleteToDoBatch,
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> SToDoBatchResult:
+    try:
+        results = await ToDoService.delete_todos(
+            session=session, user_id=user.id, todo_ids=batch.ids
+        )
+    except services_exceptions.BatchTooLargeError:
+        raise routers_exceptions.BatchTooLarge
+
+    return _make_batch_result(results)
+
+
+def _make_batch_result(results: list[ToDoBatchResultDTO]) -> SToDoBatchResult:
+    return SToDoBatchResult(
+        results=[
+            SToDoBatchItem(
+                id=result.id,
+                status=result.status,
+                data=SToDo.model_dump(result.todo) if result.todo else None,
+            )
+            for result in results
+        ]
     )
 
 
 @router.get("/{id}")
-async def get_todo_by_id(id: int) -> Optional[SToDo]:
-    todo = await ToDoService.get_todo_by_id(session=get_db_session(), todo_id=id)
+async def get_todo_by_id(
+    id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_db_session),
+) -> Optional[SToDo]:
+    if if_none_match:
+        etag = await ToDoService.find_todo_etag(session=session, todo_id=id)
+        if etag is None:
+            raise routers_exceptions.NotFoundToDo
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    todo = await ToDoService.get_todo_by_id(session=session, todo_id=id)
 
     if not todo:
         raise routers_exceptions.NotFoundToDo
 
+    response.headers["ETag"] = ToDoService.get_todo_etag(todo)
     return SToDo.model_dump(todo)
 
 
 @router.put("/{id}")
 async def update_todo_by_id(
-    id: int, new_todo_data: SCreateToDo, user: SUser = Depends(get_current_user)
+    id: int,
+    new_todo_data: SCreateToDo,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
 ) -> SToDo:
-    todo = await ToDoService.get_todo_by_id(session=get_db_session(), todo_id=id)
-
-    if not todo:
+    try:
+        new_todo = await ToDoService.update_todo(
+            session=session,
+            todo_id=id,
+            new_todo=ToDoUpdateDTO(
+                title=new_todo_data.title, description=new_todo_data.description
+            ),
+            user_id=user.id,
+            tags=new_todo_data.tags if "tags" in new_todo_data.model_fields_set else None,
+            if_match=if_match,
+        )
+    except services_exceptions.NotFoundToDoError:
         raise routers_exceptions.NotFoundToDo
-
-    if not await ToDoService.check_todo_owner(
-        session=get_db_session(), user_id=user.id, todo_id=todo.id
-    ):
+    except services_exceptions.ForbiddenToDoError:
         raise routers_exceptions.ForbiddenError
+    except services_exceptions.PreconditionFailedError:
+        raise routers_exceptions.PreconditionFailed
 
-    new_todo = await ToDoService.update_todo(
-        session=get_db_session(), todo_id=id, new_todo=new_todo_data
-    )
-
+    response.headers["ETag"] = ToDoService.get_todo_etag(new_todo)
     return SToDo.model_dump(new_todo)
 
 
-@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo_by_id(id: int, user: SUser = Depends(get_current_user)):
-    todo = await ToDoService.get_todo_by_id(session=get_db_session(), todo_id=id)
-
-    if not todo:
+@router.put("/{id}/tags")
+async def set_todo_tags(
+    id: int,
+    tags: STags,
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+) -> STags:
+    try:
+        new_tags = await ToDoService.set_todo_tags(
+            session=session, todo_id=id, user_id=user.id, tags=tags.tags
+        )
+    except services_exceptions.NotFoundToDoError:
         raise routers_exceptions.NotFoundToDo
+    except services_exceptions.ForbiddenToDoError:
+        raise routers_exceptions.ForbiddenError
+
+    return STags(tags=new_tags)
+
 
-    if not await ToDoService.check_todo_owner(
-        session=get_db_session(), user_id=user.id, todo_id=todo.id
-    ):
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_todo_by_id(
+    id: int,
+    user: SUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+):
+    try:
+        await ToDoService.delete_todo(session=session, todo_id=id, user_id=user.id)
+    except services_exceptions.NotFoundToDoError:
+        raise routers_exceptions.NotFoundToDo
+    except services_exceptions.ForbiddenToDoError:
         raise routers_exceptions.ForbiddenError
 
-    await ToDoService.delete_todo(session=get_db_session(), todo_id=id)
     return None
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Response
+
+from src.routes.responses import JSON_MEDIA_TYPE
+from src.services.jwt_keys import get_key_set
+
+from src.config.logging_confing import logging  # noqa
+
+
+router = APIRouter(prefix="/.well-known", tags=["Well-known"])
+
+
+@router.get("/jwks.json")
+async def get_jwks() -> Response:
+    # Serialized once with the key set; verifiers refetch it on an unknown kid
+    return Response(
+        content=get_key_set().jwks,
+        media_type=JSON_MEDIA_TYPE,
+        headers={"Cache-Control": "public, max-age=300"},
+    )
@@ -1,15 +1,47 @@
-from src.schemas.todo_schemas import SToDo, SCreateToDo, SToDoList
+from src.schemas.todo_schemas import (
+    SToDo,
+    SCreateToDo,
+    STags,
+    SToDoList,
+    SToDoSearchResult,
+    SCreateToDoBatch,
+    SUpdateToDoItem,
+    SUpdateToDoBatch,
+    SDeleteToDoBatch,
+    SToDoBatchItem,
+    SToDoBatchResult,
+    SToDoImportError,
+    SToDoImportResult,
+    SToDoChanges,
+)
 from src.schemas.user_schemas import SUser, SUserRegister, SUserLogin
-from src.schemas.query_schemas import FilterParams
+from src.schemas.query_schemas import FilterParams, SearchParams, SyncParams
 from src.schemas.jwt_token_schemas import SJWTToken
+from src.schemas.internal_schemas import SPoolStats, SCacheStats, SWorkerPoolStats
 
 __all__ = [
     "SToDo",
     "SCreateToDo",
+    "STags",
     "SToDoList",
+    "SToDoSearchResult",
+    "SCreateToDoBatch",
+    "SUpdateToDoItem",
+    "SUpdateToDoBatch",
+    "SDeleteToDoBatch",
+    "SToDoBatchItem",
+    "SToDoBatchResult",
+    "SToDoImportError",
+    "SToDoImportResult",
+    "SToDoChanges",
     "SUser",
     "SUserRegister",
     "SUserLogin",
     "FilterParams",
+    "SearchParams",
+    "SyncParams",
     "SJWTToken",
+    "SPoolStats",
+    "SCacheStats",
+    "SWorkerPoolStats",
 ]
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -7,5 +7,23 @@ class FilterParams(BaseModel):
     limit: int = Field(100, gt=0, le=100)
     offset: int = Field(0, ge=0)
     order_by: Literal["created_at", "updated_at", "id"] = "created_at"
+    order_direction: Literal["asc", "desc"] = "asc"
     tags: list[str] = []
+    tags_match: Literal["any", "all"] = "any"
+    pagination: Literal["offset", "cursor"] = "offset"
+    cursor: Optional[str] = Field(
+        None, description="next_cursor of the previous page, implies cursor pagination"
+    )
 
+
+class SearchParams(BaseModel):
+    q: str = Field(min_length=1, max_length=200)
+    limit: int = Field(10, gt=0, le=100)
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page")
+
+
+class SyncParams(BaseModel):
+    since: Optional[str] = Field(
+        None, description="next_token of the previous sync, omit for a full sync"
+    )
+    limit: int = Field(100, gt=0, le=1000)
@@ -1,14 +1,29 @@
-from pydantic import BaseModel
+from typing import Optional, Literal, Annotated
+
+from pydantic import BaseModel, Field
+
+from src.config.base_config import get_todos_max_batch_size
+
+
+STag = Annotated[str, Field(max_length=50)]
+TODOS_MAX_BATCH_SIZE = get_todos_max_batch_size()
+
 
 class SToDo(BaseModel):
     id: int
     title: str
     description: str
+    tags: list[str] = []
 
 
 class SCreateToDo(BaseModel):
     title: str
     description: str
+    tags: list[STag] = Field([], max_length=20)
+
+
+class STags(BaseModel):
+    tags: list[STag] = Field(max_length=20)
 
 
 class SToDoList(BaseModel):
@@ -16,3 +31,58 @@ class SToDoList(BaseModel):
     offset: int
     limit: int
     total: int
+    next_cursor: Optional[str] = None
+
+
+class SToDoSearchResult(BaseModel):
+    data: list[SToDo]
+    limit: int
+    next_cursor: Optional[str] = None
+
+
+class SCreateToDoBatch(BaseModel):
+    items: list[SCreateToDo] = Field(min_length=1, max_length=TODOS_MAX_BATCH_SIZE)
+
+
+class SUpdateToDoItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class SUpdateToDoBatch(BaseModel):
+    items: list[SUpdateToDoItem] = Field(min_length=1, max_length=TODOS_MAX_BATCH_SIZE)
+
+
+class SDeleteToDoBatch(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=TODOS_MAX_BATCH_SIZE)
+
+
+class SToDoBatchItem(BaseModel):
+    id: int
+    status: Literal[
+        "created", "updated", "unchanged", "deleted", "not_found", "forbidden"
+    ]
+    data: Optional[SToDo] = None
+
+
+class SToDoBatchResult(BaseModel):
+    results: list[SToDoBatchItem]
+
+
+class SToDoImportError(BaseModel):
+    line: int
+    error: str
+
+
+class SToDoImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: list[SToDoImportError]
+
+
+class SToDoChanges(BaseModel):
+    changed: list[SToDo]
+    deleted: list[int]
+    next_token: str
+    has_more: bool
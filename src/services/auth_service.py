@@ -1,12 +1,19 @@
-from datetime import datetime, timezone
+import secrets
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from passlib.context import CryptContext
 
-from src.config.base_config import get_max_active_sessions
+from src.config.base_config import (
+    get_max_active_sessions,
+    get_password_hash_workers,
+    get_refresh_token_format,
+)
 from src.repositories import UserRepo, TokenRepo
 from src.services.jwt_service import JWTService
+from src.services.user_cache import get_cached_user, cache_user
+from src.utils.worker_pool import WorkerPool
 from src.exceptions import services_exceptions
 from src.dto import (
     UserResponseDTO,
@@ -21,6 +28,15 @@ from src.config.logging_confing import logging  # noqa
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+REFRESH_TOKEN_LIFETIME = timedelta(days=30)
+# 256 random bits, 43 characters once base64url encoded
+OPAQUE_TOKEN_BYTES = 32
+
+# bcrypt releases the GIL, so a few threads keep it off the event loop
+password_hasher = WorkerPool(
+    max_workers=get_password_hash_workers(), thread_name_prefix="password-hasher"
+)
+
 
 def get_password_hash(password: str) -> str:
     """
@@ -43,6 +59,27 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """
+    Generate a password hash in the password hasher pool.
+
+    :param password: str - Plain text password to hash
+    :return: str - Hashed password
+    """
+    return await password_hasher.run(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the password hasher pool.
+
+    :param plain_password: str - Plain text password to verify
+    :param hashed_password: str - Hashed password to compare against
+    :return: bool - True if passwords match, False otherwise
+    """
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
 class AuthService:
     @staticmethod
     async def create_user(
@@ -55,7 +92,7 @@ class AuthService:
         :param user: UserCreateDTO - User DTO containing registration data
         :return: UserResponseDTO - Created user DTO
         """
-        user.password = get_password_hash(user.password)
+        user.password = await get_password_hash_async(user.password)
         return await UserRepo.add_user(session, user)
 
     @staticmethod
@@ -69,40 +106,32 @@ class AuthService:
         :param user: UserLoginDTO - User credentials for login
         :return: Optional[TokenDTO] - Token DTO if authentication successful, None otherwise
         """
-        async with session as s:
-            password_hash = await UserRepo.get_password_hash(
-                session=s, email=user.email
-            )
-
-            if not password_hash or not verify_password(user.password, password_hash):
-                return None
-
-            current_user = await UserRepo.find_by_email(session=s, email=user.email)
-
-            # Create access and refresh tokens
-            access_token = JWTService.create_access_token(current_user.id)
-            refresh_token = JWTService.create_refresh_token(current_user.id)
-            expire_time = JWTService.get_expire_time(refresh_token)
-
-            # Check if user has too many active sessions
-            tokens_count = await TokenRepo.count_tokens_for_user(
-                session=s, user_id=current_user.id
-            )
-            while tokens_count >= get_max_active_sessions():
-                await TokenRepo.delete_oldest_token(session=s, user_id=current_user.id)
-                tokens_count = await TokenRepo.count_tokens_for_user(
-                    session=s, user_id=current_user.id
-                )
-
-            await TokenRepo.add_token(
-                session=s,
-                token=CreateRefreshTokenDTO(
-                    token=refresh_token, user_id=current_user.id, expires_at=expire_time
-                ),
-            )
+        password_hash = await UserRepo.get_password_hash(
+            session=session, email=user.email
+        )
+
+        if not password_hash or not await verify_password_async(
+            user.password, password_hash
+        ):
+            return None
+
+        current_user = await UserRepo.find_by_email(session=session, email=user.email)
+
+        # Create access and refresh tokens
+        access_token = JWTService.create_access_token(current_user.id)
+        refresh_token = AuthService.create_refresh_token(current_user.id)
+
+        # Store the session, evicting the oldest ones over the limit
+        await TokenRepo.add_token_with_limit(
+            session=session,
+            token=refresh_token,
+            max_active=get_max_active_sessions(),
+        )
 
         return TokenDTO(
-            access_token=access_token, refresh_token=refresh_token, token_type="bearer"
+            access_token=access_token,
+            refresh_token=refresh_token.token,
+            token_type="bearer",
         )
 
     @staticmethod
@@ -136,9 +165,36 @@ class AuthService:
         if not user_id:
             raise services_exceptions.NotFoundTokenError("User ID not found")
 
+        user = get_cached_user(int(user_id))
+        if user is not None:
+            return user
+
         user = await UserRepo.find_by_id(session, int(user_id))
+        if user is not None:
+            cache_user(user)
         return user
 
+    @staticmethod
+    def create_refresh_token(user_id: int) -> CreateRefreshTokenDTO:
+        """
+        Issue a refresh token in the format selected by REFRESH_TOKEN_FORMAT.
+
+        Opaque tokens are random strings: nothing is signed or decoded. Either
+        way the expiry is computed once here, never parsed back from the token.
+
+        :param user_id: int - The ID of the user for whom to create the token
+        :return: CreateRefreshTokenDTO - Token with its owner and expiration time
+        """
+        # Whole seconds, like the "exp" claim
+        expires_at = (datetime.now(timezone.utc) + REFRESH_TOKEN_LIFETIME).replace(
+            microsecond=0
+        )
+        if get_refresh_token_format() == "opaque":
+            token = secrets.token_urlsafe(OPAQUE_TOKEN_BYTES)
+        else:
+            token = JWTService.create_refresh_token(user_id, expires_at=expires_at)
+        return CreateRefreshTokenDTO(token=token, user_id=user_id, expires_at=expires_at)
+
     @staticmethod
     async def refresh_token(
         session: AsyncSession, refresh_token: str, user_id: int
@@ -151,20 +207,13 @@ class AuthService:
         :user_id: int - User ID
         :return: Optional[TokenDTO] - New access and refresh tokens
         """
-        async with session as s:
-            old_token = await TokenRepo.check_token_exist(session=s, token=refresh_token)
-            if old_token is None:
-                raise services_exceptions.NotFoundTokenError("Token not found")
-            
-            new_refresh_token = JWTService.create_refresh_token(user_id)
-            new_expire_time = JWTService.get_expire_time(new_refresh_token)
-            new_refresh_token = await TokenRepo.update_token(
-                session=s,
-                old_token=old_token.token,
-                new_token=CreateRefreshTokenDTO(
-                    token=new_refresh_token, user_id=user_id, expires_at=new_expire_time
-                ),
+        new_refresh_token = AuthService.create_refresh_token(user_id)
+        # Only the digest is stored, so the lookup and the rotation are one statement
+        rotated = await TokenRepo.update_token(
+            session=session, old_token=refresh_token, new_token=new_refresh_token
         )
+        if rotated is None:
+            raise services_exceptions.NotFoundTokenError("Token not found")
         new_access_token = JWTService.create_access_token(user_id)
 
         return TokenDTO(
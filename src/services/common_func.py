@@ -1,19 +1,100 @@
-from typing import List
-from operator import itemgetter
-from src.repositories import DTOType
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Any, Tuple, Optional
 
+from src.exceptions import services_exceptions
 
-def sort_dto_list_order_by(
-    dto: DTOType, dto_list: List[DTOType], order_by: str
-) -> List[DTOType]:
+
+def encode_cursor(order_by: str, direction: str, value: Any, id: int) -> str:
+    """
+    Encode the position after a record into an opaque pagination cursor.
+
+    :param order_by: field the list is ordered by
+    :param direction: ordering direction (asc/desc)
+    :param value: value of the order_by field of the last record
+    :param id: ID of the last record
+    :return: url-safe cursor string
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps(
+        {"o": order_by, "d": direction, "v": value, "id": id}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, direction: str) -> Tuple[Any, int]:
+    """
+    Decode a pagination cursor created by encode_cursor.
+
+    :param cursor: cursor string
+    :param order_by: field the list is ordered by, must match the cursor
+    :param direction: ordering direction (asc/desc), must match the cursor
+    :return: (order_by value, id) of the last record of the previous page
+    :raises:
+        NotValidCursorError: If the cursor is malformed or was made for another ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["o"] != order_by or payload["d"] != direction:
+            raise services_exceptions.NotValidCursorError("Cursor order mismatch")
+        value = payload["v"]
+        if order_by in ("id", "sync_version"):
+            value = int(value)
+        elif order_by == "rank":
+            value = float(value)
+        else:
+            value = datetime.fromisoformat(value)
+        return value, int(payload["id"])
+    except services_exceptions.NotValidCursorError:
+        raise
+    except (ValueError, TypeError, KeyError) as e:
+        raise services_exceptions.NotValidCursorError("Invalid cursor") from e
+
+
+def normalize_tags(tags: List[str]) -> List[str]:
     """
-    Sorts a list of DTOs by a given field.
+    Normalize tag names: strip, lowercase, drop empty and duplicate ones.
+
+    :param tags: list of tag names
+    :return: unique normalized tag names in their original order
+    """
+    return list(dict.fromkeys(tag.strip().lower() for tag in tags if tag.strip()))
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Make a weak ETag from the values that identify a version of a resource.
+
+    :param parts: values such as an ID and an update time
+    :return: weak ETag header value
+    """
+    value = ":".join(
+        part.isoformat() if isinstance(part, datetime) else str(part) for part in parts
+    )
+    return f'W/"{hashlib.sha1(value.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match/If-Match header against an ETag.
+
+    Uses the weak comparison (W/ prefixes are ignored), since all ETags
+    of the API are weak.
 
-    :param dto: DTO class
-    :param dto_list: list of DTOs
-    :param order_by: field to sort by
-    :return: sorted list of DTOs
+    :param header: header value: "*" or a comma-separated list of ETags
+    :param etag: current ETag of the resource
+    :return: True if the header matches the ETag
     """
-    dict_list = [dto.model_dump(dto_) for dto_ in dto_list]
-    sorted_list = sorted(dict_list, key=itemgetter(order_by))
-    return [dto(**item) for item in sorted_list]
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in header.split(",")
+    )
@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from typing import Optional
+
+from jose import jwk
+from jose.backends.base import Key
+
+from src.config.base_config import get_auth_data, get_jwt_keys_config
+
+
+# Signed with a private key, verifiable by anyone holding the public JWKS
+ASYMMETRIC_ALGORITHMS = ("ES256", "ES384", "ES512", "RS256", "RS384", "RS512")
+
+
+class KeySet:
+    """
+    Keys used to sign and verify JWTs, indexed by "kid".
+
+    Only the active key signs. Every key verifies, so tokens signed with a
+    previous key stay valid while it is kept in the set.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        keys: dict[Optional[str], Key],
+        active_kid: Optional[str],
+    ):
+        """
+        :param algorithm: str - JWT algorithm shared by all keys
+        :param keys: dict[Optional[str], Key] - keys by kid (None for a shared secret)
+        :param active_kid: Optional[str] - kid of the signing key
+        """
+        if active_kid not in keys:
+            raise ValueError(f"Unknown active JWT key {active_kid!r}")
+        if algorithm in ASYMMETRIC_ALGORITHMS and keys[active_kid].is_public():
+            raise ValueError(f"Active JWT key {active_kid!r} has no private key")
+
+        self.algorithm = algorithm
+        self.keys = keys
+        self.active_kid = active_kid
+        # python-jose verifies asymmetric signatures with public keys only
+        self.verification_keys = {
+            kid: key.public_key() if self.is_asymmetric and not key.is_public() else key
+            for kid, key in keys.items()
+        }
+        self.jwks = json.dumps({"keys": self._public_jwks()}).encode()
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.algorithm in ASYMMETRIC_ALGORITHMS
+
+    @property
+    def signing_key(self) -> Key:
+        return self.keys[self.active_kid]
+
+    @property
+    def headers(self) -> Optional[dict]:
+        """Headers added to signed tokens, so verifiers can pick the key."""
+        if self.active_kid is None:
+            return None
+        return {"kid": self.active_kid}
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Key]:
+        """
+        :param kid: Optional[str] - "kid" header of a token
+        :return: Optional[Key] - key to verify the token with or None if unknown
+        """
+        return self.verification_keys.get(kid)
+
+    def _public_jwks(self) -> list[dict]:
+        if not self.is_asymmetric:
+            return []
+
+        return [
+            {**key.to_dict(), "kid": kid, "use": "sig"}
+            for kid, key in self.verification_keys.items()
+        ]
+
+
+def load_key_set(
+    algorithm: str,
+    secret_key: str,
+    keys_dir: Optional[str] = None,
+    active_kid: Optional[str] = None,
+) -> KeySet:
+    """
+    Build the key set from the settings.
+
+    Asymmetric algorithms read every "<kid>.pem" file of keys_dir. A file
+    may hold a public key only, to keep verifying tokens of a retired key
+    or to publish the next key before it starts signing.
+
+    :param algorithm: str - JWT algorithm
+    :param secret_key: str - shared secret used by HMAC algorithms
+    :param keys_dir: Optional[str] - directory of PEM keys named by kid
+    :param active_kid: Optional[str] - kid of the signing key (default: the only private key)
+    :return: KeySet - loaded key set
+    """
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        if keys_dir is not None:
+            raise ValueError(f"JWT_KEYS_DIR requires an asymmetric ALGORITHM, not {algorithm}")
+        return KeySet(algorithm, {None: jwk.construct(secret_key, algorithm)}, None)
+
+    if keys_dir is None:
+        raise ValueError(f"ALGORITHM {algorithm} requires JWT_KEYS_DIR")
+
+    keys = {
+        path.stem: jwk.construct(path.read_text(), algorithm)
+        for path in sorted(Path(keys_dir).glob("*.pem"))
+    }
+    if active_kid is None:
+        private_kids = [kid for kid, key in keys.items() if not key.is_public()]
+        if len(private_kids) != 1:
+            raise ValueError("Set JWT_ACTIVE_KID to choose the signing key")
+        active_kid = private_kids[0]
+
+    return KeySet(algorithm, keys, active_kid)
+
+
+_key_set: Optional[KeySet] = None
+
+
+def get_key_set() -> KeySet:
+    """
+    Return the key set, loading it from the settings on first use.
+
+    :return: KeySet - current key set
+    """
+    global _key_set
+    if _key_set is None:
+        auth_data = get_auth_data()
+        _key_set = load_key_set(
+            auth_data["algorithm"], auth_data["secret_key"], **get_jwt_keys_config()
+        )
+    return _key_set
+
+
+def set_key_set(key_set: Optional[KeySet]) -> None:
+    """
+    Replace the key set, None reloads it from the settings on next use.
+
+    Clears the verified tokens cache too, so tokens of a removed key stop
+    being accepted right away.
+
+    :param key_set: Optional[KeySet] - new key set
+    :return: None
+    """
+    # jwt_service imports this module
+    from src.services.jwt_service import token_cache
+
+    global _key_set
+    _key_set = key_set
+    token_cache.clear()
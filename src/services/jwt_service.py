@@ -1,8 +1,16 @@
+import hashlib
+import time
 from typing import Optional
 
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
-from src.config.base_config import get_auth_data
+from src.config.base_config import get_token_cache_size
+from src.services.jwt_keys import get_key_set
+from src.utils.cache import TTLCache
+
+
+# Verified payloads keyed by sha256 of the token, each entry expires at "exp"
+token_cache = TTLCache(maxsize=get_token_cache_size(), ttl=0)
 
 
 class JWTService:
@@ -23,17 +31,20 @@ class JWTService:
 
     @staticmethod
     def create_refresh_token(
-        user_id: int, expires_delta: timedelta = timedelta(days=30)
+        user_id: int,
+        expires_delta: timedelta = timedelta(days=30),
+        expires_at: Optional[datetime] = None,
     ) -> str:
         """
         Create a new JWT refresh token for a usr.
 
         :param user_id: int - The ID of the user for whom to create the token
         :param expires_delta: timedelta - Token expiration time (default: 30 days)
+        :param expires_at: Optional[datetime] - Exact expiration time, overrides expires_delta
         :return: str - Encoded JWT token
         """
         data = {"sub": str(user_id), "type": "refresh"}
-        return JWTService._create_token(data, expires_delta)
+        return JWTService._create_token(data, expires_delta, expires_at)
 
 
     @staticmethod
@@ -55,23 +66,29 @@ class JWTService:
 
     @staticmethod
     def _create_token(
-        data: dict, expires_delta: timedelta = timedelta(minutes=30)
+        data: dict,
+        expires_delta: timedelta = timedelta(minutes=30),
+        expires_at: Optional[datetime] = None,
     ) -> str:
         """
         Internal method to create a JWT token with the given data and expiration time.
 
         :param data: dict - Data to encode in the token
         :param expires_delta: timedelta - Token expiration time (default: 30 minutes)
+        :param expires_at: Optional[datetime] - Exact expiration time, overrides expires_delta
         :return: str - Encoded JWT token
         """
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = expires_at or datetime.now(timezone.utc) + expires_delta
         to_encode.update({"exp": expire})
 
-        auth_data = get_auth_data()
+        key_set = get_key_set()
 
         encode_jwt = jwt.encode(
-            to_encode, auth_data["secret_key"], algorithm=auth_data["algorithm"]
+            to_encode,
+            key_set.signing_key,
+            algorithm=key_set.algorithm,
+            headers=key_set.headers,
         )
         return encode_jwt
 
@@ -80,14 +97,28 @@ class JWTService:
         """
         Decode and verify a JWT token.
 
+        Verified payloads are cached until the token expires, so the signature
+        of a token is checked once per process.
+
         :param token: str - JWT token to decode
         :return: Optional[dict] - Decoded token payload or None if token is invalid
         """
-        auth_data = get_auth_data()
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = token_cache.get(cache_key)
+        if payload is not None:
+            return dict(payload)
+
+        key_set = get_key_set()
         try:
-            payload = jwt.decode(
-                token, auth_data["secret_key"], algorithms=[auth_data["algorithm"]]
-            )
-            return payload
+            # Tokens name their signing key, any key of the set may verify them
+            key = key_set.get_verification_key(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                return None
+            payload = jwt.decode(token, key, algorithms=[key_set.algorithm])
         except JWTError:
             return None
+
+        expire = payload.get("exp")
+        if isinstance(expire, (int, float)):
+            token_cache.set(cache_key, payload, ttl=expire - time.time())
+        return dict(payload)
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from src.config.base_config import get_response_cache_config
+from src.dto import CacheStatsDTO
+from src.utils.cache import CacheBackend, MemoryCacheBackend
+
+
+CACHE_BACKENDS = {"memory": MemoryCacheBackend}
+
+
+def make_response_cache(backend: str, maxsize: int, ttl: float) -> CacheBackend:
+    return CACHE_BACKENDS[backend](maxsize=maxsize, ttl=ttl)
+
+
+# Keyed by the ETag of a /todos/my page, which covers the user, the query
+# parameters and the version of the user's todos. Every write to the
+# user's todos bumps that version, so a cached page is never served after
+# a change, whichever process made it.
+response_cache: CacheBackend = make_response_cache(**get_response_cache_config())
+
+
+def set_response_cache_backend(backend: CacheBackend) -> None:
+    """
+    Replace the response cache backend (e.g. with a shared one at startup).
+
+    :param backend: CacheBackend - new backend
+    :return: None
+    """
+    global response_cache
+    response_cache = backend
+
+
+def get_response_cache_stats() -> CacheStatsDTO:
+    return response_cache.stats()
+
+
+async def get_cached_todos_page(etag: str) -> Optional[bytes]:
+    return await response_cache.get(f"todos:my:{etag}")
+
+
+async def cache_todos_page(etag: str, body: bytes) -> None:
+    await response_cache.set(f"todos:my:{etag}", body)
@@ -1,14 +1,47 @@
-from typing import List, Optional, Literal
+import asyncio
+import csv
+import io
+import json
+from typing import List, Optional, Literal, AsyncIterator, Iterable, Iterator, Tuple
 
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.base_config import get_todos_total_strategy, get_todos_max_batch_size
 from src.repositories.todo_repo import TodoRepo
-from src.dto import ToDoDTO, ToDoUpdateDTO
-from src.services.common_func import sort_dto_list_order_by
+from src.repositories.tag_repo import TagRepo
+from src.dto import (
+    ToDoDTO,
+    ToDoUpdateDTO,
+    ToDoPageDTO,
+    ToDoSearchPageDTO,
+    ToDoBatchUpdateDTO,
+    ToDoBatchResultDTO,
+    ToDoImportErrorDTO,
+    ToDoImportResultDTO,
+    ToDoChangesDTO,
+)
+from src.exceptions import services_exceptions
+from src.services.common_func import (
+    encode_cursor,
+    decode_cursor,
+    normalize_tags,
+    make_etag,
+    etag_matches,
+)
 
 from src.config.logging_confing import logging # noqa
 
 
+EXPORT_BATCH_SIZE = 500
+EXPORT_FIELDS = ["id", "title", "description", "created_at", "updated_at"]
+IMPORT_CHUNK_SIZE = 5000
+# Only the first errors are reported, the rest are just counted
+MAX_IMPORT_ERRORS = 100
+
+logger = logging.getLogger(__name__)
+
+
 class ToDoService:
     @staticmethod
     async def get_todo_by_id(session: AsyncSession, todo_id: int) -> Optional[ToDoDTO]:
@@ -19,7 +52,53 @@ class ToDoService:
         :param todo_id: int - ID of the todo item to retrieve
         :return: Optional[ToDoDTO] - Todo item DTO or None if not found
         """
-        return await TodoRepo.find_by_id(session, id=todo_id)
+        todo = await TodoRepo.find_by_id(session, id=todo_id)
+        if todo is None:
+            return None
+        return (await ToDoService._attach_tags(session, [todo]))[0]
+
+    @staticmethod
+    def get_todo_etag(todo: ToDoDTO) -> str:
+        """
+        Get the weak ETag of a todo item, derived from its ID and update time.
+
+        :param todo: ToDoDTO - Todo item DTO
+        :return: str - ETag header value
+        """
+        return make_etag(todo.id, todo.updated_at)
+
+    @staticmethod
+    async def find_todo_etag(session: AsyncSession, todo_id: int) -> Optional[str]:
+        """
+        Get the ETag of a todo item without loading it (for conditional GETs).
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - ID of the todo item
+        :return: Optional[str] - ETag header value or None if not found
+        """
+        row = await TodoRepo.get_todo_owner_and_updated_at(session, todo_id=todo_id)
+        if row is None:
+            return None
+        return make_etag(todo_id, row[1])
+
+    @staticmethod
+    async def find_user_todos_etag(
+        session: AsyncSession, user_id: int, params: str
+    ) -> str:
+        """
+        Get the ETag of a listing of a user's todo items.
+
+        It changes whenever any of the user's todo items is created, updated,
+        deleted or retagged, so a listing can be revalidated with one
+        primary key lookup.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user whose todos are listed
+        :param params: str - Serialized query parameters of the listing
+        :return: str - ETag header value
+        """
+        version = await TodoRepo.get_todos_version(session, user_id=user_id)
+        return make_etag("todos", user_id, version, params)
 
     @staticmethod
     async def get_all_todos(
@@ -27,7 +106,12 @@ class ToDoService:
         offset: int = 0,
         limit: int = 10,
         order_by: Literal["created_at", "updated_at", "id"] = "id",
-    ) -> List[ToDoDTO]:
+        direction: Literal["asc", "desc"] = "asc",
+        pagination: Literal["offset", "cursor"] = "offset",
+        cursor: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
+    ) -> ToDoPageDTO:
         """
         Get all todo items with pagination and sorting.
 
@@ -35,10 +119,43 @@ class ToDoService:
         :param offset: int - Number of records to skip (default: 0)
         :param limit: int - Maximum number of records to return (default: 10)
         :param order_by: str - Field to sort by (created_at/updated_at/id, default: id)
-        :return: List[ToDoDTO] - List of todo item DTOs
+        :param direction: str - Sort direction (asc/desc, default: asc)
+        :param pagination: str - offset or cursor (keyset) pagination (default: offset)
+        :param cursor: Optional[str] - next_cursor of the previous page, implies cursor pagination
+        :param tags: Optional[List[str]] - Only todo items with these tags
+        :param tags_match: str - Match any or all of the tags (default: any)
+        :return: ToDoPageDTO - Page of todo item DTOs
+        :raises:
+            NotValidCursorError: If the cursor is malformed
         """
-        todos = await TodoRepo.find_all(session, offset=offset, limit=limit)
-        return sort_dto_list_order_by(dto=ToDoDTO, dto_list=todos, order_by=order_by)
+        tags = normalize_tags(tags or [])
+        total = await ToDoService.count_todos(session, tags=tags, tags_match=tags_match)
+
+        if pagination == "offset" and cursor is None:
+            todos = await TodoRepo.find_all(
+                session,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                direction=direction,
+                tags=tags,
+                tags_match=tags_match,
+            )
+            todos = await ToDoService._attach_tags(session, todos)
+            return ToDoPageDTO(data=todos, total=total)
+
+        after = decode_cursor(cursor, order_by, direction) if cursor else None
+        todos = await TodoRepo.find_all(
+            session,
+            limit=limit,
+            order_by=order_by,
+            direction=direction,
+            after=after,
+            tags=tags,
+            tags_match=tags_match,
+        )
+        todos = await ToDoService._attach_tags(session, todos)
+        return ToDoService._make_cursor_page(todos, total, limit, order_by, direction)
 
     @staticmethod
     async def get_all_todos_by_user_id(
@@ -47,7 +164,12 @@ class ToDoService:
         offset: int = 0,
         limit: int = 10,
         order_by: Literal["created_at", "updated_at", "id"] = "id",
-    ) -> List[ToDoDTO]:
+        direction: Literal["asc", "desc"] = "asc",
+        pagination: Literal["offset", "cursor"] = "offset",
+        cursor: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
+    ) -> ToDoPageDTO:
         """
         Get all todo items for a specific user with pagination and sorting.
 
@@ -56,13 +178,168 @@ class ToDoService:
         :param offset: int - Number of records to skip (default: 0)
         :param limit: int - Maximum number of records to return (default: 10)
         :param order_by: str - Field to sort by (created_at/updated_at/id, default: id)
-        :return: List[ToDoDTO] - List of todo item DTOs
+        :param direction: str - Sort direction (asc/desc, default: asc)
+        :param pagination: str - offset or cursor (keyset) pagination (default: offset)
+        :param cursor: Optional[str] - next_cursor of the previous page, implies cursor pagination
+        :param tags: Optional[List[str]] - Only todo items with these tags
+        :param tags_match: str - Match any or all of the tags (default: any)
+        :return: ToDoPageDTO - Page of todo item DTOs
+        :raises:
+            NotValidCursorError: If the cursor is malformed
         """
+        tags = normalize_tags(tags or [])
+        total = await ToDoService.count_todos(
+            session, user_id=user_id, tags=tags, tags_match=tags_match
+        )
+
+        if pagination == "offset" and cursor is None:
+            todos = await TodoRepo.find_all_todos_by_user_id(
+                session=session,
+                user_id=user_id,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                direction=direction,
+                tags=tags,
+                tags_match=tags_match,
+            )
+            todos = await ToDoService._attach_tags(session, todos)
+            return ToDoPageDTO(data=todos, total=total)
+
+        after = decode_cursor(cursor, order_by, direction) if cursor else None
         todos = await TodoRepo.find_all_todos_by_user_id(
-            session=session, user_id=user_id, offset=offset, limit=limit
+            session=session,
+            user_id=user_id,
+            limit=limit,
+            order_by=order_by,
+            direction=direction,
+            after=after,
+            tags=tags,
+            tags_match=tags_match,
+        )
+        todos = await ToDoService._attach_tags(session, todos)
+        return ToDoService._make_cursor_page(todos, total, limit, order_by, direction)
+
+    @staticmethod
+    async def count_todos(
+        session: AsyncSession,
+        user_id: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        tags_match: Literal["any", "all"] = "any",
+    ) -> int:
+        """
+        Count todo items using the configured TODOS_TOTAL_STRATEGY.
+
+        exact - COUNT(*) for both listings.
+        counter - per-user counter for a user's listing, COUNT(*) for all todos.
+        estimate - per-user counter for a user's listing, planner estimate for all todos.
+
+        Counters and estimates know nothing about tags, so a tag filter is
+        always counted with COUNT(*).
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: Optional[int] - ID of the user or None to count all todos
+        :param tags: Optional[List[str]] - Only count todo items with these tags
+        :param tags_match: str - Match any or all of the tags (default: any)
+        :return: int - Number of todo items
+        """
+        if tags:
+            return await TodoRepo.count_todos(
+                session, user_id=user_id, tags=tags, tags_match=tags_match
+            )
+
+        strategy = get_todos_total_strategy()
+
+        if strategy == "exact":
+            return await TodoRepo.count_todos(session, user_id=user_id)
+
+        if user_id is not None:
+            return await TodoRepo.get_todos_counter(session, user_id=user_id)
+
+        if strategy == "estimate":
+            return await TodoRepo.estimate_todos_count(session)
+        return await TodoRepo.count_todos(session)
+
+    @staticmethod
+    async def search_todos(
+        session: AsyncSession,
+        user_id: int,
+        query: str,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> ToDoSearchPageDTO:
+        """
+        Full-text search in a user's todo items, best matches first.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user whose todos to search
+        :param query: str - Search text
+        :param limit: int - Maximum number of records to return (default: 10)
+        :param cursor: Optional[str] - next_cursor of the previous page
+        :return: ToDoSearchPageDTO - Page of matching todo item DTOs
+        :raises:
+            NotValidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor, "rank", "desc") if cursor else None
+        results = await TodoRepo.search_todos(
+            session=session, user_id=user_id, query=query, limit=limit, after=after
         )
 
-        return sort_dto_list_order_by(dto=ToDoDTO, dto_list=todos, order_by=order_by)
+        next_cursor = None
+        if len(results) == limit:
+            last, rank = results[-1]
+            next_cursor = encode_cursor("rank", "desc", rank, last.id)
+        todos = await ToDoService._attach_tags(session, [todo for todo, _ in results])
+        return ToDoSearchPageDTO(data=todos, next_cursor=next_cursor)
+
+    @staticmethod
+    async def get_todo_changes(
+        session: AsyncSession,
+        user_id: int,
+        since: Optional[str] = None,
+        limit: int = 100,
+    ) -> ToDoChangesDTO:
+        """
+        Get a user's todo items changed and deleted since a sync token.
+
+        Changes are ordered by the version of the user's todos they were made
+        at. Versions are given out under a lock on the user row, so a change
+        can never appear behind a token that was already handed out.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user whose todos are synced
+        :param since: Optional[str] - next_token of the previous sync (None for a full sync)
+        :param limit: int - Maximum number of changes to return (default: 100)
+        :return: ToDoChangesDTO - Changed todo items, deleted todo IDs and the next token
+        :raises:
+            NotValidCursorError: If the token is malformed
+        """
+        after = decode_cursor(since, "sync_version", "asc") if since else (0, 0)
+        changed, deleted = await TodoRepo.find_changes(
+            session=session, user_id=user_id, after=after, limit=limit
+        )
+
+        changes = sorted(
+            [((todo.sync_version, todo.id), todo) for todo in changed]
+            + [(position, None) for position in deleted],
+            key=lambda change: change[0],
+        )
+        has_more = (
+            len(changes) > limit or len(changed) == limit or len(deleted) == limit
+        )
+        changes = changes[:limit]
+        if changes:
+            after = changes[-1][0]
+
+        todos = await ToDoService._attach_tags(
+            session, [todo for _, todo in changes if todo is not None]
+        )
+        return ToDoChangesDTO(
+            changed=todos,
+            deleted=[todo_id for (_, todo_id), todo in changes if todo is None],
+            next_token=encode_cursor("sync_version", "asc", *after),
+            has_more=has_more,
+        )
 
     @staticmethod
     async def create_todo(
@@ -70,6 +347,7 @@ class ToDoService:
         user_id: int,
         title: str,
         description: str,
+        tags: Optional[List[str]] = None,
     ) -> ToDoDTO:
         """
         Create a new todo item.
@@ -78,11 +356,16 @@ class ToDoService:
         :param user_id: int - ID of the user creating the todo
         :param title: str - Title of the todo item
         :param description: str - Description of the todo item
+        :param tags: Optional[List[str]] - Tags of the todo item
         :return: ToDoDTO - Created todo item DTO
         """
         todo = await TodoRepo.create_todo(
             session=session, user_id=user_id, title=title, description=description
         )
+        if tags:
+            todo.tags = await TagRepo.set_todo_tags(
+                session, todo.id, user_id, normalize_tags(tags)
+            )
         return todo
 
     @staticmethod
@@ -90,30 +373,345 @@ class ToDoService:
         session: AsyncSession,
         todo_id: int,
         new_todo: ToDoUpdateDTO,
+        user_id: int,
+        tags: Optional[List[str]] = None,
+        if_match: Optional[str] = None,
     ) -> ToDoDTO:
         """
-        Update an existing todo item.
+        Update an existing todo item owned by the user.
+
+        With if_match the row is locked and its current ETag checked first,
+        so a client cannot overwrite a change it has not seen.
 
         :param session: AsyncSession - SQLAlchemy async session
         :param todo_id: int - ID of the todo item to update
         :param new_todo: ToDoUpdateDTO - New data for the todo item
+        :param user_id: int - ID of the user performing the update
+        :param tags: Optional[List[str]] - New tags of the todo item (None keeps the current ones)
+        :param if_match: Optional[str] - If-Match header value (None skips the check)
         :return: ToDoDTO - Updated todo item DTO
+        :raises:
+            NotFoundToDoError: If the todo item does not exist
+
+            ForbiddenToDoError: If the todo item belongs to another user
+
+            PreconditionFailedError: If if_match does not match the current ETag
         """
-        todo = await TodoRepo.update_todo(
-            session=session, todo_id=todo_id, new_todo_data=new_todo
+        if if_match is not None:
+            # User row first, then the todo: the lock order of every todo write
+            await TodoRepo.lock_user_todos(session, user_id)
+            row = await TodoRepo.get_todo_owner_and_updated_at(
+                session, todo_id=todo_id, for_update=True
+            )
+            if row is None:
+                raise services_exceptions.NotFoundToDoError("Todo not found")
+            owner_id, updated_at = row
+            if owner_id != user_id:
+                raise services_exceptions.ForbiddenToDoError("Todo belongs to another user")
+            if not etag_matches(if_match, make_etag(todo_id, updated_at)):
+                raise services_exceptions.PreconditionFailedError("Todo was changed")
+
+        todo = await TodoRepo.update_user_todo(
+            session=session, todo_id=todo_id, user_id=user_id, new_todo_data=new_todo
         )
-        return todo
+        if todo is None:
+            await ToDoService._raise_not_found_or_forbidden(session, todo_id)
+        if tags is not None:
+            todo.tags = await TagRepo.set_todo_tags(
+                session, todo_id, user_id, normalize_tags(tags)
+            )
+            return todo
+        return (await ToDoService._attach_tags(session, [todo]))[0]
 
     @staticmethod
-    async def delete_todo(session: AsyncSession, todo_id: int) -> None:
+    async def delete_todo(session: AsyncSession, todo_id: int, user_id: int) -> None:
         """
-        Delete a todo item by its ID.
+        Delete a todo item owned by the user.
 
         :param session: AsyncSession - SQLAlchemy async session
         :param todo_id: int - ID of the todo item to delete
+        :param user_id: int - ID of the user performing the delete
         :return: None
+        :raises:
+            NotFoundToDoError: If the todo item does not exist
+
+            ForbiddenToDoError: If the todo item belongs to another user
+        """
+        deleted = await TodoRepo.delete_user_todo(
+            session=session, todo_id=todo_id, user_id=user_id
+        )
+        if not deleted:
+            await ToDoService._raise_not_found_or_forbidden(session, todo_id)
+        return None
+
+    @staticmethod
+    async def set_todo_tags(
+        session: AsyncSession, todo_id: int, user_id: int, tags: List[str]
+    ) -> List[str]:
+        """
+        Replace the tags of a todo item owned by the user.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - ID of the todo item
+        :param user_id: int - ID of the user performing the change
+        :param tags: List[str] - New tags of the todo item
+        :return: List[str] - Normalized tags of the todo item
+        :raises:
+            NotFoundToDoError: If the todo item does not exist
+
+            ForbiddenToDoError: If the todo item belongs to another user
+        """
+        owner_id = await TodoRepo.get_todo_owner_id(session=session, todo_id=todo_id)
+        if owner_id is None:
+            raise services_exceptions.NotFoundToDoError("Todo not found")
+        if owner_id != user_id:
+            raise services_exceptions.ForbiddenToDoError("Todo belongs to another user")
+        # Lock the user row before writing the tags, like every todo write
+        await TodoRepo.lock_user_todos(session, user_id)
+        new_tags = await TagRepo.set_todo_tags(
+            session, todo_id, user_id, normalize_tags(tags)
+        )
+        await TodoRepo.touch_todo(session, todo_id=todo_id, user_id=user_id)
+        return new_tags
+
+    @staticmethod
+    async def create_todos(
+        session: AsyncSession,
+        user_id: int,
+        todos: List[ToDoUpdateDTO],
+        tags: Optional[List[List[str]]] = None,
+    ) -> List[ToDoBatchResultDTO]:
+        """
+        Create many todo items in one statement.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user creating the todos
+        :param todos: List[ToDoUpdateDTO] - Title and description of each todo
+        :param tags: Optional[List[List[str]]] - Tags of each todo, in the order of todos
+        :return: List[ToDoBatchResultDTO] - One result per item, in request order
+        :raises BatchTooLargeError: If there are more items than TODOS_MAX_BATCH_SIZE
+        """
+        ToDoService._check_batch_size(len(todos))
+        created = await TodoRepo.create_todos(
+            session=session, user_id=user_id, todos=todos
+        )
+        if tags:
+            for todo, todo_tags in zip(created, tags):
+                todo.tags = sorted(normalize_tags(todo_tags))
+            await TagRepo.add_todos_tags(
+                session, user_id, {todo.id: todo.tags for todo in created}
+            )
+        return [
+            ToDoBatchResultDTO(id=todo.id, status="created", todo=todo)
+            for todo in created
+        ]
+
+    @staticmethod
+    async def update_todos(
+        session: AsyncSession, user_id: int, todos: List[ToDoBatchUpdateDTO]
+    ) -> List[ToDoBatchResultDTO]:
+        """
+        Update many todo items owned by the user in one statement.
+
+        If an ID is repeated, its last item wins. Items without new data are
+        not written and get the "unchanged" status if the user owns the todo.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user performing the update
+        :param todos: List[ToDoBatchUpdateDTO] - Todo IDs with their new data
+        :return: List[ToDoBatchResultDTO] - One result per item, in request order
+        :raises BatchTooLargeError: If there are more items than TODOS_MAX_BATCH_SIZE
+        """
+        ToDoService._check_batch_size(len(todos))
+        unique_todos = {todo.id: todo for todo in todos}
+        changes = [
+            todo
+            for todo in unique_todos.values()
+            if todo.title is not None or todo.description is not None
+        ]
+        updated = await TodoRepo.update_user_todos(
+            session=session, user_id=user_id, todos=changes
+        )
+        updated = await ToDoService._attach_tags(session, updated)
+        updated_by_id = {todo.id: todo for todo in updated}
+        unchanged_ids = list(unique_todos.keys() - {todo.id for todo in changes})
+        statuses = {}
+        if unchanged_ids:
+            owned_ids = await TodoRepo.find_existing_ids(
+                session, unchanged_ids, user_id=user_id
+            )
+            statuses = dict.fromkeys(owned_ids, "unchanged")
+        statuses.update(
+            await ToDoService._get_missing_statuses(
+                session,
+                [id for id in unique_todos if id not in updated_by_id and id not in statuses],
+            )
+        )
+        return [
+            ToDoBatchResultDTO(id=todo.id, status="updated", todo=updated_by_id[todo.id])
+            if todo.id in updated_by_id
+            else ToDoBatchResultDTO(id=todo.id, status=statuses[todo.id])
+            for todo in todos
+        ]
+
+    @staticmethod
+    async def delete_todos(
+        session: AsyncSession, user_id: int, todo_ids: List[int]
+    ) -> List[ToDoBatchResultDTO]:
+        """
+        Delete many todo items owned by the user in one statement.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user performing the delete
+        :param todo_ids: List[int] - IDs of the todo items to delete
+        :return: List[ToDoBatchResultDTO] - One result per ID, in request order
+        :raises BatchTooLargeError: If there are more IDs than TODOS_MAX_BATCH_SIZE
+        """
+        ToDoService._check_batch_size(len(todo_ids))
+        unique_ids = list(dict.fromkeys(todo_ids))
+        deleted = set(
+            await TodoRepo.delete_user_todos(
+                session=session, user_id=user_id, todo_ids=unique_ids
+            )
+        )
+        missing = await ToDoService._get_missing_statuses(
+            session, [id for id in unique_ids if id not in deleted]
+        )
+        return [
+            ToDoBatchResultDTO(id=id, status="deleted" if id in deleted else missing[id])
+            for id in todo_ids
+        ]
+
+    @staticmethod
+    async def export_todos(
+        session: AsyncSession, user_id: int, format: Literal["ndjson", "csv"]
+    ) -> AsyncIterator[str]:
+        """
+        Export all todo items of a user as NDJSON or CSV text chunks.
+
+        Rows are read through a server-side cursor and formatted one batch at
+        a time, so memory does not grow with the number of todo items.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user whose todo items are exported
+        :param format: str - ndjson or csv
+        :return: AsyncIterator[str] - Chunks of the export (CSV starts with a header)
+        """
+        if format == "csv":
+            yield ToDoService._format_csv([], header=True)
+
+        batches = TodoRepo.stream_todos_by_user_id(
+            session=session, user_id=user_id, batch_size=EXPORT_BATCH_SIZE
+        )
+        async for todos in batches:
+            if format == "csv":
+                yield ToDoService._format_csv(todos)
+            else:
+                yield ToDoService._format_ndjson(todos)
+
+    @staticmethod
+    async def import_todos(
+        session: AsyncSession,
+        user_id: int,
+        lines: Iterable[str],
+        format: Literal["ndjson", "csv"],
+    ) -> ToDoImportResultDTO:
+        """
+        Import todo items for a user from NDJSON or CSV lines.
+
+        Lines are parsed and validated one at a time and written in chunks of
+        IMPORT_CHUNK_SIZE, so memory does not grow with the size of the input.
+        Reading and validating a chunk runs in a worker thread, since lines may
+        come from a file on disk. Invalid rows are skipped and reported, valid
+        ones are still imported.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param user_id: int - ID of the user the todo items are imported for
+        :param lines: Iterable[str] - Input lines (CSV must start with a title,description header)
+        :param format: str - ndjson or csv
+        :return: ToDoImportResultDTO - Number of imported and failed rows with the first errors
+        """
+        rows = ToDoService._parse_import_lines(lines, format)
+        imported = 0
+        errors = []
+        failed = 0
+        exhausted = False
+        while not exhausted:
+            chunk, chunk_errors, chunk_failed, exhausted = await asyncio.to_thread(
+                ToDoService._read_import_chunk, rows, MAX_IMPORT_ERRORS - len(errors)
+            )
+            failed += chunk_failed
+            errors.extend(chunk_errors)
+            imported += await TodoRepo.copy_todos(session, user_id, chunk)
+            if not exhausted:
+                logger.info("Import for user %s: %s todos written", user_id, imported)
+
+        logger.info(
+            "Import for user %s finished: %s imported, %s failed",
+            user_id,
+            imported,
+            failed,
+        )
+        return ToDoImportResultDTO(imported=imported, failed=failed, errors=errors)
+
+    @staticmethod
+    def _read_import_chunk(
+        rows: Iterator[Tuple[int, object]], max_errors: int
+    ) -> Tuple[List[ToDoUpdateDTO], List[ToDoImportErrorDTO], int, bool]:
+        """
+        Internal method to validate rows until IMPORT_CHUNK_SIZE of them are valid.
+
+        :param rows: Iterator[Tuple[int, object]] - result of _parse_import_lines
+        :param max_errors: int - maximum number of errors to report
+        :return: Tuple - valid todos, first errors, number of invalid rows and
+            whether the rows are exhausted
+        """
+        chunk = []
+        errors = []
+        failed = 0
+        for line, data in rows:
+            try:
+                if isinstance(data, ValueError):
+                    raise data
+                chunk.append(ToDoUpdateDTO.model_validate(data))
+            except ValueError as e:
+                failed += 1
+                if len(errors) < max_errors:
+                    errors.append(
+                        ToDoImportErrorDTO(line=line, error=_format_import_error(e))
+                    )
+                continue
+
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                return chunk, errors, failed, False
+        return chunk, errors, failed, True
+
+    @staticmethod
+    def _parse_import_lines(
+        lines: Iterable[str], format: Literal["ndjson", "csv"]
+    ) -> Iterator[Tuple[int, object]]:
+        """
+        Internal method to turn input lines into (line number, row data) pairs.
+
+        Row data is a dict, or a ValueError when the line cannot be parsed.
+
+        :param lines: Iterable[str] - Input lines
+        :param format: str - ndjson or csv
+        :return: Iterator[Tuple[int, object]] - Line number and row data
         """
-        await TodoRepo.delete_by_id(session=session, id=todo_id)
+        if format == "csv":
+            reader = csv.DictReader(lines)
+            for row in reader:
+                yield reader.line_num, {k: v for k, v in row.items() if k is not None}
+            return
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, e
 
     @staticmethod
     async def check_todo_owner(
@@ -129,3 +727,115 @@ class ToDoService:
         """
         owner_id = await TodoRepo.get_todo_owner_id(session=session, todo_id=todo_id)
         return owner_id == user_id
+
+    @staticmethod
+    async def _raise_not_found_or_forbidden(session: AsyncSession, todo_id: int) -> None:
+        """
+        Internal method to tell why an ownership-checked write matched no row.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_id: int - ID of the todo item
+        :raises:
+            NotFoundToDoError: If the todo item does not exist
+
+            ForbiddenToDoError: If the todo item exists (so it belongs to another user)
+        """
+        owner_id = await TodoRepo.get_todo_owner_id(session=session, todo_id=todo_id)
+        if owner_id is None:
+            raise services_exceptions.NotFoundToDoError("Todo not found")
+        raise services_exceptions.ForbiddenToDoError("Todo belongs to another user")
+
+    @staticmethod
+    async def _attach_tags(
+        session: AsyncSession, todos: List[ToDoDTO]
+    ) -> List[ToDoDTO]:
+        """
+        Internal method to load the tags of a page of todo items in one query.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todos: List[ToDoDTO] - Todo items
+        :return: List[ToDoDTO] - The same todo items with tags filled in
+        """
+        tags = await TagRepo.find_tags_by_todo_ids(session, [todo.id for todo in todos])
+        for todo in todos:
+            todo.tags = tags.get(todo.id, [])
+        return todos
+
+    @staticmethod
+    def _check_batch_size(size: int) -> None:
+        """
+        Internal method to reject batches above TODOS_MAX_BATCH_SIZE.
+
+        :param size: int - Number of items in the batch
+        :raises BatchTooLargeError: If the batch is too large
+        """
+        max_size = get_todos_max_batch_size()
+        if size > max_size:
+            raise services_exceptions.BatchTooLargeError(
+                f"Batch has {size} items, the maximum is {max_size}"
+            )
+
+    @staticmethod
+    async def _get_missing_statuses(
+        session: AsyncSession, todo_ids: List[int]
+    ) -> dict[int, str]:
+        """
+        Internal method to tell why ownership-checked batch writes skipped IDs.
+
+        :param session: AsyncSession - SQLAlchemy async session
+        :param todo_ids: List[int] - IDs that matched no owned row
+        :return: dict[int, str] - "forbidden" for existing IDs, "not_found" otherwise
+        """
+        existing = set(await TodoRepo.find_existing_ids(session, todo_ids))
+        return {
+            id: "forbidden" if id in existing else "not_found" for id in todo_ids
+        }
+
+    @staticmethod
+    def _format_ndjson(todos: List[ToDoDTO]) -> str:
+        return "".join(
+            json.dumps(todo.model_dump(mode="json", include=set(EXPORT_FIELDS))) + "\n"
+            for todo in todos
+        )
+
+    @staticmethod
+    def _format_csv(todos: List[ToDoDTO], header: bool = False) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if header:
+            writer.writerow(EXPORT_FIELDS)
+        for todo in todos:
+            data = todo.model_dump(mode="json")
+            writer.writerow([data[field] for field in EXPORT_FIELDS])
+        return buffer.getvalue()
+
+    @staticmethod
+    def _make_cursor_page(
+        todos: List[ToDoDTO], total: int, limit: int, order_by: str, direction: str
+    ) -> ToDoPageDTO:
+        """
+        Internal method to wrap a keyset page and build the cursor of the next one.
+
+        :param todos: List[ToDoDTO] - Todo items of the current page
+        :param total: int - Total number of todo items
+        :param limit: int - Page size
+        :param order_by: str - Field the page is ordered by
+        :param direction: str - Sort direction of the page
+        :return: ToDoPageDTO - Page with next_cursor (None on the last page)
+        """
+        next_cursor = None
+        if len(todos) == limit:
+            last = todos[-1]
+            next_cursor = encode_cursor(
+                order_by, direction, getattr(last, order_by), last.id
+            )
+        return ToDoPageDTO(data=todos, total=total, next_cursor=next_cursor)
+
+
+def _format_import_error(error: ValueError) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in e['loc']) or 'row'}: {e['msg']}"
+            for e in error.errors()
+        )
+    return str(error)
@@ -0,0 +1,45 @@
+import asyncio
+
+from src.db import session_scope
+from src.repositories.token_repo import TokenRepo
+
+from src.config.logging_confing import logging  # noqa
+
+
+logger = logging.getLogger(__name__)
+
+
+async def purge_expired_tokens(batch_size: int) -> int:
+    """
+    Delete all expired refresh tokens, one short transaction per batch.
+
+    :param batch_size: int - tokens deleted per transaction
+    :return: int - number of deleted tokens
+    """
+    purged = 0
+    while True:
+        async with session_scope() as session:
+            deleted = await TokenRepo.delete_expired_tokens(session, batch_size)
+        purged += deleted
+        if deleted < batch_size:
+            break
+    logger.info("Purged %s expired refresh tokens", purged)
+    return purged
+
+
+async def run_token_reaper(interval: float, batch_size: int) -> None:
+    """
+    Purge expired refresh tokens every interval seconds until cancelled.
+
+    A failed run is logged and retried at the next interval.
+
+    :param interval: float - seconds between runs
+    :param batch_size: int - tokens deleted per transaction
+    :return: None
+    """
+    while True:
+        try:
+            await purge_expired_tokens(batch_size)
+        except Exception:
+            logger.exception("Expired refresh token purge failed")
+        await asyncio.sleep(interval)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from sqlalchemy import event
+
+from src.config.base_config import get_user_cache_config
+from src.dto import UserResponseDTO
+from src.models import UserModel
+from src.utils.cache import TTLCache
+
+
+# Keyed by user id. Each worker process has its own copy, so a change made
+# elsewhere becomes visible here after at most USER_CACHE_TTL seconds.
+user_cache = TTLCache(**get_user_cache_config())
+
+
+def get_cached_user(user_id: int) -> Optional[UserResponseDTO]:
+    return user_cache.get(user_id)
+
+
+def cache_user(user: UserResponseDTO) -> None:
+    user_cache.set(user.id, user)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user from the cache. Call it whenever a user is changed or deleted.
+
+    :param user_id: int - User ID
+    :return: None
+    """
+    user_cache.delete(user_id)
+
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_on_change(mapper, connection, target: UserModel) -> None:
+    invalidate_cached_user(target.id)
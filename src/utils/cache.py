@@ -0,0 +1,150 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from src.dto import CacheStatsDTO
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded in-process LRU cache whose entries expire after a TTL.
+
+    Not shared between worker processes, so cached values may be stale for
+    at most ttl seconds after a change made by another process.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        :param maxsize: int - maximum number of entries, 0 disables the cache
+        :param ttl: float - default time to live of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return a cached value and mark it as recently used.
+
+        :param key: Hashable - cache key
+        :param default: Any - value returned on a miss
+        :return: Any - cached value or default
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        :param key: Hashable - cache key
+        :param value: Any - value to store
+        :param ttl: Optional[float] - time to live in seconds (default: cache ttl)
+        :return: None
+        """
+        if self.maxsize <= 0:
+            return None
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return None
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return None
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> CacheStatsDTO:
+        lookups = self.hits + self.misses
+        return CacheStatsDTO(
+            size=len(self._data),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=self.hits / lookups if lookups else 0.0,
+        )
+
+
+class CacheBackend(ABC):
+    """
+    Async key-value store for cached responses.
+
+    Implement it to keep responses outside the process (e.g. in Redis),
+    so all workers share the cache.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        :param key: str - cache key
+        :return: Optional[bytes] - cached value or None on a miss
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        :param key: str - cache key
+        :param value: bytes - value to store
+        :param ttl: Optional[float] - time to live in seconds (default: backend ttl)
+        :return: None
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> CacheStatsDTO: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process cache backend on top of TTLCache."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> CacheStatsDTO:
+        return self._cache.stats()
@@ -0,0 +1,90 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.dto import WorkerPoolStatsDTO
+
+
+class WorkerPool:
+    """
+    Runs blocking, CPU-bound callables (e.g. bcrypt) off the event loop.
+
+    At most max_workers calls run at once; the rest wait on the event loop,
+    so "waiting" is the queue depth of the pool.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = ""):
+        """
+        :param max_workers: int - maximum number of concurrently running calls
+        :param thread_name_prefix: str - name prefix of the worker threads
+        """
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self.running = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+        return self._semaphore
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.thread_name_prefix,
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func(*args) in a worker thread and return its result.
+
+        :param func: Callable - blocking function to run
+        :param args: Any - positional arguments for func
+        :return: Any - result of func
+        """
+        semaphore = self._get_semaphore()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), func, *args)
+        # The slot is freed when the thread is done, not when the caller gives
+        # up: a cancelled caller must not let more calls into the executor
+        future.add_done_callback(lambda done: self._release(semaphore, done))
+        return await asyncio.shield(future)
+
+    def _release(self, semaphore: asyncio.Semaphore, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            # Mark the exception as retrieved when the caller was cancelled
+            future.exception()
+        self.running -= 1
+        self.completed += 1
+        semaphore.release()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> WorkerPoolStatsDTO:
+        return WorkerPoolStatsDTO(
+            max_workers=self.max_workers,
+            running=self.running,
+            waiting=self.waiting,
+            max_waiting=self.max_waiting,
+            completed=self.completed,
+        )
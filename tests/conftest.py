@@ -9,10 +9,25 @@ from fastapi.testclient import TestClient
 from src.app import app
 from src.db.database import ModelBase, get_db_session
 from src.services.auth_service import get_password_hash
+from src.services.user_cache import user_cache
+from src.services.jwt_service import token_cache
+from src.services.response_cache import make_response_cache, set_response_cache_backend
+from src.config.base_config import get_response_cache_config
 from src.models import ToDoModel, UserModel, RefreshTokenModel
+from src.repositories.token_repo import hash_token
 from src.config.logging_confing import logging  # noqa
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    user_cache.clear()
+    token_cache.clear()
+    set_response_cache_backend(make_response_cache(**get_response_cache_config()))
+    yield
+    user_cache.clear()
+    token_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def db_session():
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
@@ -26,6 +41,7 @@ async def db_session():
                 name="test_user",
                 email="test@example.com",
                 password="hashed_password",
+                todos_count=2,
             ),
             ToDoModel(
                 title="First title",
@@ -74,7 +90,7 @@ async def test_user(db_session: AsyncSession):
 @pytest_asyncio.fixture
 async def test_user_token(db_session: AsyncSession):
     token = RefreshTokenModel(
-        token="test_token",
+        token_hash=hash_token("test_token"),
         user_id=1,
         expires_at=datetime.now() + timedelta(days=1),
     )
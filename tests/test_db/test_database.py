@@ -0,0 +1,48 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from src.db import database
+from src.db.database import ModelBase, session_scope
+from src.models import UserModel
+
+
+@pytest_asyncio.fixture
+async def sqlite_sessionmaker(mocker):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    mocker.patch.object(database, "Session", session_factory)
+    yield session_factory
+
+    await engine.dispose()
+
+
+async def count_users(session_factory) -> int:
+    async with session_factory() as s:
+        return (await s.execute(select(func.count(UserModel.id)))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_session_scope_commits_once(sqlite_sessionmaker):
+    async with session_scope() as session:
+        session.add(UserModel(name="uow", email="uow@example.com", password="x"))
+        await session.flush()
+        session.add(UserModel(name="uow2", email="uow2@example.com", password="x"))
+        await session.flush()
+
+    assert await count_users(sqlite_sessionmaker) == 2
+
+
+@pytest.mark.asyncio
+async def test_session_scope_rollback_on_error(sqlite_sessionmaker):
+    with pytest.raises(RuntimeError):
+        async with session_scope() as session:
+            session.add(UserModel(name="uow", email="uow@example.com", password="x"))
+            await session.flush()
+            raise RuntimeError("Boom")
+
+    assert await count_users(sqlite_sessionmaker) == 0
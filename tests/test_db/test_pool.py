@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.pool import (
+    get_engine_options,
+    get_pool_stats,
+    InstrumentedAsyncQueuePool,
+    InstrumentedNullPool,
+)
+from src.dto import PoolStatsDTO
+
+
+POOL_CONFIG = {
+    "pool_size": 3,
+    "max_overflow": 2,
+    "pool_timeout": 5.0,
+    "pool_recycle": 600,
+    "pool_pre_ping": True,
+    "statement_timeout": 0,
+    "pgbouncer_mode": False,
+}
+
+
+def test_get_engine_options_queue_pool():
+    options = get_engine_options(POOL_CONFIG)
+
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 5.0
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {}
+
+
+def test_get_engine_options_statement_timeout():
+    options = get_engine_options({**POOL_CONFIG, "statement_timeout": 5000})
+
+    assert options["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+
+
+def test_get_engine_options_pgbouncer_mode():
+    options = get_engine_options({**POOL_CONFIG, "pgbouncer_mode": True})
+
+    assert options["poolclass"] is InstrumentedNullPool
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_pool_stats(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=3,
+        max_overflow=2,
+    )
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        stats = get_pool_stats(engine.pool, max_overflow=2)
+
+        assert isinstance(stats, PoolStatsDTO)
+        assert stats.pool_class == "InstrumentedAsyncQueuePool"
+        assert stats.size == 3
+        assert stats.max_overflow == 2
+        assert stats.checked_out == 1
+        assert stats.checkouts == 1
+
+    stats = get_pool_stats(engine.pool)
+    assert stats.checked_out == 0
+    assert stats.checked_in == 1
+    assert stats.max_wait_ms >= stats.avg_wait_ms >= 0
+
+    await engine.dispose()
@@ -0,0 +1,101 @@
+import json
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.query_logging import QueryLogger, fingerprint_statement, install_query_logging
+
+
+def test_fingerprint_ignores_values():
+    first = fingerprint_statement("SELECT * FROM todos WHERE id = 1 AND title = 'a'")
+    second = fingerprint_statement(
+        "select *  from todos\n WHERE id = 42 AND title = 'it''s'"
+    )
+    assert first == second
+    assert len(first) == 16
+
+    assert fingerprint_statement(
+        "SELECT * FROM todos WHERE id IN ($1, $2, $3)"
+    ) == fingerprint_statement("SELECT * FROM todos WHERE id IN (?)")
+
+    assert fingerprint_statement("SELECT * FROM todos") != fingerprint_statement(
+        "SELECT * FROM users"
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_logger_emits_json_records(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    QueryLogger(sample_rate=1.0).install(engine.sync_engine)
+
+    with caplog.at_level(logging.INFO, logger="src.db.queries"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 'secret_value'"))
+
+    records = [json.loads(r.message) for r in caplog.records if r.name == "src.db.queries"]
+    assert len(records) == 1
+    assert records[0]["event"] == "sql_query"
+    assert records[0]["operation"] == "SELECT"
+    assert records[0]["fingerprint"] == fingerprint_statement("SELECT 'secret_value'")
+    assert records[0]["duration_ms"] >= 0
+    assert records[0]["slow"] is False
+    assert "secret_value" not in caplog.text
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_query_logger_sampling_and_slow_queries(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    # Nothing is sampled, but every query is "slow" with a tiny threshold
+    QueryLogger(sample_rate=0.0, slow_query_ms=0.000001).install(engine.sync_engine)
+
+    with caplog.at_level(logging.INFO, logger="src.db.queries"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    records = [r for r in caplog.records if r.name == "src.db.queries"]
+    assert len(records) == 1
+    assert records[0].levelno == logging.WARNING
+    assert json.loads(records[0].message)["slow"] is True
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_query_logger_failed_statement(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    QueryLogger(sample_rate=1.0).install(engine.sync_engine)
+
+    with caplog.at_level(logging.INFO, logger="src.db.queries"):
+        async with engine.connect() as conn:
+            with pytest.raises(Exception):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            await conn.rollback()
+            await conn.execute(text("SELECT 1"))
+
+            assert "query_start_time" not in conn.sync_connection.info
+
+    records = [json.loads(r.message) for r in caplog.records if r.name == "src.db.queries"]
+    assert len(records) == 1
+    assert records[0]["fingerprint"] == fingerprint_statement("SELECT 1")
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_query_logging_disabled(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    install_query_logging(
+        engine.sync_engine, {"enabled": False, "sample_rate": 1.0, "slow_query_ms": 0}
+    )
+
+    with caplog.at_level(logging.INFO, logger="src.db.queries"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    assert not [r for r in caplog.records if r.name == "src.db.queries"]
+
+    await engine.dispose()
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.repositories import TodoRepo, TokenRepo
+
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "sqlite")
+def visit_explain_sqlite(element, compiler, **kw):
+    return "EXPLAIN QUERY PLAN " + compiler.process(element.statement, **kw)
+
+
+@compiles(Explain, "postgresql")
+def visit_explain_postgresql(element, compiler, **kw):
+    return "EXPLAIN " + compiler.process(element.statement, **kw)
+
+
+async def get_query_plan(session: AsyncSession, query) -> str:
+    conn = await session.connection()
+    result = await conn.execute(Explain(query))
+    return "\n".join(str(row[-1]) for row in result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "order_by, index_name",
+    [
+        ("id", "ix_todos_user_id_id"),
+        ("created_at", "ix_todos_user_id_created_at_id"),
+        ("updated_at", "ix_todos_user_id_updated_at_id"),
+    ],
+)
+async def test_todos_by_user_id_uses_index(db_session, order_by, index_name):
+    query = TodoRepo._todos_by_user_id_query(user_id=1, order_by=order_by)
+    plan = await get_query_plan(db_session, query)
+    assert index_name in plan
+
+    keyset_query = TodoRepo._todos_by_user_id_query(
+        user_id=1,
+        order_by=order_by,
+        direction="desc",
+        after=(datetime.now(timezone.utc) if order_by != "id" else 10, 10),
+    )
+    plan = await get_query_plan(db_session, keyset_query)
+    assert index_name in plan
+
+
+@pytest.mark.asyncio
+async def test_count_active_tokens_uses_index(db_session):
+    plan = await get_query_plan(db_session, TokenRepo._count_active_tokens_query(1))
+    assert "ix_refresh_tokens_user_id_expires_at_created_at" in plan
+
+
+@pytest.mark.asyncio
+async def test_oldest_token_uses_index(db_session):
+    plan = await get_query_plan(db_session, TokenRepo._oldest_token_query(1))
+    assert "ix_refresh_tokens_user_id_expires_at_created_at" in plan
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories import TagRepo, TodoRepo
+from src.models import TagModel, ToDoModel, UserModel
+
+
+@pytest.mark.asyncio
+async def test_set_todo_tags(db_session: AsyncSession):
+    tags = await TagRepo.set_todo_tags(db_session, 1, 1, ["work", "home"])
+    assert tags == ["home", "work"]
+
+    tags = await TagRepo.set_todo_tags(db_session, 1, 1, ["work", "urgent"])
+    assert tags == ["urgent", "work"]
+    assert await TagRepo.find_tags_by_todo_ids(db_session, [1, 2]) == {
+        1: ["urgent", "work"]
+    }
+
+    # Tags are reused, not duplicated
+    await TagRepo.set_todo_tags(db_session, 2, 1, ["work"])
+    count = await db_session.scalar(select(func.count()).select_from(TagModel))
+    assert count == 3
+
+    assert await TagRepo.set_todo_tags(db_session, 1, 1, []) == []
+    assert await TagRepo.find_tags_by_todo_ids(db_session, [1, 2]) == {2: ["work"]}
+    assert await TagRepo.find_tags_by_todo_ids(db_session, []) == {}
+
+
+@pytest.mark.asyncio
+async def test_add_todos_tags(db_session: AsyncSession):
+    await TagRepo.set_todo_tags(db_session, 1, 1, ["work"])
+    await TagRepo.add_todos_tags(db_session, 1, {2: ["work", "home"]})
+    await TagRepo.add_todos_tags(db_session, 1, {2: []})
+
+    assert await TagRepo.find_tags_by_todo_ids(db_session, [1, 2]) == {
+        1: ["work"],
+        2: ["home", "work"],
+    }
+    count = await db_session.scalar(select(func.count()).select_from(TagModel))
+    assert count == 2
+
+
+@pytest.mark.asyncio
+async def test_filter_todos_by_tags(db_session: AsyncSession):
+    await TagRepo.set_todo_tags(db_session, 1, 1, ["work", "urgent"])
+    await TagRepo.set_todo_tags(db_session, 2, 1, ["work"])
+
+    any_todos = await TodoRepo.find_all_todos_by_user_id(
+        db_session, 1, order_by="id", tags=["urgent", "work"]
+    )
+    all_todos = await TodoRepo.find_all_todos_by_user_id(
+        db_session, 1, order_by="id", tags=["urgent", "work"], tags_match="all"
+    )
+    missing = await TodoRepo.find_all(db_session, tags=["missing"])
+
+    assert [todo.id for todo in any_todos] == [1, 2]
+    assert [todo.id for todo in all_todos] == [1]
+    assert missing == []
+    assert await TodoRepo.count_todos(db_session, user_id=1, tags=["work"]) == 2
+    assert (
+        await TodoRepo.count_todos(
+            db_session, tags=["urgent", "work"], tags_match="all"
+        )
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_filter_todos_by_tags_of_the_user_only(db_session: AsyncSession):
+    db_session.add(UserModel(name="other", email="other@example.com", password="hash"))
+    await db_session.flush()
+    db_session.add(ToDoModel(id=3, title="Other", description="", user_id=2))
+    await db_session.flush()
+    await TagRepo.set_todo_tags(db_session, 1, 1, ["work"])
+    await TagRepo.set_todo_tags(db_session, 3, 2, ["work"])
+
+    query = TodoRepo._todos_by_user_id_query(user_id=1, tags=["work"], tags_match="all")
+    todos = await db_session.execute(query)
+
+    assert "tags.user_id" in str(query)
+    assert [todo.id for todo in todos.scalars()] == [1]
+    assert await TodoRepo.count_todos(db_session, user_id=1, tags=["work"]) == 1
+    assert await TodoRepo.count_todos(db_session, user_id=2, tags=["work"]) == 1
+    assert await TodoRepo.count_todos(db_session, tags=["work"]) == 2
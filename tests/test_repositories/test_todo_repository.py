@@ -1,11 +1,14 @@
+from unittest.mock import AsyncMock, MagicMock
+
 from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 
 from src.repositories.todo_repo import TodoRepo
 from src.models import ToDoModel
-from src.dto import ToDoDTO, ToDoUpdateDTO
+from src.dto import ToDoDTO, ToDoUpdateDTO, ToDoBatchUpdateDTO
 from src.config.logging_confing import logging  # noqa
 
 
@@ -131,3 +134,320 @@ async def test_get_todo_ower_id(db_session: AsyncSession):
     user_id = await TodoRepo.get_todo_owner_id(db_session, 1)
 
     assert user_id == 1
+
+
+@pytest.mark.asyncio
+async def test_find_all_by_user_id_keyset(db_session: AsyncSession):
+    for i in range(3):
+        await TodoRepo.create_todo(
+            session=db_session, user_id=1, title=f"Todo {i}", description="description"
+        )
+
+    first_page = await TodoRepo.find_all_todos_by_user_id(
+        db_session, 1, limit=2, order_by="id"
+    )
+    assert [todo.id for todo in first_page] == [1, 2]
+
+    second_page = await TodoRepo.find_all_todos_by_user_id(
+        db_session, 1, limit=2, order_by="id", after=(first_page[-1].id, first_page[-1].id)
+    )
+    assert [todo.id for todo in second_page] == [3, 4]
+
+    last_page = await TodoRepo.find_all(
+        db_session, limit=2, order_by="id", after=(4, 4)
+    )
+    assert [todo.id for todo in last_page] == [5]
+
+
+@pytest.mark.asyncio
+async def test_find_all_by_user_id_ordering(db_session: AsyncSession):
+    asc_list = await TodoRepo.find_all_todos_by_user_id(
+        db_session, 1, order_by="id", direction="asc"
+    )
+    assert [todo.id for todo in asc_list] == [1, 2]
+
+    desc_list = await TodoRepo.find_all_todos_by_user_id(
+        db_session, 1, order_by="id", direction="desc"
+    )
+    assert [todo.id for todo in desc_list] == [2, 1]
+
+    desc_page = await TodoRepo.find_all(
+        db_session, limit=1, order_by="id", direction="desc", after=(2, 2)
+    )
+    assert [todo.id for todo in desc_page] == [1]
+
+
+@pytest.mark.asyncio
+async def test_count_todos(db_session: AsyncSession):
+    assert await TodoRepo.count_todos(db_session) == 2
+    assert await TodoRepo.count_todos(db_session, user_id=1) == 2
+    assert await TodoRepo.count_todos(db_session, user_id=42) == 0
+
+    # SQLite has no planner statistics: falls back to an exact count
+    assert await TodoRepo.estimate_todos_count(db_session) == 2
+
+
+@pytest.mark.asyncio
+async def test_todos_counter(db_session: AsyncSession):
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 2
+
+    new_todo = await TodoRepo.create_todo(
+        session=db_session, user_id=1, title="Counted", description="description"
+    )
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 3
+
+    await TodoRepo.delete_by_id(db_session, new_todo.id)
+    await TodoRepo.delete_by_id(db_session, 1)
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 1
+
+    # Deleting a missing todo doesn't touch the counter
+    await TodoRepo.delete_by_id(db_session, 42)
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 1
+
+    assert await TodoRepo.get_todos_counter(db_session, 42) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_user_todo(db_session: AsyncSession):
+    new_data = ToDoUpdateDTO(title="Owner title", description="Owner description")
+
+    updated_todo = await TodoRepo.update_user_todo(db_session, 1, 1, new_data)
+    assert updated_todo.id == 1
+    assert updated_todo.title == "Owner title"
+    assert updated_todo.description == "Owner description"
+
+    assert await TodoRepo.update_user_todo(db_session, 1, 2, new_data) is None
+    assert await TodoRepo.update_user_todo(db_session, 42, 1, new_data) is None
+
+    stored_todo = await TodoRepo.find_by_id(db_session, 1)
+    assert stored_todo.title == "Owner title"
+
+
+@pytest.mark.asyncio
+async def test_delete_user_todo(db_session: AsyncSession):
+    assert await TodoRepo.delete_user_todo(db_session, 1, 2) is False
+    assert await TodoRepo.delete_user_todo(db_session, 42, 1) is False
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 2
+
+    assert await TodoRepo.delete_user_todo(db_session, 1, 1) is True
+    assert await TodoRepo.find_by_id(db_session, 1) is None
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_todo_owner_id_not_found(db_session: AsyncSession):
+    assert await TodoRepo.get_todo_owner_id(db_session, 42) is None
+
+
+@pytest.mark.asyncio
+async def test_create_todos(db_session: AsyncSession):
+    todos = [
+        ToDoUpdateDTO(title=f"Batch {i}", description=f"Description {i}")
+        for i in range(3)
+    ]
+
+    created = await TodoRepo.create_todos(db_session, 1, todos)
+
+    assert [todo.title for todo in created] == ["Batch 0", "Batch 1", "Batch 2"]
+    assert all(todo.user_id == 1 for todo in created)
+    assert await TodoRepo.count_todos(db_session, user_id=1) == 5
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 5
+    assert await TodoRepo.create_todos(db_session, 1, []) == []
+
+
+@pytest.mark.asyncio
+async def test_update_user_todos(db_session: AsyncSession):
+    todos = [
+        ToDoBatchUpdateDTO(id=1, title="New first title"),
+        ToDoBatchUpdateDTO(id=2, description="New second description"),
+        ToDoBatchUpdateDTO(id=42, title="Missing"),
+    ]
+
+    updated = await TodoRepo.update_user_todos(db_session, 1, todos)
+    updated = {todo.id: todo for todo in updated}
+
+    assert set(updated) == {1, 2}
+    assert updated[1].title == "New first title"
+    assert updated[1].description == "Default description"
+    assert updated[2].title == "Second title"
+    assert updated[2].description == "New second description"
+
+    assert await TodoRepo.update_user_todos(db_session, 2, todos) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_user_todos(db_session: AsyncSession):
+    assert await TodoRepo.delete_user_todos(db_session, 2, [1, 2]) == []
+
+    deleted = await TodoRepo.delete_user_todos(db_session, 1, [1, 2, 42])
+
+    assert sorted(deleted) == [1, 2]
+    assert await TodoRepo.count_todos(db_session, user_id=1) == 0
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_find_existing_ids(db_session: AsyncSession):
+    assert sorted(await TodoRepo.find_existing_ids(db_session, [1, 2, 42])) == [1, 2]
+    assert await TodoRepo.find_existing_ids(db_session, []) == []
+    assert await TodoRepo.find_existing_ids(db_session, [1, 2], user_id=2) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_todos_by_user_id(db_session: AsyncSession):
+    await TodoRepo.create_todos(
+        db_session,
+        1,
+        [ToDoUpdateDTO(title=f"Title {i}", description="") for i in range(3)],
+    )
+
+    batches = [
+        batch
+        async for batch in TodoRepo.stream_todos_by_user_id(db_session, 1, batch_size=2)
+    ]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [todo.id for batch in batches for todo in batch] == [1, 2, 3, 4, 5]
+    assert all(isinstance(todo, ToDoDTO) for batch in batches for todo in batch)
+    assert [batch async for batch in TodoRepo.stream_todos_by_user_id(db_session, 2)] == []
+
+
+@pytest.mark.asyncio
+async def test_copy_todos(db_session: AsyncSession):
+    todos = [ToDoUpdateDTO(title=f"Copy {i}", description="") for i in range(3)]
+
+    assert await TodoRepo.copy_todos(db_session, 1, todos) == 3
+    assert await TodoRepo.copy_todos(db_session, 1, []) == 0
+
+    assert await TodoRepo.count_todos(db_session, user_id=1) == 5
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 5
+
+
+@pytest.mark.asyncio
+async def test_search_todos(db_session: AsyncSession):
+    await TodoRepo.create_todos(
+        db_session,
+        1,
+        [
+            ToDoUpdateDTO(title="Buy milk", description="Milk and milkshake"),
+            ToDoUpdateDTO(title="Call mom", description="About the milk"),
+            ToDoUpdateDTO(title="Walk", description="In the park"),
+        ],
+    )
+
+    results = await TodoRepo.search_todos(db_session, 1, "milk")
+
+    assert [todo.id for todo, _ in results] == [3, 4]
+    assert results[0][1] >= results[1][1]
+
+    # Prefix match, keyset after the first result
+    first_todo, first_rank = results[0]
+    results = await TodoRepo.search_todos(
+        db_session, 1, "mil", after=(first_rank, first_todo.id)
+    )
+    assert [todo.id for todo, _ in results] == [4]
+
+    assert await TodoRepo.search_todos(db_session, 2, "milk") == []
+    assert await TodoRepo.search_todos(db_session, 1, "\"*)") == []
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_deletes(db_session: AsyncSession):
+    await TodoRepo.update_user_todo(
+        db_session, 1, 1, ToDoUpdateDTO(title="Renamed", description="Nothing")
+    )
+    await TodoRepo.delete_user_todo(db_session, 2, 1)
+
+    assert await TodoRepo.search_todos(db_session, 1, "title") == []
+    results = await TodoRepo.search_todos(db_session, 1, "renamed")
+    assert [todo.id for todo, _ in results] == [1]
+
+
+@pytest.mark.asyncio
+async def test_todos_version_bumped_on_changes(db_session: AsyncSession):
+    new_data = ToDoUpdateDTO(title="title", description="description")
+    version = await TodoRepo.get_todos_version(db_session, 1)
+
+    await TodoRepo.create_todo(db_session, 1, "title", "description")
+    assert await TodoRepo.get_todos_version(db_session, 1) == version + 1
+
+    await TodoRepo.update_user_todo(db_session, 1, 1, new_data)
+    assert await TodoRepo.get_todos_version(db_session, 1) == version + 2
+
+    await TodoRepo.update_user_todo(db_session, 1, 2, new_data)
+    assert await TodoRepo.get_todos_version(db_session, 1) == version + 2
+    assert await TodoRepo.get_todos_version(db_session, 2) == 0
+
+    await TodoRepo.touch_todo(db_session, 1, 1)
+    assert await TodoRepo.get_todos_version(db_session, 1) == version + 3
+
+    await TodoRepo.delete_user_todo(db_session, 1, 1)
+    assert await TodoRepo.get_todos_version(db_session, 1) == version + 4
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 2
+
+
+@pytest.mark.asyncio
+async def test_todos_version_kept_when_nothing_matches(db_session: AsyncSession):
+    version = await TodoRepo.get_todos_version(db_session, 1)
+
+    assert await TodoRepo.update_user_todos(
+        db_session, 1, [ToDoBatchUpdateDTO(id=42, title="title")]
+    ) == []
+    assert await TodoRepo.delete_user_todos(db_session, 1, [42, 43]) == []
+    assert await TodoRepo.update_user_todo(
+        db_session, 42, 1, ToDoUpdateDTO(title="title", description="")
+    ) is None
+    await TodoRepo.touch_todo(db_session, 42, 1)
+
+    assert await TodoRepo.get_todos_version(db_session, 1) == version
+    assert await TodoRepo.get_todos_counter(db_session, 1) == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_user_todos_is_one_statement_on_postgresql():
+    session = MagicMock()
+    session.bind.dialect.name = "postgresql"
+    session.execute = AsyncMock(return_value=MagicMock(all=lambda: []))
+
+    assert await TodoRepo.delete_user_todos(session, 1, [1, 2]) == []
+
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "FOR NO KEY UPDATE" in sql
+    assert "UPDATE users" in sql
+    assert "INSERT INTO todo_tombstones" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_todo_owner_and_updated_at(db_session: AsyncSession):
+    todo = await TodoRepo.find_by_id(db_session, 1)
+
+    assert await TodoRepo.get_todo_owner_and_updated_at(db_session, 1) == (
+        1,
+        todo.updated_at,
+    )
+    assert await TodoRepo.get_todo_owner_and_updated_at(
+        db_session, 1, for_update=True
+    ) == (1, todo.updated_at)
+    assert await TodoRepo.get_todo_owner_and_updated_at(db_session, 42) is None
+
+
+@pytest.mark.asyncio
+async def test_find_changes(db_session: AsyncSession):
+    changed, deleted = await TodoRepo.find_changes(db_session, 1)
+    assert [todo.id for todo in changed] == [1, 2]
+    assert deleted == []
+
+    await TodoRepo.create_todo(db_session, 1, "Third title", "Third description")
+    await TodoRepo.delete_user_todos(db_session, 1, [1])
+    version = await TodoRepo.get_todos_version(db_session, 1)
+
+    changed, deleted = await TodoRepo.find_changes(db_session, 1, after=(0, 2))
+    assert [(todo.sync_version, todo.id) for todo in changed] == [(version - 1, 3)]
+    assert deleted == [(version, 1)]
+
+    changed, deleted = await TodoRepo.find_changes(db_session, 1, after=(version, 1))
+    assert changed == [] and deleted == []
+
+    changed, _ = await TodoRepo.find_changes(db_session, 1, limit=1)
+    assert [todo.id for todo in changed] == [2]
@@ -1,11 +1,13 @@
+import asyncio
 from datetime import datetime, timedelta
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 import pytest
 
-from src.repositories.token_repo import TokenRepo
-from src.models import RefreshTokenModel
+from src.db.database import ModelBase
+from src.repositories.token_repo import TokenRepo, hash_token
+from src.models import RefreshTokenModel, UserModel
 from src.dto import CreateRefreshTokenDTO, RefreshTokenDTO
 from src.config.logging_confing import logging  # noqa
 
@@ -20,10 +22,10 @@ async def test_add_token(db_session: AsyncSession):
 
     await TokenRepo.add_token(db_session, token)
 
-    query = select(RefreshTokenModel).where(RefreshTokenModel.token == "test_token")
+    query = select(RefreshTokenModel).where(RefreshTokenModel.token_hash == hash_token("test_token"))
     stored_token = (await db_session.execute(query)).scalar_one()
 
-    assert stored_token.token == token.token
+    assert stored_token.token_hash == hash_token(token.token)
     assert stored_token.user_id == token.user_id
     assert stored_token.expires_at == token.expires_at
 
@@ -33,10 +35,10 @@ async def test_check_token_exist(
     db_session: AsyncSession, test_user_token: RefreshTokenDTO
 ):
     found_token: RefreshTokenDTO = await TokenRepo.check_token_exist(
-        db_session, test_user_token.token
+        db_session, "test_token"
     )
 
-    assert found_token.token == test_user_token.token
+    assert found_token.token_hash == hash_token("test_token")
 
 
 @pytest.mark.asyncio
@@ -56,16 +58,17 @@ async def test_update_token(db_session: AsyncSession, test_user_token: RefreshTo
     )
 
     updated_token = await TokenRepo.update_token(
-        db_session, test_user_token.token, new_token
+        db_session, "test_token", new_token
     )
 
-    query = select(RefreshTokenModel).where(RefreshTokenModel.token == "new_token")
+    query = select(RefreshTokenModel).where(RefreshTokenModel.token_hash == hash_token("new_token"))
     stored_token = (await db_session.execute(query)).scalar_one()
 
-    assert stored_token.token == new_token.token == updated_token.token
+    assert stored_token.token_hash == hash_token(new_token.token)
+    assert updated_token.token_hash == stored_token.token_hash
     assert stored_token.user_id == new_token.user_id
     assert stored_token.expires_at == new_token.expires_at
-    assert stored_token.token != "test_token"
+    assert await TokenRepo.check_token_exist(db_session, "test_token") is None
 
 
 @pytest.mark.asyncio
@@ -81,6 +84,26 @@ async def test_update_token_not_exist(db_session: AsyncSession):
     assert not_exist_token is None
 
 
+@pytest.mark.asyncio
+async def test_update_token_expired(db_session: AsyncSession):
+    await TokenRepo.add_token(
+        db_session,
+        CreateRefreshTokenDTO(
+            token="expired_token",
+            user_id=1,
+            expires_at=datetime.now() - timedelta(days=1),
+        ),
+    )
+    new_token = CreateRefreshTokenDTO(
+        token="new_token",
+        user_id=1,
+        expires_at=datetime.now() + timedelta(days=1),
+    )
+
+    assert await TokenRepo.update_token(db_session, "expired_token", new_token) is None
+    assert await TokenRepo.check_token_exist(db_session, "new_token") is None
+
+
 @pytest.mark.asyncio
 async def test_count_token_for_user(db_session: AsyncSession, test_user_token):
     count = await TokenRepo.count_tokens_for_user(db_session, 1)
@@ -118,7 +141,7 @@ async def test_get_oldest_token(db_session: AsyncSession, test_user_token):
     oldest_token = await TokenRepo._get_oldest_token(session=db_session, user_id=1)
 
     assert isinstance(oldest_token, RefreshTokenModel)
-    assert oldest_token.token == test_user_token.token
+    assert oldest_token.token_hash == hash_token("test_token")
 
 
 @pytest.mark.asyncio
@@ -133,18 +156,90 @@ async def test_delete_oldest_token(db_session: AsyncSession, test_user_token):
 
     new_oldest_token = await TokenRepo._get_oldest_token(db_session, 1)
 
-    assert new_oldest_token.token == new_token.token
+    assert new_oldest_token.token_hash == hash_token(new_token.token)
 
 
 @pytest.mark.asyncio
 async def test_delete_token(db_session: AsyncSession, test_user_token):
-    deleted_token = await TokenRepo.delete_token(session=db_session, token=test_user_token.token, user_id=1)
+    deleted_token = await TokenRepo.delete_token(session=db_session, token="test_token", user_id=1)
 
-    query = select(RefreshTokenModel).where(RefreshTokenModel.token == "new_token")
+    query = select(RefreshTokenModel).where(RefreshTokenModel.token_hash == hash_token("test_token"))
     stored_token = (await db_session.execute(query)).one_or_none()
 
     assert stored_token is None
     assert deleted_token is None
 
 
-    
\ No newline at end of file
+@pytest.mark.asyncio
+async def test_add_token_with_limit(db_session: AsyncSession, test_user_token):
+    expires_at = datetime.now() + timedelta(days=1)
+
+    for token in ["second", "third"]:
+        evicted = await TokenRepo.add_token_with_limit(
+            db_session,
+            CreateRefreshTokenDTO(token=token, user_id=1, expires_at=expires_at),
+            max_active=2,
+        )
+
+    assert evicted == 1
+    assert await TokenRepo.count_tokens_for_user(db_session, 1) == 2
+    assert await TokenRepo.check_token_exist(db_session, "test_token") is None
+
+
+@pytest.mark.asyncio
+async def test_add_token_with_limit_concurrent_logins(tmp_path):
+    # Separate connections to a file database, so the logins really overlap
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'tokens.db'}", connect_args={"timeout": 30}
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add(UserModel(name="user", email="user@example.com", password="hash"))
+        await session.commit()
+
+    async def login(number: int) -> None:
+        async with session_factory() as session:
+            await TokenRepo.add_token_with_limit(
+                session,
+                CreateRefreshTokenDTO(
+                    token=f"token_{number}",
+                    user_id=1,
+                    expires_at=datetime.now() + timedelta(days=1),
+                ),
+                max_active=3,
+            )
+            await session.commit()
+
+    await asyncio.gather(*(login(number) for number in range(20)))
+
+    async with session_factory() as session:
+        assert await TokenRepo.count_tokens_for_user(session, 1) == 3
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_tokens(db_session: AsyncSession, test_user_token):
+    for number in range(3):
+        await TokenRepo.add_token(
+            db_session,
+            CreateRefreshTokenDTO(
+                token=f"expired_{number}",
+                user_id=1,
+                expires_at=datetime.now() - timedelta(days=1),
+            ),
+        )
+
+    assert await TokenRepo.delete_expired_tokens(db_session, batch_size=2) == 2
+    assert await TokenRepo.delete_expired_tokens(db_session, batch_size=2) == 1
+    assert await TokenRepo.delete_expired_tokens(db_session, batch_size=2) == 0
+    assert await TokenRepo.check_token_exist(db_session, "test_token")
+
+
+def test_hash_token():
+    digest = hash_token("test_token")
+
+    assert len(digest) == 32
+    assert digest == hash_token("test_token")
+    assert digest != hash_token("test_token_")
@@ -6,8 +6,14 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dto.tokendto import RefreshTokenDTO, CreateRefreshTokenDTO
+from src.repositories.token_repo import hash_token
 from src.dto import UserLoginDTO, TokenDTO, UserResponseDTO
-from src.services.auth_service import AuthService, get_password_hash, verify_password
+from src.services.auth_service import (
+    AuthService,
+    get_password_hash,
+    verify_password,
+    REFRESH_TOKEN_LIFETIME,
+)
 from src.services.jwt_service import JWTService
 from src.models import UserModel
 from src.repositories import UserRepo, TokenRepo
@@ -36,10 +42,6 @@ async def test_login_user_success(mocker):
     # Preperation of mocks
     mock_session = AsyncMock(spec=AsyncSession)
 
-    # Setup __aenter__ and __aexit__ for the mock session
-    mock_session.__aenter__.return_value = mock_session
-    mock_session.__aexit__.return_value = None
-
     user_email = "test@example.com"
     user_password = "secure_password"
     user_name = "Test User"
@@ -58,13 +60,9 @@ async def test_login_user_success(mocker):
         ),
     )
     mocker.patch(
-        "src.repositories.token_repo.TokenRepo.count_tokens_for_user",
+        "src.repositories.token_repo.TokenRepo.add_token_with_limit",
         new=AsyncMock(return_value=0),
     )
-    mocker.patch(
-        "src.repositories.token_repo.TokenRepo.add_token",
-        new=AsyncMock(return_value=None),
-    )
 
     # Mocking JWTService methods
     mock_create_access_token = mocker.patch(
@@ -76,8 +74,7 @@ async def test_login_user_success(mocker):
         return_value="mocked_refresh_token",
     )
     mock_get_expire_time = mocker.patch(
-        "src.services.jwt_service.JWTService.get_expire_time",
-        return_value="2025-01-31T23:59:59",
+        "src.services.jwt_service.JWTService.get_expire_time"
     )
     mock_verify_password = mocker.patch(
         "src.services.auth_service.verify_password",
@@ -101,22 +98,20 @@ async def test_login_user_success(mocker):
     UserRepo.find_by_email.assert_called_once_with(
         session=mock_session, email=user_email
     )
-    TokenRepo.count_tokens_for_user.assert_called_once_with(
-        session=mock_session, user_id=user_id
-    )
-    TokenRepo.add_token.assert_called_once_with(
+    TokenRepo.add_token_with_limit.assert_called_once_with(
         session=mock_session,
         token=mocker.ANY,
+        max_active=mocker.ANY,
     )
     mock_verify_password.assert_called_once_with(user_password, password_hash)
     mock_create_access_token.assert_called_once_with(user_id)
-    mock_create_refresh_token.assert_called_once_with(user_id)
-    mock_get_expire_time.assert_called_once_with("mocked_refresh_token")
+    mock_create_refresh_token.assert_called_once_with(user_id, expires_at=mocker.ANY)
+    mock_get_expire_time.assert_not_called()
     mock_verify_password.assert_called_once_with(user_password, password_hash)
 
-    # Check session closing
-    mock_session.__aenter__.assert_called_once()
-    mock_session.__aexit__.assert_called_once_with(None, None, None)
+    # The request-scoped unit of work owns the session: no commit or close here
+    mock_session.commit.assert_not_called()
+    mock_session.__aexit__.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -124,10 +119,6 @@ async def test_login_user_invalid_password(mocker):
     # Preperation of mocks
     mock_session = AsyncMock(spec=AsyncSession)
 
-    # Setup __aenter__ and __aexit__ for the mock session
-    mock_session.__aenter__.return_value = mock_session
-    mock_session.__aexit__.return_value = None
-
     user_email = "test@example.com"
     user_password = "wrong_password"
     password_hash = get_password_hash("defautl_password")
@@ -154,9 +145,9 @@ async def test_login_user_invalid_password(mocker):
 
     assert result is None
 
-    # Check session closing
-    mock_session.__aenter__.assert_called_once()
-    mock_session.__aexit__.assert_called_once_with(None, None, None)
+    # The request-scoped unit of work owns the session: no commit or close here
+    mock_session.commit.assert_not_called()
+    mock_session.__aexit__.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -164,10 +155,6 @@ async def test_login_user_user_not_found(mocker):
     # Preperation of mocks
     mock_session = AsyncMock(spec=AsyncSession)
 
-    # Setup __aenter__ and __aexit__ for the mock session
-    mock_session.__aenter__.return_value = mock_session
-    mock_session.__aexit__.return_value = None
-
     user_email = "nonexistent@example.com"
     user_password = "secure_password"
 
@@ -192,9 +179,9 @@ async def test_login_user_user_not_found(mocker):
 
     assert result is None
 
-    # Check session closing
-    mock_session.__aenter__.assert_called_once()
-    mock_session.__aexit__.assert_called_once_with(None, None, None)
+    # The request-scoped unit of work owns the session: no commit or close here
+    mock_session.commit.assert_not_called()
+    mock_session.__aexit__.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -327,29 +314,56 @@ async def test_get_current_user_integration(db_session):
     assert result.email == test_user.email
 
 
+@pytest.mark.asyncio
+async def test_get_current_user_uses_cache(mocker):
+    mock_session = AsyncMock(spec=AsyncSession)
+    test_user = UserResponseDTO(id=1, email="test@example.com", name="Test User")
+    future_time = int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
+
+    mocker.patch(
+        "src.services.jwt_service.JWTService.decode_token",
+        return_value={"sub": "1", "exp": future_time},
+    )
+    mocker.patch(
+        "src.repositories.user_repo.UserRepo.find_by_id",
+        new=AsyncMock(return_value=test_user),
+    )
+
+    first = await AuthService.get_current_user(mock_session, "valid_token")
+    second = await AuthService.get_current_user(mock_session, "valid_token")
+
+    UserRepo.find_by_id.assert_called_once_with(mock_session, 1)
+    assert first == second == test_user
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_invalidated_on_update(db_session):
+    token = JWTService.create_access_token(1)
+    user = await AuthService.get_current_user(db_session, token)
+    assert user.name == "test_user"
+
+    db_user = await db_session.get(UserModel, 1)
+    db_user.name = "renamed_user"
+    await db_session.commit()
+
+    user = await AuthService.get_current_user(db_session, token)
+    assert user.name == "renamed_user"
+
+
 @pytest.mark.asyncio
 async def test_refresh_token_success(mocker):
     # Preperation of mocks
     mock_session = AsyncMock(spec=AsyncSession)
 
-    # Setup __aenter__ and __aexit__ for the mock session
-    mock_session.__aenter__.return_value = mock_session
-    mock_session.__aexit__.return_value = None
-
     user_id = 1
     refresh_token = "valid_refresh_token"
 
-    mock_check_token_exist = mocker.patch(
-        "src.repositories.token_repo.TokenRepo.check_token_exist",
-        new=AsyncMock(return_value=RefreshTokenDTO(token=refresh_token)),
-    )
     mock_create_refresh_token = mocker.patch(
         "src.services.jwt_service.JWTService.create_refresh_token",
         return_value="mocked_refresh_token",
     )
     mock_get_expire_time = mocker.patch(
-        "src.services.jwt_service.JWTService.get_expire_time",
-        return_value="2025-01-31T23:59:59",
+        "src.services.jwt_service.JWTService.get_expire_time"
     )
     mock_create_access_token = mocker.patch(
         "src.services.jwt_service.JWTService.create_access_token",
@@ -357,7 +371,13 @@ async def test_refresh_token_success(mocker):
     )
     mock_update_token = mocker.patch(
         "src.repositories.token_repo.TokenRepo.update_token",
-        new=AsyncMock(return_value=RefreshTokenDTO(token="mocked_refresh_token",))
+        new=AsyncMock(
+            return_value=RefreshTokenDTO(
+                token_hash=hash_token("mocked_refresh_token"),
+                user_id=user_id,
+                expires_at="2025-01-31T23:59:59",
+            )
+        ),
     )
     result = await AuthService.refresh_token(
         mock_session, refresh_token=refresh_token, user_id=user_id
@@ -368,23 +388,42 @@ async def test_refresh_token_success(mocker):
     assert result.access_token == "mocked_access_token"
     assert result.refresh_token == "mocked_refresh_token"
 
-    mock_check_token_exist.assert_called_once_with(session=mock_session, token=refresh_token)
-    mock_create_refresh_token.assert_called_once_with(user_id)
-    mock_get_expire_time.assert_called_once_with("mocked_refresh_token")
+    mock_create_refresh_token.assert_called_once_with(user_id, expires_at=mocker.ANY)
+    mock_get_expire_time.assert_not_called()
+    expires_at = mock_create_refresh_token.call_args.kwargs["expires_at"]
+    assert expires_at - datetime.now(timezone.utc) > REFRESH_TOKEN_LIFETIME - timedelta(minutes=1)
     mock_update_token.assert_called_once_with(
         session=mock_session,
         old_token=refresh_token,
         new_token=CreateRefreshTokenDTO(
             token="mocked_refresh_token",
             user_id=user_id,
-            expires_at="2025-01-31T23:59:59",
+            expires_at=expires_at,
         ),
     )
     mock_create_access_token.assert_called_once_with(user_id)
 
-    # Check session closing
-    mock_session.__aenter__.assert_called_once()
-    mock_session.__aexit__.assert_called_once_with(None, None, None)
+    # The request-scoped unit of work owns the session: no commit or close here
+    mock_session.commit.assert_not_called()
+    mock_session.__aexit__.assert_not_called()
+
+
+def test_create_opaque_refresh_token(mocker):
+    mocker.patch(
+        "src.services.auth_service.get_refresh_token_format", return_value="opaque"
+    )
+    mock_create_refresh_token = mocker.patch(
+        "src.services.jwt_service.JWTService.create_refresh_token"
+    )
+
+    first = AuthService.create_refresh_token(1)
+    second = AuthService.create_refresh_token(1)
+
+    assert first.user_id == 1
+    assert len(first.token) == 43
+    assert first.token != second.token
+    assert first.expires_at - datetime.now(timezone.utc) > REFRESH_TOKEN_LIFETIME - timedelta(minutes=1)
+    mock_create_refresh_token.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -392,21 +431,21 @@ async def test_refresh_token_invalid_token(mocker):
     # Preperation of mocks
     mock_session = AsyncMock(spec=AsyncSession)
 
-    # Setup __aenter__ and __aexit__ for the mock session
-    mock_session.__aenter__.return_value = mock_session
-    mock_session.__aexit__.return_value = None
-
     user_id = 1
     refresh_token = "invalid_refresh_token"
 
-    mock_check_token_exist = mocker.patch(
-        "src.repositories.token_repo.TokenRepo.check_token_exist",
+    mock_update_token = mocker.patch(
+        "src.repositories.token_repo.TokenRepo.update_token",
         new=AsyncMock(return_value=None),
     )
-    mock_create_refresh_token = mocker.patch(
+    mocker.patch(
         "src.services.jwt_service.JWTService.create_refresh_token",
         return_value="mocked_refresh_token",
     )
+    mock_create_access_token = mocker.patch(
+        "src.services.jwt_service.JWTService.create_access_token",
+        return_value="mocked_access_token",
+    )
 
     with pytest.raises(services_exceptions.NotFoundTokenError) as exc_info:
         await AuthService.refresh_token(
@@ -416,16 +455,12 @@ async def test_refresh_token_invalid_token(mocker):
             )
     assert str(exc_info.value) == "Token not found"
 
-    mock_check_token_exist.assert_called_once_with(session=mock_session, token=refresh_token)
-    mock_create_refresh_token.assert_not_called()
+    assert mock_update_token.call_args.kwargs["old_token"] == refresh_token
+    mock_create_access_token.assert_not_called()
 
-    # Check session closing
-    mock_session.__aenter__.assert_called_once()
-    mock_session.__aexit__.assert_called_once_with(
-        mocker.ANY,
-        mocker.ANY,
-        mocker.ANY,
-    )
+    # The request-scoped unit of work owns the session: no commit or close here
+    mock_session.commit.assert_not_called()
+    mock_session.__aexit__.assert_not_called()
 
 
 @pytest.mark.asyncio
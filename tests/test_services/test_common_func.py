@@ -1,40 +1,64 @@
+from datetime import datetime, timezone
+
 import pytest
-from src.services.common_func import sort_dto_list_order_by
-from src.dto import UserResponseDTO
+from src.services.common_func import (
+    encode_cursor,
+    decode_cursor,
+    normalize_tags,
+    make_etag,
+    etag_matches,
+)
+from src.exceptions import services_exceptions
+
+
+def test_encode_decode_cursor():
+    cursor = encode_cursor("id", "asc", 42, 42)
+    assert isinstance(cursor, str)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "id", "asc") == (42, 42)
+
+    created_at = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor("created_at", "desc", created_at, 7)
+    assert decode_cursor(cursor, "created_at", "desc") == (created_at, 7)
+
+
+def test_decode_cursor_invalid():
+    with pytest.raises(services_exceptions.NotValidCursorError):
+        decode_cursor("not a cursor", "id", "asc")
+
+    with pytest.raises(services_exceptions.NotValidCursorError):
+        decode_cursor(encode_cursor("id", "asc", 1, 1), "created_at", "asc")
+
+    with pytest.raises(services_exceptions.NotValidCursorError):
+        decode_cursor(encode_cursor("id", "asc", 1, 1), "id", "desc")
+
 
+def test_rank_cursor_round_trip():
+    cursor = encode_cursor("rank", "desc", 0.1 + 0.2, 7)
 
-def test_sort_dto_list_order_by():
-    test_data = [
-        UserResponseDTO(id=2, name="Bob", email="email1@test.com"),
-        UserResponseDTO(id=1, name="Alice", email="email2@test.com"),
-        UserResponseDTO(id=3, name="Charlie", email="email3@test.com"),
-    ]
+    assert decode_cursor(cursor, "rank", "desc") == (0.1 + 0.2, 7)
 
-    sorted_by_id = sort_dto_list_order_by(UserResponseDTO, test_data, "id")
-    assert [item.id for item in sorted_by_id] == [1, 2, 3]
 
-    sorted_by_name = sort_dto_list_order_by(UserResponseDTO, test_data, "name")
-    assert [item.name for item in sorted_by_name] == ["Alice", "Bob", "Charlie"]
+def test_normalize_tags():
+    assert normalize_tags([" Work", "work", "", "  ", "Home"]) == ["work", "home"]
 
-    sorted_by_age = sort_dto_list_order_by(UserResponseDTO, test_data, "email")
-    assert [item.email for item in sorted_by_age] == [
-        "email1@test.com",
-        "email2@test.com",
-        "email3@test.com",
-    ]
 
+def test_make_etag():
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    etag = make_etag(1, updated_at)
 
-def test_sort_dto_list_order_by_empty_list():
-    empty_list = []
-    result = sort_dto_list_order_by(UserResponseDTO, empty_list, "id")
-    assert result == []
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert make_etag(1, updated_at) == etag
+    assert make_etag(2, updated_at) != etag
+    assert make_etag(1, datetime(2024, 1, 2, tzinfo=timezone.utc)) != etag
 
 
-def test_sort_dto_list_order_by_invalid_field():
-    test_data = [
-        UserResponseDTO(id=1, name="Alice", email="email3@test.com"),
-        UserResponseDTO(id=2, name="Bob", email="email2@test.com"),
-    ]
+def test_etag_matches():
+    etag = make_etag(1)
 
-    with pytest.raises(KeyError):
-        sort_dto_list_order_by(UserResponseDTO, test_data, "invalid_field")
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches(f'W/"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
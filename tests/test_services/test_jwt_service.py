@@ -1,7 +1,11 @@
+import hashlib
 import time
 from datetime import datetime, timedelta, timezone
 
+from jose import jwt
+
 from src.services import JWTService
+from src.services.jwt_service import token_cache
 
 
 def test_create_token():
@@ -41,6 +45,14 @@ def test_create_access_token():
     assert decoded_data["exp"] > datetime.now(timezone.utc).timestamp()
 
 
+def test_create_refresh_token_expires_at():
+    expires_at = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+    token = JWTService.create_refresh_token(1, expires_at=expires_at)
+
+    assert JWTService.get_expire_time(token) == expires_at
+
+
 def test_expired_token():
     # Create token with expiration time 1 second
     data = {"sub": "1"}
@@ -53,3 +65,29 @@ def test_expired_token():
     decoded_data = JWTService.decode_token(token)
     # Token must be invalid
     assert decoded_data is None
+
+
+def test_decode_token_uses_cache(mocker):
+    token = JWTService.create_access_token(1)
+    spy = mocker.spy(jwt, "decode")
+
+    first = JWTService.decode_token(token)
+    second = JWTService.decode_token(token)
+
+    assert spy.call_count == 1
+    assert first == second
+    assert token_cache.stats().hits == 1
+
+
+def test_decode_token_cache_expires_with_token(mocker):
+    token = JWTService._create_token({"sub": "1"}, expires_delta=timedelta(seconds=10))
+    assert JWTService.decode_token(token) is not None
+
+    now = time.monotonic()
+    mocker.patch("src.utils.cache.time.monotonic", return_value=now + 20)
+    assert token_cache.get(hashlib.sha256(token.encode()).digest()) is None
+
+
+def test_decode_invalid_token_not_cached():
+    assert JWTService.decode_token("not.a.token") is None
+    assert len(token_cache) == 0
@@ -0,0 +1,31 @@
+import pytest
+
+from src.services import response_cache
+from src.services.response_cache import (
+    get_cached_todos_page,
+    cache_todos_page,
+    get_response_cache_stats,
+    set_response_cache_backend,
+)
+from src.utils.cache import MemoryCacheBackend
+
+
+@pytest.mark.asyncio
+async def test_cached_todos_page():
+    await cache_todos_page('W/"a"', b"[]")
+
+    assert await get_cached_todos_page('W/"a"') == b"[]"
+    assert await get_cached_todos_page('W/"b"') is None
+    assert get_response_cache_stats().hits == 1
+    assert get_response_cache_stats().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_set_response_cache_backend():
+    backend = MemoryCacheBackend(maxsize=10, ttl=60)
+    set_response_cache_backend(backend)
+
+    await cache_todos_page('W/"a"', b"[]")
+
+    assert response_cache.response_cache is backend
+    assert backend.stats().size == 1
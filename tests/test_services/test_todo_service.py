@@ -0,0 +1,495 @@
+import csv
+import io
+import json
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.todo_service import ToDoService
+from src.repositories import TodoRepo
+from src.dto import ToDoDTO, ToDoPageDTO, ToDoUpdateDTO, ToDoBatchUpdateDTO
+from src.exceptions import services_exceptions
+
+
+@pytest.fixture
+def count_mocks(mocker):
+    return {
+        "exact": mocker.patch(
+            "src.repositories.todo_repo.TodoRepo.count_todos",
+            new=AsyncMock(return_value=10),
+        ),
+        "counter": mocker.patch(
+            "src.repositories.todo_repo.TodoRepo.get_todos_counter",
+            new=AsyncMock(return_value=20),
+        ),
+        "estimate": mocker.patch(
+            "src.repositories.todo_repo.TodoRepo.estimate_todos_count",
+            new=AsyncMock(return_value=30),
+        ),
+    }
+
+
+@pytest.mark.asyncio
+async def test_count_todos_exact(mocker, count_mocks):
+    mocker.patch(
+        "src.services.todo_service.get_todos_total_strategy", return_value="exact"
+    )
+    mock_session = AsyncMock(spec=AsyncSession)
+
+    assert await ToDoService.count_todos(mock_session) == 10
+    assert await ToDoService.count_todos(mock_session, user_id=1) == 10
+    TodoRepo.count_todos.assert_called_with(mock_session, user_id=1)
+    count_mocks["counter"].assert_not_called()
+    count_mocks["estimate"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_count_todos_counter(mocker, count_mocks):
+    mocker.patch(
+        "src.services.todo_service.get_todos_total_strategy", return_value="counter"
+    )
+    mock_session = AsyncMock(spec=AsyncSession)
+
+    assert await ToDoService.count_todos(mock_session, user_id=1) == 20
+    assert await ToDoService.count_todos(mock_session) == 10
+    count_mocks["estimate"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_count_todos_estimate(mocker, count_mocks):
+    mocker.patch(
+        "src.services.todo_service.get_todos_total_strategy", return_value="estimate"
+    )
+    mock_session = AsyncMock(spec=AsyncSession)
+
+    assert await ToDoService.count_todos(mock_session, user_id=1) == 20
+    assert await ToDoService.count_todos(mock_session) == 30
+    count_mocks["exact"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_all_todos_by_user_id_total(db_session: AsyncSession):
+    page = await ToDoService.get_all_todos_by_user_id(db_session, user_id=1, limit=1)
+
+    assert isinstance(page, ToDoPageDTO)
+    assert len(page.data) == 1
+    assert page.total == 2
+    assert page.next_cursor is None
+
+    page = await ToDoService.get_all_todos_by_user_id(
+        db_session, user_id=1, limit=1, pagination="cursor"
+    )
+    assert page.total == 2
+    assert page.next_cursor is not None
+
+    page = await ToDoService.get_all_todos_by_user_id(
+        db_session, user_id=1, limit=1, cursor=page.next_cursor
+    )
+    assert [todo.id for todo in page.data] == [2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "owner_id, exception",
+    [
+        (None, services_exceptions.NotFoundToDoError),
+        (2, services_exceptions.ForbiddenToDoError),
+    ],
+)
+async def test_update_todo_not_found_or_forbidden(mocker, owner_id, exception):
+    mock_session = AsyncMock(spec=AsyncSession)
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.update_user_todo",
+        new=AsyncMock(return_value=None),
+    )
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.get_todo_owner_id",
+        new=AsyncMock(return_value=owner_id),
+    )
+
+    with pytest.raises(exception):
+        await ToDoService.update_todo(
+            mock_session, 1, ToDoUpdateDTO(title="title", description="description"), user_id=1
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_todo_if_match(db_session):
+    new_todo = ToDoUpdateDTO(title="title", description="description")
+    todo = await ToDoService.get_todo_by_id(db_session, 1)
+    etag = ToDoService.get_todo_etag(todo)
+
+    assert await ToDoService.find_todo_etag(db_session, 1) == etag
+    assert await ToDoService.find_todo_etag(db_session, 42) is None
+
+    with pytest.raises(services_exceptions.PreconditionFailedError):
+        await ToDoService.update_todo(
+            db_session, 1, new_todo, user_id=1, if_match='W/"stale"'
+        )
+    with pytest.raises(services_exceptions.ForbiddenToDoError):
+        await ToDoService.update_todo(db_session, 1, new_todo, user_id=2, if_match=etag)
+    with pytest.raises(services_exceptions.NotFoundToDoError):
+        await ToDoService.update_todo(db_session, 42, new_todo, user_id=1, if_match=etag)
+
+    updated = await ToDoService.update_todo(
+        db_session, 1, new_todo, user_id=1, if_match=etag
+    )
+    assert updated.title == "title"
+
+
+@pytest.mark.asyncio
+async def test_update_todo_if_match_locks_user_first(mocker):
+    mock_session = AsyncMock(spec=AsyncSession)
+    calls = []
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.lock_user_todos",
+        new=AsyncMock(side_effect=lambda *args: calls.append("user")),
+    )
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.get_todo_owner_and_updated_at",
+        new=AsyncMock(side_effect=lambda *args, **kwargs: calls.append("todo")),
+    )
+
+    with pytest.raises(services_exceptions.NotFoundToDoError):
+        await ToDoService.update_todo(
+            mock_session,
+            1,
+            ToDoUpdateDTO(title="title", description="description"),
+            user_id=1,
+            if_match="*",
+        )
+    assert calls == ["user", "todo"]
+
+
+@pytest.mark.asyncio
+async def test_user_todos_etag_changes_with_todos(db_session):
+    etag = await ToDoService.find_user_todos_etag(db_session, 1, "params")
+
+    assert await ToDoService.find_user_todos_etag(db_session, 1, "params") == etag
+    assert await ToDoService.find_user_todos_etag(db_session, 1, "other") != etag
+    assert await ToDoService.find_user_todos_etag(db_session, 2, "params") != etag
+
+    await ToDoService.set_todo_tags(db_session, 1, 1, ["work"])
+    assert await ToDoService.find_user_todos_etag(db_session, 1, "params") != etag
+
+
+@pytest.mark.asyncio
+async def test_get_todo_changes(db_session):
+    first = await ToDoService.get_todo_changes(db_session, 1, limit=1)
+    assert [todo.id for todo in first.changed] == [1]
+    assert first.has_more
+
+    second = await ToDoService.get_todo_changes(
+        db_session, 1, since=first.next_token, limit=1
+    )
+    assert [todo.id for todo in second.changed] == [2]
+
+    await ToDoService.delete_todo(db_session, 1, user_id=1)
+    await ToDoService.update_todo(
+        db_session, 2, ToDoUpdateDTO(title="New", description="New"), user_id=1
+    )
+
+    delta = await ToDoService.get_todo_changes(db_session, 1, since=second.next_token)
+    assert delta.deleted == [1]
+    assert [todo.title for todo in delta.changed] == ["New"]
+    assert not delta.has_more
+
+    empty = await ToDoService.get_todo_changes(db_session, 1, since=delta.next_token)
+    assert empty.changed == [] and empty.deleted == []
+    assert empty.next_token == delta.next_token
+
+    with pytest.raises(services_exceptions.NotValidCursorError):
+        await ToDoService.get_todo_changes(db_session, 1, since="not-a-token")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "owner_id, exception",
+    [
+        (None, services_exceptions.NotFoundToDoError),
+        (2, services_exceptions.ForbiddenToDoError),
+    ],
+)
+async def test_delete_todo_not_found_or_forbidden(mocker, owner_id, exception):
+    mock_session = AsyncMock(spec=AsyncSession)
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.delete_user_todo",
+        new=AsyncMock(return_value=False),
+    )
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.get_todo_owner_id",
+        new=AsyncMock(return_value=owner_id),
+    )
+
+    with pytest.raises(exception):
+        await ToDoService.delete_todo(mock_session, 1, user_id=1)
+
+
+@pytest.mark.asyncio
+async def test_delete_todo_success_skips_owner_lookup(mocker):
+    mock_session = AsyncMock(spec=AsyncSession)
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.delete_user_todo",
+        new=AsyncMock(return_value=True),
+    )
+    owner_mock = mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.get_todo_owner_id",
+        new=AsyncMock(),
+    )
+
+    await ToDoService.delete_todo(mock_session, 1, user_id=1)
+
+    TodoRepo.delete_user_todo.assert_called_once_with(
+        session=mock_session, todo_id=1, user_id=1
+    )
+    owner_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_too_large(mocker):
+    mocker.patch("src.services.todo_service.get_todos_max_batch_size", return_value=2)
+    create_mock = mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.create_todos", new=AsyncMock()
+    )
+    mock_session = AsyncMock(spec=AsyncSession)
+
+    with pytest.raises(services_exceptions.BatchTooLargeError):
+        await ToDoService.create_todos(
+            mock_session,
+            1,
+            [ToDoUpdateDTO(title="title", description="description")] * 3,
+        )
+    with pytest.raises(services_exceptions.BatchTooLargeError):
+        await ToDoService.delete_todos(mock_session, 1, [1, 2, 3])
+    create_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_todos_results_in_request_order(mocker):
+    mock_session = AsyncMock(spec=AsyncSession)
+    updated_todo = ToDoDTO(
+        id=3,
+        title="title",
+        description="description",
+        created_at="2026-01-01T00:00:00",
+        updated_at="2026-01-01T00:00:00",
+        user_id=1,
+    )
+    update_mock = mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.update_user_todos",
+        new=AsyncMock(return_value=[updated_todo]),
+    )
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.find_existing_ids",
+        new=AsyncMock(return_value=[2]),
+    )
+    mocker.patch(
+        "src.repositories.tag_repo.TagRepo.find_tags_by_todo_ids",
+        new=AsyncMock(return_value={3: ["work"]}),
+    )
+
+    results = await ToDoService.update_todos(
+        mock_session,
+        1,
+        [
+            ToDoBatchUpdateDTO(id=1, title="a"),
+            ToDoBatchUpdateDTO(id=2, title="b"),
+            ToDoBatchUpdateDTO(id=3, title="c"),
+            ToDoBatchUpdateDTO(id=3, title="title"),
+        ],
+    )
+
+    assert [(result.id, result.status) for result in results] == [
+        (1, "not_found"),
+        (2, "forbidden"),
+        (3, "updated"),
+        (3, "updated"),
+    ]
+    assert results[2].todo == updated_todo
+    assert results[2].todo.tags == ["work"]
+    sent = update_mock.call_args.kwargs["todos"]
+    assert [(todo.id, todo.title) for todo in sent] == [(1, "a"), (2, "b"), (3, "title")]
+
+
+@pytest.mark.asyncio
+async def test_update_todos_skips_items_without_data(mocker):
+    mock_session = AsyncMock(spec=AsyncSession)
+    update_mock = mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.update_user_todos",
+        new=AsyncMock(return_value=[]),
+    )
+    existing_mock = mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.find_existing_ids",
+        new=AsyncMock(side_effect=[[1], []]),
+    )
+
+    results = await ToDoService.update_todos(
+        mock_session, 1, [ToDoBatchUpdateDTO(id=1), ToDoBatchUpdateDTO(id=42)]
+    )
+
+    assert [(result.id, result.status) for result in results] == [
+        (1, "unchanged"),
+        (42, "not_found"),
+    ]
+    assert update_mock.call_args.kwargs["todos"] == []
+    assert existing_mock.call_args_list[0].kwargs == {"user_id": 1}
+
+
+@pytest.mark.asyncio
+async def test_delete_todos_results(mocker):
+    mock_session = AsyncMock(spec=AsyncSession)
+    mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.delete_user_todos",
+        new=AsyncMock(return_value=[1]),
+    )
+    existing_mock = mocker.patch(
+        "src.repositories.todo_repo.TodoRepo.find_existing_ids",
+        new=AsyncMock(return_value=[2]),
+    )
+
+    results = await ToDoService.delete_todos(mock_session, 1, [1, 2, 42, 1])
+
+    assert [(result.id, result.status) for result in results] == [
+        (1, "deleted"),
+        (2, "forbidden"),
+        (42, "not_found"),
+        (1, "deleted"),
+    ]
+    existing_mock.assert_called_once_with(mock_session, [2, 42])
+
+
+@pytest.mark.asyncio
+async def test_export_todos_ndjson(db_session):
+    chunks = [
+        chunk async for chunk in ToDoService.export_todos(db_session, 1, "ndjson")
+    ]
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+
+    assert [row["title"] for row in rows] == ["First title", "Second title"]
+    assert set(rows[0]) == {"id", "title", "description", "created_at", "updated_at"}
+
+
+@pytest.mark.asyncio
+async def test_export_todos_csv(db_session):
+    chunks = [chunk async for chunk in ToDoService.export_todos(db_session, 1, "csv")]
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+
+    assert rows[0] == ["id", "title", "description", "created_at", "updated_at"]
+    assert [row[1] for row in rows[1:]] == ["First title", "Second title"]
+
+
+@pytest.mark.asyncio
+async def test_import_todos_ndjson(db_session, mocker):
+    mocker.patch("src.services.todo_service.IMPORT_CHUNK_SIZE", 2)
+    copy_spy = mocker.spy(TodoRepo, "copy_todos")
+    lines = [
+        '{"title": "One", "description": "1"}\n',
+        "\n",
+        "not json\n",
+        '{"title": "Two"}\n',
+        '{"title": "Three", "description": "3"}\n',
+        '{"title": "Four", "description": "4"}\n',
+        '{"title": "Five", "description": "5"}\n',
+    ]
+
+    result = await ToDoService.import_todos(db_session, 1, lines, "ndjson")
+
+    assert result.imported == 4
+    assert result.failed == 2
+    assert [error.line for error in result.errors] == [3, 4]
+    assert "description" in result.errors[1].error
+    assert [len(call.args[-1]) for call in copy_spy.call_args_list] == [2, 2, 0]
+    assert await TodoRepo.count_todos(db_session, user_id=1) == 6
+
+
+@pytest.mark.asyncio
+async def test_import_todos_reads_lines_off_the_event_loop(db_session):
+    reader_threads = set()
+
+    def lines():
+        for title in ("One", "Two"):
+            reader_threads.add(threading.current_thread())
+            yield json.dumps({"title": title, "description": ""}) + "\n"
+
+    result = await ToDoService.import_todos(db_session, 1, lines(), "ndjson")
+
+    assert result.imported == 2
+    assert threading.current_thread() not in reader_threads
+
+
+@pytest.mark.asyncio
+async def test_import_todos_csv(db_session):
+    data = 'title,description\nOne,"multi\nline"\n,missing title\nTwo,2\n'
+    lines = io.StringIO(data, newline="")
+
+    result = await ToDoService.import_todos(db_session, 1, lines, "csv")
+
+    assert result.imported == 3
+    assert result.failed == 0
+    todos = await TodoRepo.find_all_todos_by_user_id(db_session, 1, order_by="id")
+    assert todos[2].description == "multi\nline"
+    assert todos[3].title == ""
+
+
+@pytest.mark.asyncio
+async def test_search_todos_cursor_pages(db_session):
+    await TodoRepo.create_todos(
+        db_session,
+        1,
+        [ToDoUpdateDTO(title=f"Search {i}", description="") for i in range(3)],
+    )
+
+    first_page = await ToDoService.search_todos(db_session, 1, "search", limit=2)
+    second_page = await ToDoService.search_todos(
+        db_session, 1, "search", limit=2, cursor=first_page.next_cursor
+    )
+
+    ids = [todo.id for todo in first_page.data + second_page.data]
+    assert sorted(ids) == [3, 4, 5]
+    assert second_page.next_cursor is None
+
+    with pytest.raises(services_exceptions.NotValidCursorError):
+        await ToDoService.search_todos(db_session, 1, "search", cursor="broken")
+
+
+@pytest.mark.asyncio
+async def test_todo_tags(db_session):
+    todo = await ToDoService.create_todo(
+        db_session, 1, "Tagged", "description", tags=["Work", "work", "Home"]
+    )
+    assert todo.tags == ["home", "work"]
+
+    page = await ToDoService.get_all_todos_by_user_id(
+        db_session, 1, tags=["WORK"], order_by="id"
+    )
+    assert page.total == 1
+    assert [(item.id, item.tags) for item in page.data] == [(todo.id, ["home", "work"])]
+
+    updated = await ToDoService.update_todo(
+        db_session, todo.id, ToDoUpdateDTO(title="New", description=""), user_id=1
+    )
+    assert updated.tags == ["home", "work"]
+
+    assert await ToDoService.set_todo_tags(db_session, todo.id, 1, ["other"]) == ["other"]
+    with pytest.raises(services_exceptions.ForbiddenToDoError):
+        await ToDoService.set_todo_tags(db_session, todo.id, 2, ["other"])
+    with pytest.raises(services_exceptions.NotFoundToDoError):
+        await ToDoService.set_todo_tags(db_session, 42, 1, ["other"])
+
+
+@pytest.mark.asyncio
+async def test_create_todos_with_tags(db_session):
+    results = await ToDoService.create_todos(
+        db_session,
+        1,
+        [ToDoUpdateDTO(title=f"Batch {i}", description="") for i in range(2)],
+        tags=[[" Work", "home"], []],
+    )
+
+    assert [result.todo.tags for result in results] == [["home", "work"], []]
+    stored = await ToDoService._attach_tags(
+        db_session, [result.todo.model_copy() for result in results]
+    )
+    assert [todo.tags for todo in stored] == [["home", "work"], []]
@@ -0,0 +1,22 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.token_reaper import purge_expired_tokens
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_tokens_in_batches(mocker, db_session):
+    @asynccontextmanager
+    async def session_scope():
+        yield db_session
+
+    mocker.patch("src.services.token_reaper.session_scope", new=session_scope)
+    delete_mock = mocker.patch(
+        "src.repositories.token_repo.TokenRepo.delete_expired_tokens",
+        new=AsyncMock(side_effect=[10, 10, 3]),
+    )
+
+    assert await purge_expired_tokens(batch_size=10) == 23
+    assert delete_mock.await_count == 3
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from src.utils.cache import TTLCache, MemoryCacheBackend
+
+
+def test_cache_get_set():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_cache_entry_expires(mocker):
+    cache = TTLCache(maxsize=2, ttl=10)
+    now = time.monotonic()
+    mocker.patch("src.utils.cache.time.monotonic", return_value=now)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    mocker.patch("src.utils.cache.time.monotonic", return_value=now + 20)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_cache_disabled():
+    cache = TTLCache(maxsize=0, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_delete():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_backend():
+    backend = MemoryCacheBackend(maxsize=2, ttl=60)
+    await backend.set("a", b"1")
+
+    assert await backend.get("a") == b"1"
+    assert await backend.get("b") is None
+    assert backend.stats().hit_ratio == 0.5
+
+    await backend.delete("a")
+    assert await backend.get("a") is None
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.utils.worker_pool import WorkerPool
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_in_thread():
+    pool = WorkerPool(max_workers=1, thread_name_prefix="test-pool")
+
+    thread_name = await pool.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("test-pool")
+    assert pool.stats().completed == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_limits_concurrency():
+    pool = WorkerPool(max_workers=2)
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def blocking(value):
+        started.release()
+        release.wait(timeout=5)
+        return value
+
+    tasks = [asyncio.create_task(pool.run(blocking, i)) for i in range(5)]
+    for _ in range(2):
+        await asyncio.to_thread(started.acquire, timeout=5)
+
+    stats = pool.stats()
+    assert stats.running == 2
+    assert stats.waiting == 3
+    assert stats.max_waiting == 3
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [0, 1, 2, 3, 4]
+
+    stats = pool.stats()
+    assert stats.running == 0
+    assert stats.waiting == 0
+    assert stats.completed == 5
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_keeps_slot_of_cancelled_call():
+    pool = WorkerPool(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking(value):
+        started.set()
+        release.wait(timeout=5)
+        return value
+
+    cancelled = asyncio.create_task(pool.run(blocking, 0))
+    await asyncio.to_thread(started.wait, timeout=5)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    # The thread is still busy, so the next call waits for it
+    task = asyncio.create_task(pool.run(blocking, 1))
+    await asyncio.sleep(0)
+    stats = pool.stats()
+    assert stats.running == 1
+    assert stats.waiting == 1
+
+    release.set()
+    assert await task == 1
+    assert pool.stats().running == 0
+    assert pool.stats().completed == 2
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_propagates_errors():
+    pool = WorkerPool(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await pool.run(fail)
+
+    assert pool.stats().running == 0
+    pool.shutdown()